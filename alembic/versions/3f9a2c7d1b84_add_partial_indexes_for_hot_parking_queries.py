@@ -0,0 +1,77 @@
+"""add_partial_indexes_for_hot_parking_queries
+
+Revision ID: 3f9a2c7d1b84
+Revises: 68e02f84ead7
+Create Date: 2026-10-18 09:12:41.507318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a2c7d1b84'
+down_revision: Union[str, None] = '68e02f84ead7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Aplicar los cambios a la base de datos (migración hacia adelante).
+
+    Los índices se crean con CONCURRENTLY (fuera de la transacción de la
+    migración) para no bloquear las escrituras de las porterías.
+    El índice único falla si ya existe más de un registro activo para el
+    mismo vehículo; en ese caso hay que cerrar los duplicados antes.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ux_parking_records_active_vehicle_id', 'parking_records', ['vehicle_id'],
+            unique=True,
+            postgresql_where=sa.text('exit_time IS NULL'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_parking_records_active_entry_time', 'parking_records', ['entry_time'],
+            postgresql_where=sa.text('exit_time IS NULL'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_parking_records_paid_exit_time', 'parking_records', ['exit_time'],
+            postgresql_where=sa.text("payment_status = 'paid'"),
+            postgresql_include=['total_cost'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_parking_records_paid_entry_time', 'parking_records', ['entry_time'],
+            postgresql_where=sa.text("payment_status = 'paid'"),
+            postgresql_include=['total_cost'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_washing_services_paid_service_date', 'washing_services', ['service_date'],
+            postgresql_where=sa.text("payment_status = 'paid'"),
+            postgresql_include=['price'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_washing_services_active', 'washing_services', ['service_date'],
+            postgresql_where=sa.text('end_time IS NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """
+    Revertir los cambios (rollback).
+    """
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_washing_services_active', table_name='washing_services', postgresql_concurrently=True)
+        op.drop_index('ix_washing_services_paid_service_date', table_name='washing_services', postgresql_concurrently=True)
+        op.drop_index('ix_parking_records_paid_entry_time', table_name='parking_records', postgresql_concurrently=True)
+        op.drop_index('ix_parking_records_paid_exit_time', table_name='parking_records', postgresql_concurrently=True)
+        op.drop_index('ix_parking_records_active_entry_time', table_name='parking_records', postgresql_concurrently=True)
+        op.drop_index('ux_parking_records_active_vehicle_id', table_name='parking_records', postgresql_concurrently=True)
@@ -0,0 +1,45 @@
+"""add_daily_financial_rollups
+
+Revision ID: b71e4d09c5a2
+Revises: 3f9a2c7d1b84
+Create Date: 2026-10-18 14:03:27.118452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71e4d09c5a2'
+down_revision: Union[str, None] = '3f9a2c7d1b84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Aplicar los cambios a la base de datos (migración hacia adelante).
+
+    Los rollups diarios los genera el sistema, sin administrador: generated_by
+    pasa a admitir NULL y los identifica. El índice único parcial permite el upsert
+    (ON CONFLICT) de un rollup por tipo y fecha.
+    """
+    op.alter_column('financial_reports', 'generated_by', existing_type=sa.Integer(), nullable=True)
+    op.create_index(
+        'ux_financial_reports_rollup', 'financial_reports', ['report_type', 'report_date'],
+        unique=True,
+        postgresql_where=sa.text('generated_by IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Revertir los cambios (rollback).
+
+    Borra los rollups del sistema antes de volver a exigir generated_by.
+    """
+    op.drop_index('ux_financial_reports_rollup', table_name='financial_reports')
+    op.execute("DELETE FROM financial_reports WHERE generated_by IS NULL")
+    op.alter_column('financial_reports', 'generated_by', existing_type=sa.Integer(), nullable=False)
@@ -0,0 +1,46 @@
+"""add_updated_at_indexes_for_incremental_exports
+
+Revision ID: c5d81a3e6f27
+Revises: b71e4d09c5a2
+Create Date: 2026-10-18 16:41:09.530214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d81a3e6f27'
+down_revision: Union[str, None] = 'b71e4d09c5a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tablas que se exportan de forma incremental ("desde la marca de agua")
+TABLES = ('parking_records', 'washing_services', 'expenses', 'bonuses', 'monthly_subscriptions')
+
+
+def upgrade() -> None:
+    """
+    Aplicar los cambios a la base de datos (migración hacia adelante).
+
+    Índices (updated_at, id) para las exportaciones incrementales: filtran por
+    updated_at y recorren en ese mismo orden. Se crean con CONCURRENTLY para no
+    bloquear las escrituras.
+    """
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                f'ix_{table}_updated_at', table, ['updated_at', 'id'],
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """
+    Revertir los cambios (rollback).
+    """
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.drop_index(f'ix_{table}_updated_at', table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,42 @@
+"""add_cache_versions
+
+Revision ID: d2e6b8f14a93
+Revises: c5d81a3e6f27
+Create Date: 2026-10-18 18:22:51.604137
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2e6b8f14a93'
+down_revision: Union[str, None] = 'c5d81a3e6f27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Aplicar los cambios a la base de datos (migración hacia adelante).
+
+    Una fila por catálogo cacheado en memoria. Los workers consultan la versión
+    de "pricing" (tarifas y convenios) para saber cuándo recargar su copia.
+    """
+    op.create_table(
+        'cache_versions',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('name', name=op.f('pk_cache_versions')),
+    )
+    op.execute("INSERT INTO cache_versions (name, version) VALUES ('pricing', 0)")
+
+
+def downgrade() -> None:
+    """
+    Revertir los cambios (rollback).
+    """
+    op.drop_table('cache_versions')
@@ -0,0 +1,60 @@
+"""add_entry_time_id_keyset_indexes
+
+Revision ID: e4a7c2f9b318
+Revises: d2e6b8f14a93
+Create Date: 2026-10-18 21:05:37.184562
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c2f9b318'
+down_revision: Union[str, None] = 'd2e6b8f14a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Aplicar los cambios a la base de datos (migración hacia adelante).
+
+    Los listados /parking/records y /parking/active paginan con cursor sobre
+    (entry_time, id). Los índices de entry_time pasan a ser (entry_time, id)
+    para que cada página sea un recorrido del índice desde el cursor; siguen
+    sirviendo los rangos por entry_time. Se crean los nuevos antes de borrar
+    los anteriores, con CONCURRENTLY para no bloquear las escrituras.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_parking_records_entry_time_id', 'parking_records', ['entry_time', 'id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_parking_records_active_entry_time_id', 'parking_records', ['entry_time', 'id'],
+            postgresql_where=sa.text('exit_time IS NULL'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_parking_records_active_entry_time', table_name='parking_records', postgresql_concurrently=True)
+        op.drop_index('ix_parking_records_entry_time', table_name='parking_records', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """
+    Revertir los cambios (rollback).
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_parking_records_entry_time', 'parking_records', ['entry_time'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_parking_records_active_entry_time', 'parking_records', ['entry_time'],
+            postgresql_where=sa.text('exit_time IS NULL'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_parking_records_active_entry_time_id', table_name='parking_records', postgresql_concurrently=True)
+        op.drop_index('ix_parking_records_entry_time_id', table_name='parking_records', postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""add_rollup_dirty_days
+
+Revision ID: f1b6d3e8a527
+Revises: e4a7c2f9b318
+Create Date: 2026-10-19 10:14:22.903716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b6d3e8a527'
+down_revision: Union[str, None] = 'e4a7c2f9b318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Aplicar los cambios a la base de datos (migración hacia adelante).
+
+    Días cerrados cuyo rollup diario hay que recalcular: los marcan las
+    escrituras con fecha pasada y los consume el refresh de rollups.
+    """
+    op.create_table(
+        'rollup_dirty_days',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('marked_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('day', name=op.f('pk_rollup_dirty_days')),
+    )
+
+
+def downgrade() -> None:
+    """
+    Revertir los cambios (rollback).
+    """
+    op.drop_table('rollup_dirty_days')
@@ -6,11 +6,16 @@ from app.core.config import settings
 from app.core.security import ALGORITHM
 from app.infrastructure.repositories.users.global_admin_repository_impl import GlobalAdminRepositoryImpl
 from app.infrastructure.repositories.users.operational_admin_repository_impl import OperationalAdminRepositoryImpl
+from app.infrastructure.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.infrastructure.cache.principal_cache import get_principal
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login/global-admin")
 oauth2_scheme_operational = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login/operational-admin")
 
-async def get_current_user(token: str = Depends(oauth2_scheme)):
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    uow: UnitOfWork = Depends(get_unit_of_work)
+):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -28,10 +33,10 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
     
     # For now, we only have Global Admin repository. 
     # In the future, we might need to check other tables or a unified user table.
-    repo = GlobalAdminRepositoryImpl()
+    repo = GlobalAdminRepositoryImpl(uow.session)
     try:
         user_id_int = int(user_id)
-        user = await repo.get_by_id(user_id_int)
+        user = await get_principal("global_admin", user_id_int, lambda: repo.get_by_id(user_id_int))
     except ValueError:
         print(f"Invalid user ID format: {user_id}")
         raise credentials_exception
@@ -42,7 +47,10 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
     return user
 
 
-async def get_current_operational_admin(token: str = Depends(oauth2_scheme_operational)):
+async def get_current_operational_admin(
+    token: str = Depends(oauth2_scheme_operational),
+    uow: UnitOfWork = Depends(get_unit_of_work)
+):
     """Get the current authenticated operational admin"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -65,10 +73,10 @@ async def get_current_operational_admin(token: str = Depends(oauth2_scheme_opera
         print(f"JWT Decode Error: {e}")
         raise credentials_exception
     
-    repo = OperationalAdminRepositoryImpl()
+    repo = OperationalAdminRepositoryImpl(uow.session)
     try:
         user_id_int = int(user_id)
-        user = await repo.get_by_id(user_id_int)
+        user = await get_principal("operational_admin", user_id_int, lambda: repo.get_by_id(user_id_int))
     except ValueError:
         print(f"Invalid user ID format: {user_id}")
         raise credentials_exception
@@ -85,7 +93,10 @@ async def get_current_operational_admin(token: str = Depends(oauth2_scheme_opera
     
     return user
 
-async def get_current_admin(token: str = Depends(oauth2_scheme)):
+async def get_current_admin(
+    token: str = Depends(oauth2_scheme),
+    uow: UnitOfWork = Depends(get_unit_of_work)
+):
     """Get the current authenticated admin (global or operational)"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -107,12 +118,13 @@ async def get_current_admin(token: str = Depends(oauth2_scheme)):
         raise credentials_exception
 
     if user_role == "global_admin":
-        repo = GlobalAdminRepositoryImpl()
+        repo = GlobalAdminRepositoryImpl(uow.session)
     else:
-        repo = OperationalAdminRepositoryImpl()
+        repo = OperationalAdminRepositoryImpl(uow.session)
         
     try:
-        user = await repo.get_by_id(int(user_id))
+        user_id_int = int(user_id)
+        user = await get_principal(user_role, user_id_int, lambda: repo.get_by_id(user_id_int))
     except ValueError:
         raise credentials_exception
         
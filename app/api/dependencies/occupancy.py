@@ -0,0 +1,10 @@
+from typing import Optional
+from app.core.config import settings
+from app.domain.parking.services.occupancy_index import OccupancyIndex, occupancy_index
+
+
+def get_occupancy_index() -> Optional[OccupancyIndex]:
+    """The process-wide occupancy index, or None when it is disabled."""
+    if not settings.OCCUPANCY_INDEX_ENABLED:
+        return None
+    return occupancy_index
@@ -0,0 +1,10 @@
+from typing import Optional
+from app.core.config import settings
+from app.domain.parking.services.pricing_catalog import PricingCatalog, pricing_catalog
+
+
+def get_pricing_catalog() -> Optional[PricingCatalog]:
+    """The process-wide pricing catalogue, or None when it is disabled."""
+    if not settings.PRICING_CATALOG_ENABLED:
+        return None
+    return pricing_catalog
@@ -0,0 +1,12 @@
+from typing import Optional
+from app.core.config import settings
+from app.domain.reporting.services.financial_rollup_service import FinancialRollupService
+from app.infrastructure.repositories.reporting.financial_rollup_repository_impl import FinancialRollupRepositoryImpl
+
+
+def get_financial_rollup_service() -> Optional[FinancialRollupService]:
+    """Daily rollup reader, or None when rollups are disabled (reports query raw tables)."""
+    if not settings.ROLLUP_ENABLED:
+        return None
+    # No injected session: the per-table queries for uncovered days run concurrently
+    return FinancialRollupService(FinancialRollupRepositoryImpl(), settings.ROLLUP_LOOKBACK_DAYS)
@@ -0,0 +1,27 @@
+from datetime import date
+from typing import Optional
+from fastapi import Depends, HTTPException, status
+from app.api.dependencies.auth import get_current_admin
+from app.infrastructure.cache.active_shift_cache import get_active_shift_id
+from app.infrastructure.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.infrastructure.repositories.financial.shift_repository_impl import ShiftRepositoryImpl
+
+
+async def get_current_shift_id(
+    current_admin: any = Depends(get_current_admin),
+    uow: UnitOfWork = Depends(get_unit_of_work)
+) -> int:
+    """Id of the current admin's open shift for today; 400 if there is none."""
+    async def load() -> Optional[int]:
+        shift = await ShiftRepositoryImpl(uow.session).get_active_shift_by_admin(current_admin.id)
+        if shift is None or shift.shift_date != date.today():
+            return None
+        return shift.id
+
+    shift_id = await get_active_shift_id(current_admin.id, load)
+    if shift_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No active shift found for current admin. Please start a shift first."
+        )
+    return shift_id
@@ -0,0 +1,36 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.infrastructure.database.pool_metrics import pool_metrics
+
+CHECKOUTS_HEADER = b"x-db-checkouts"
+
+
+class DBCheckoutCounterMiddleware:
+    """
+    Counts the pooled connections each request checks out and reports it in
+    the X-DB-Checkouts response header and in the process-wide pool metrics.
+
+    Checkouts made while streaming a response body happen after the headers
+    are sent, so they are only reflected in the aggregated metrics.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counter = pool_metrics.start_request(scope.get("path"))
+
+        async def send_with_checkouts(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((CHECKOUTS_HEADER, str(counter.checkouts).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_checkouts)
+        finally:
+            pool_metrics.finish_request(counter)
@@ -7,6 +7,7 @@ from app.application.agreements.add_vehicle_to_agreement_use_case import AddVehi
 from app.infrastructure.repositories.agreements.agreement_repository_impl import AgreementRepositoryImpl
 from app.infrastructure.repositories.parking.vehicle_repository_impl import VehicleRepositoryImpl
 from app.api.dependencies.auth import get_current_admin
+from app.application.pricing.sync_pricing_catalog_use_case import pricing_catalog_sync
 
 router = APIRouter(prefix="/agreements", tags=["Agreements"])
 
@@ -185,6 +186,7 @@ async def remove_vehicle_from_agreement(
             )
         
         await agreement_repo.remove_vehicle_from_agreement(agreement_id, vehicle.id)
+        await pricing_catalog_sync.publish()
         
         return {"message": f"Vehicle {plate} removed from agreement"}
     except HTTPException:
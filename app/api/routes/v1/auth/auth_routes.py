@@ -5,12 +5,13 @@ from app.application.dto.auth.password_reset_request import PasswordResetRequest
 from app.application.dto.auth.password_reset_confirm import PasswordResetConfirm
 from app.domain.users.use_cases.login_global_admin import LoginGlobalAdmin
 from app.domain.users.use_cases.login_operational_admin import LoginOperationalAdmin
+from app.domain.users.use_cases.login_unified import LoginUnified
 from app.domain.users.use_cases.request_password_reset import RequestPasswordReset
 from app.domain.users.use_cases.reset_password import ResetPassword
 from app.infrastructure.repositories.users.global_admin_repository_impl import GlobalAdminRepositoryImpl
 from app.infrastructure.repositories.users.operational_admin_repository_impl import OperationalAdminRepositoryImpl
-from app.infrastructure.repositories.washers.washer_repository_impl import WasherRepositoryImpl
-from app.core.security import verify_password, create_access_token
+from app.infrastructure.repositories.users.identity_repository_impl import IdentityRepositoryImpl
+from app.infrastructure.cache.login_attempt_limiter import TooManyLoginAttempts
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -20,49 +21,33 @@ def get_global_admin_repo():
 def get_operational_admin_repo():
     return OperationalAdminRepositoryImpl()
 
-def get_washer_repo():
-    return WasherRepositoryImpl()
+def get_identity_repo():
+    return IdentityRepositoryImpl()
+
+def _too_many_attempts(e: TooManyLoginAttempts) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many failed login attempts. Try again later.",
+        headers={"Retry-After": str(e.retry_after)},
+    )
 
 @router.post("/login", response_model=TokenResponse)
 async def login_unified(
     data: LoginRequest, 
-    global_repo: GlobalAdminRepositoryImpl = Depends(get_global_admin_repo),
-    operational_repo: OperationalAdminRepositoryImpl = Depends(get_operational_admin_repo),
-    washer_repo: WasherRepositoryImpl = Depends(get_washer_repo)
+    identity_repo: IdentityRepositoryImpl = Depends(get_identity_repo)
 ):
     """
-    Unified login endpoint that tries to authenticate with any role:
-    1. Global Admin
-    2. Operational Admin
-    3. Washer
+    Unified login endpoint for any role (global admin, operational admin or washer).
+    The account and its role are resolved with a single query.
     """
-    
-    # Try Global Admin
-    uc = LoginGlobalAdmin(global_repo)
-    token = await uc.execute(data.email, data.password)
+    uc = LoginUnified(identity_repo)
+    try:
+        token = await uc.execute(data.email, data.password)
+    except TooManyLoginAttempts as e:
+        raise _too_many_attempts(e)
     if token:
         return token
     
-    # Try Operational Admin
-    uc = LoginOperationalAdmin(operational_repo)
-    token = await uc.execute(data.email, data.password)
-    if token:
-        return token
-    
-    # Try Washer
-    washer = await washer_repo.get_by_email(data.email)
-    if washer:
-        if verify_password(data.password, washer.password_hash):
-            if washer.is_active and washer.id:
-                access_token = create_access_token(subject=washer.id, additional_claims={"role": "washer"})
-                return TokenResponse(
-                    access_token=access_token,
-                    token_type="bearer",
-                    user_id=washer.id,
-                    email=washer.email,
-                    role="washer"
-                )
-    
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Incorrect email or password",
@@ -75,7 +60,10 @@ async def login_global_admin(
     repo: GlobalAdminRepositoryImpl = Depends(get_global_admin_repo)
 ):
     uc = LoginGlobalAdmin(repo)
-    token = await uc.execute(data.email, data.password)
+    try:
+        token = await uc.execute(data.email, data.password)
+    except TooManyLoginAttempts as e:
+        raise _too_many_attempts(e)
     
     if not token:
         raise HTTPException(
@@ -91,7 +79,10 @@ async def login_operational_admin(
     repo: OperationalAdminRepositoryImpl = Depends(get_operational_admin_repo)
 ):
     uc = LoginOperationalAdmin(repo)
-    token = await uc.execute(data.email, data.password)
+    try:
+        token = await uc.execute(data.email, data.password)
+    except TooManyLoginAttempts as e:
+        raise _too_many_attempts(e)
     
     if not token:
         raise HTTPException(
@@ -1,15 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Optional
 from datetime import datetime
 
 from app.application.dto.parking.entry_request import EntryRequest
+from app.application.dto.parking.entry_batch_request import EntryBatchRequest
 from app.application.dto.parking.exit_request import ExitRequest
+from app.application.dto.parking.exit_batch_request import ExitBatchRequest
 from app.application.parking.vehicle_entry_use_case import VehicleEntryUseCase
+from app.application.parking.vehicle_entry_batch_use_case import VehicleEntryBatchUseCase
 from app.application.parking.vehicle_exit_use_case import VehicleExitUseCase
+from app.application.parking.vehicle_exit_batch_use_case import VehicleExitBatchUseCase
+from app.application.parking.parking_quote_use_case import ParkingQuote, ParkingQuoteUseCase
+from app.application.parking.list_parking_records_use_case import (
+    ACTIVE_FIELDS,
+    RECORD_FIELDS,
+    ListParkingRecordsUseCase,
+    parse_fields,
+)
 from app.infrastructure.repositories.parking.vehicle_repository_impl import VehicleRepositoryImpl
 from app.infrastructure.repositories.parking.parking_record_repository_impl import ParkingRecordRepositoryImpl
 from app.infrastructure.repositories.parking.rate_repository_impl import RateRepositoryImpl
 from app.api.dependencies.auth import get_current_admin
+from app.api.dependencies.occupancy import get_occupancy_index
+from app.api.dependencies.shift import get_current_shift_id
+from app.api.dependencies.pricing import get_pricing_catalog
+from app.domain.parking.services.pricing_catalog import PricingCatalog
+from app.domain.parking.repositories.rate_repository import IRateRepository
+from app.domain.agreements.repositories.agreement_repository import IAgreementRepository
+from app.infrastructure.repositories.parking.catalog_rate_repository import CatalogRateRepository
+from app.infrastructure.repositories.agreements.catalog_agreement_repository import CatalogAgreementRepository
+from app.domain.parking.services.occupancy_index import OccupancyIndex
+from app.infrastructure.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.domain.reporting.services.daily_stats_service import DailyStatsService, invalidate_daily_stats
 
 router = APIRouter(prefix="/parking", tags=["Parking"])
 
@@ -19,36 +41,122 @@ from app.infrastructure.repositories.agreements.agreement_repository_impl import
 from app.infrastructure.repositories.washing.washing_service_repository_impl import WashingServiceRepositoryImpl
 
 # Dependency to get repositories and use cases
-def get_vehicle_entry_use_case() -> VehicleEntryUseCase:
-    vehicle_repo = VehicleRepositoryImpl()
-    parking_record_repo = ParkingRecordRepositoryImpl()
-    rate_repo = RateRepositoryImpl()
-    subscription_repo = SubscriptionRepositoryImpl()
-    return VehicleEntryUseCase(vehicle_repo, parking_record_repo, rate_repo, subscription_repo)
-
-
-def get_vehicle_exit_use_case() -> VehicleExitUseCase:
-    vehicle_repo = VehicleRepositoryImpl()
-    parking_record_repo = ParkingRecordRepositoryImpl()
-    rate_repo = RateRepositoryImpl()
-    subscription_repo = SubscriptionRepositoryImpl()
-    agreement_repo = AgreementRepositoryImpl()
-    washing_repo = WashingServiceRepositoryImpl()
+# Every repository shares the request's unit of work: one connection, one commit.
+# Rates and agreements are read through the pricing catalogue when it is enabled.
+def get_rate_repository(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    pricing_catalog: Optional[PricingCatalog] = Depends(get_pricing_catalog)
+) -> IRateRepository:
+    rate_repo = RateRepositoryImpl(uow.session)
+    if pricing_catalog is None:
+        return rate_repo
+    return CatalogRateRepository(rate_repo, pricing_catalog)
+
+
+def get_agreement_repository(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    pricing_catalog: Optional[PricingCatalog] = Depends(get_pricing_catalog)
+) -> IAgreementRepository:
+    agreement_repo = AgreementRepositoryImpl(uow.session)
+    if pricing_catalog is None:
+        return agreement_repo
+    return CatalogAgreementRepository(agreement_repo, pricing_catalog)
+
+
+def get_vehicle_entry_use_case(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    rate_repo: IRateRepository = Depends(get_rate_repository),
+    occupancy_index: Optional[OccupancyIndex] = Depends(get_occupancy_index)
+) -> VehicleEntryUseCase:
+    vehicle_repo = VehicleRepositoryImpl(uow.session)
+    parking_record_repo = ParkingRecordRepositoryImpl(uow.session)
+    subscription_repo = SubscriptionRepositoryImpl(uow.session)
+    return VehicleEntryUseCase(
+        vehicle_repo, parking_record_repo, rate_repo, subscription_repo, occupancy_index, uow.after_commit
+    )
+
+
+def get_vehicle_entry_batch_use_case(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    rate_repo: IRateRepository = Depends(get_rate_repository),
+    occupancy_index: Optional[OccupancyIndex] = Depends(get_occupancy_index)
+) -> VehicleEntryBatchUseCase:
+    vehicle_repo = VehicleRepositoryImpl(uow.session)
+    parking_record_repo = ParkingRecordRepositoryImpl(uow.session)
+    subscription_repo = SubscriptionRepositoryImpl(uow.session)
+    return VehicleEntryBatchUseCase(
+        vehicle_repo, parking_record_repo, rate_repo, subscription_repo, occupancy_index, uow.after_commit
+    )
+
+
+def get_vehicle_exit_use_case(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    rate_repo: IRateRepository = Depends(get_rate_repository),
+    agreement_repo: IAgreementRepository = Depends(get_agreement_repository),
+    occupancy_index: Optional[OccupancyIndex] = Depends(get_occupancy_index)
+) -> VehicleExitUseCase:
+    vehicle_repo = VehicleRepositoryImpl(uow.session)
+    parking_record_repo = ParkingRecordRepositoryImpl(uow.session)
+    subscription_repo = SubscriptionRepositoryImpl(uow.session)
+    washing_repo = WashingServiceRepositoryImpl(uow.session)
     return VehicleExitUseCase(
         vehicle_repo,
         parking_record_repo,
         rate_repo,
         subscription_repo,
         agreement_repo,
-        washing_repo
+        washing_repo,
+        occupancy_index,
+        uow.after_commit
+    )
+
+
+def get_vehicle_exit_batch_use_case(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    rate_repo: IRateRepository = Depends(get_rate_repository),
+    agreement_repo: IAgreementRepository = Depends(get_agreement_repository),
+    occupancy_index: Optional[OccupancyIndex] = Depends(get_occupancy_index)
+) -> VehicleExitBatchUseCase:
+    parking_record_repo = ParkingRecordRepositoryImpl(uow.session)
+    washing_repo = WashingServiceRepositoryImpl(uow.session)
+    return VehicleExitBatchUseCase(
+        parking_record_repo, rate_repo, agreement_repo, washing_repo, occupancy_index, uow.after_commit
     )
 
 
+def get_parking_quote_use_case(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    rate_repo: IRateRepository = Depends(get_rate_repository),
+    agreement_repo: IAgreementRepository = Depends(get_agreement_repository),
+    occupancy_index: Optional[OccupancyIndex] = Depends(get_occupancy_index),
+    pricing_catalog: Optional[PricingCatalog] = Depends(get_pricing_catalog)
+) -> ParkingQuoteUseCase:
+    parking_record_repo = ParkingRecordRepositoryImpl(uow.session)
+    washing_repo = WashingServiceRepositoryImpl(uow.session)
+    return ParkingQuoteUseCase(
+        parking_record_repo,
+        rate_repo,
+        agreement_repo,
+        washing_repo,
+        occupancy_index,
+        pricing_catalog
+    )
+
+
+def get_list_parking_records_use_case(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    occupancy_index: Optional[OccupancyIndex] = Depends(get_occupancy_index)
+) -> ListParkingRecordsUseCase:
+    return ListParkingRecordsUseCase(ParkingRecordRepositoryImpl(uow.session), occupancy_index)
+
+
 @router.post("/entry", status_code=status.HTTP_201_CREATED)
 async def register_entry(
     request: EntryRequest,
     current_admin: any = Depends(get_current_admin),
-    use_case: VehicleEntryUseCase = Depends(get_vehicle_entry_use_case)
+    shift_id: int = Depends(get_current_shift_id),
+    use_case: VehicleEntryUseCase = Depends(get_vehicle_entry_use_case),
+    uow: UnitOfWork = Depends(get_unit_of_work)
 ):
     """
     Register a vehicle entry to the parking lot.
@@ -64,29 +172,6 @@ async def register_entry(
     - **helmet_count**: Number of helmets for motorcycles (default: 0)
     """
     try:
-        # Get the current active shift for this admin
-        from app.infrastructure.database.session import SessionLocal
-        from app.infrastructure.database.models.financial import Shift
-        from sqlalchemy import select
-        from datetime import date
-        
-        async with SessionLocal() as session:
-            result = await session.execute(
-                select(Shift)
-                .where(Shift.admin_id == current_admin.id)
-                .where(Shift.shift_date == date.today())
-                .where(Shift.end_time.is_(None))
-            )
-            active_shift = result.scalar_one_or_none()
-            
-            if not active_shift:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="No active shift found for current admin. Please start a shift first."
-                )
-            
-            shift_id = active_shift.id
-        
         parking_record = await use_case.execute(
             plate=request.plate,
             vehicle_type=request.vehicle_type,
@@ -100,6 +185,7 @@ async def register_entry(
             notes=request.notes,
             helmet_count=request.helmet_count
         )
+        uow.after_commit(invalidate_daily_stats)
         
         return {
             "message": "Vehicle entry registered successfully",
@@ -124,11 +210,73 @@ async def register_entry(
         )
 
 
+@router.post("/entry/batch", status_code=status.HTTP_200_OK)
+async def register_entry_batch(
+    request: EntryBatchRequest,
+    current_admin: any = Depends(get_current_admin),
+    shift_id: int = Depends(get_current_shift_id),
+    use_case: VehicleEntryBatchUseCase = Depends(get_vehicle_entry_batch_use_case),
+    uow: UnitOfWork = Depends(get_unit_of_work)
+):
+    """
+    Register a burst of vehicle entries (opening time, events) in one request.
+
+    - **entries**: List of entries, each with the same fields as POST /entry (1-500)
+
+    Vehicles, subscriptions and rates are resolved with one query each and all
+    parking records are inserted with a single multi-row INSERT, in one
+    transaction. Each entry gets its own result: an invalid entry (no rate,
+    already parked, repeated plate) is reported without rejecting the rest.
+    """
+    try:
+        results = await use_case.execute(request.entries, shift_id=shift_id, admin_id=current_admin.id)
+        created = sum(1 for r in results if r.created)
+        if created:
+            uow.after_commit(invalidate_daily_stats)
+
+        return {
+            "total": len(results),
+            "created": created,
+            "failed": len(results) - created,
+            "results": [
+                {
+                    "index": r.index,
+                    "plate": r.plate,
+                    "status": "created",
+                    "parking_record_id": r.record.id,
+                    "vehicle_id": r.record.vehicle_id,
+                    "entry_time": r.record.entry_time.isoformat(),
+                    "helmet_count": r.record.helmet_count,
+                    "helmet_charge": r.record.helmet_charge,
+                } if r.created else {
+                    "index": r.index,
+                    "plate": r.plate,
+                    "status": "error",
+                    "detail": r.error,
+                }
+                for r in results
+            ]
+        }
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error registering vehicle entries: {str(e)}"
+        )
+
+
 @router.post("/exit", status_code=status.HTTP_200_OK)
 async def register_exit(
     request: ExitRequest,
     current_admin: any = Depends(get_current_admin),
-    use_case: VehicleExitUseCase = Depends(get_vehicle_exit_use_case)
+    use_case: VehicleExitUseCase = Depends(get_vehicle_exit_use_case),
+    uow: UnitOfWork = Depends(get_unit_of_work)
 ):
     """
     Register a vehicle exit from the parking lot and calculate the total cost.
@@ -141,6 +289,7 @@ async def register_exit(
             plate=request.plate,
             notes=request.notes
         )
+        uow.after_commit(invalidate_daily_stats)
         
         # Calculate duration
         duration = parking_record.exit_time - parking_record.entry_time
@@ -169,80 +318,103 @@ async def register_exit(
         )
 
 
+@router.post("/exit/batch", status_code=status.HTTP_200_OK)
+async def register_exit_batch(
+    request: ExitBatchRequest,
+    current_admin: any = Depends(get_current_admin),
+    use_case: VehicleExitBatchUseCase = Depends(get_vehicle_exit_batch_use_case),
+    uow: UnitOfWork = Depends(get_unit_of_work)
+):
+    """
+    Register a mass exit (end of an event, fleet return) in one request.
+
+    - **exits**: List of exits, each with the same fields as POST /exit (1-500)
+
+    Active records, washing services, agreements and rates are loaded with one
+    query each, costs are computed in memory and every record is closed with a
+    single UPDATE ... FROM (VALUES ...), in one transaction. Each exit gets its
+    own receipt or error; an invalid exit does not reject the rest.
+    """
+    try:
+        results = await use_case.execute(request.exits)
+        closed = sum(1 for r in results if r.closed)
+        if closed:
+            uow.after_commit(invalidate_daily_stats)
+
+        receipts = []
+        for r in results:
+            if not r.closed:
+                receipts.append({"index": r.index, "plate": r.plate, "status": "error", "detail": r.error})
+                continue
+            record = r.record
+            hours = (record.exit_time - record.entry_time).total_seconds() / 3600
+            receipts.append({
+                "index": r.index,
+                "plate": r.plate,
+                "status": "closed",
+                "parking_record_id": record.id,
+                "entry_time": record.entry_time.isoformat(),
+                "exit_time": record.exit_time.isoformat(),
+                "duration_hours": round(hours, 2),
+                "helmet_charge": record.helmet_charge,
+                "total_cost": record.total_cost,
+                "payment_status": record.payment_status
+            })
+
+        return {
+            "total": len(results),
+            "closed": closed,
+            "failed": len(results) - closed,
+            "total_charged": sum(r.record.total_cost for r in results if r.closed),
+            "results": receipts
+        }
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error registering vehicle exits: {str(e)}"
+        )
+
+
 @router.get("/records", status_code=status.HTTP_200_OK)
 async def list_parking_records(
     status_filter: str = 'all',  # 'all', 'active', 'completed'
-    limit: int = 50,
-    current_admin: any = Depends(get_current_admin)
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_admin: any = Depends(get_current_admin),
+    use_case: ListParkingRecordsUseCase = Depends(get_list_parking_records_use_case)
 ):
     """
-    List parking records with optional filtering by status.
+    List parking records with optional filtering by status, newest first.
+
+    - **limit**: page size (max 500)
+    - **cursor**: `next_cursor` of the previous page; omit it for the first page
+    - **fields**: comma-separated columns to return (e.g. `id,plate,entry_time,duration_seconds`);
+      only those are selected. `duration_seconds` is computed by the database.
     """
     try:
-        from app.infrastructure.database.session import SessionLocal
-        from app.infrastructure.database.models.vehicles import ParkingRecord as ParkingRecordModel, Vehicle as VehicleModel
-        from sqlalchemy import select
-        from sqlalchemy.orm import joinedload
-        from datetime import timezone
-        
-        async with SessionLocal() as session:
-            query = select(ParkingRecordModel).options(joinedload(ParkingRecordModel.vehicle))
-            
-            if status_filter == 'active':
-                query = query.where(ParkingRecordModel.exit_time.is_(None))
-            elif status_filter == 'completed':
-                query = query.where(ParkingRecordModel.exit_time.isnot(None))
-            
-            query = query.order_by(ParkingRecordModel.entry_time.desc()).limit(limit)
-            
-            result = await session.execute(query)
-            records = result.scalars().all()
-            
-            records_data = []
-            for record in records:
-                # Calculate duration
-                duration_str = None
-                duration_hours = None
-                
-                if record.exit_time:
-                    duration = record.exit_time - record.entry_time
-                    duration_hours = round(duration.total_seconds() / 3600, 2)
-                    hours = int(duration.total_seconds() // 3600)
-                    minutes = int((duration.total_seconds() % 3600) // 60)
-                    duration_str = f"{hours}h {minutes}m"
-                else:
-                    now = datetime.now(timezone.utc)
-                    duration = now - record.entry_time
-                    hours = int(duration.total_seconds() // 3600)
-                    minutes = int((duration.total_seconds() % 3600) // 60)
-                    duration_str = f"{hours}h {minutes}m"
-                
-                records_data.append({
-                    "id": record.id,
-                    "vehicle_id": record.vehicle_id,
-                    "plate": record.vehicle.plate,
-                    "vehicle_type": record.vehicle.vehicle_type,
-                    "owner_name": record.vehicle.owner_name,
-                    "owner_phone": record.vehicle.owner_phone,
-                    "brand": record.vehicle.brand,
-                    "model": record.vehicle.model,
-                    "color": record.vehicle.color,
-                    "entry_time": record.entry_time.isoformat(),
-                    "exit_time": record.exit_time.isoformat() if record.exit_time else None,
-                    "helmet_count": record.helmet_count,
-                    "helmet_charge": record.helmet_charge,
-                    "total_cost": record.total_cost,
-                    "payment_status": record.payment_status,
-                    "notes": record.notes,
-                    "duration_so_far": duration_str,
-                    "duration_hours": duration_hours
-                })
-            
-            return {
-                "message": "Parking records retrieved successfully",
-                "count": len(records_data),
-                "records": records_data
-            }
+        page = await use_case.execute(
+            fields=parse_fields(fields, RECORD_FIELDS),
+            status=status_filter,
+            limit=limit,
+            cursor=cursor
+        )
+        return {
+            "message": "Parking records retrieved successfully",
+            "count": len(page.records),
+            "records": page.records,
+            "next_cursor": page.next_cursor
+        }
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -250,60 +422,99 @@ async def list_parking_records(
         )
 
 
+def _quote_data(quote: ParkingQuote) -> dict:
+    if quote.tariff is None:
+        return {"error": quote.error}
+    return {
+        "quoted_at": quote.quoted_at.isoformat(),
+        "free_minutes": quote.tariff.free_minutes,
+        "billable_hours": quote.tariff.hours,
+        "parking_cost": quote.tariff.parking_cost,
+        "helmet_charge": quote.tariff.helmet_charge,
+        "total_cost": quote.tariff.total_cost,
+        "valid_until": quote.valid_until.isoformat()
+    }
+
+
+@router.get("/quote/{plate}", status_code=status.HTTP_200_OK)
+async def quote_exit(
+    plate: str,
+    current_admin: any = Depends(get_current_admin),
+    use_case: ParkingQuoteUseCase = Depends(get_parking_quote_use_case)
+):
+    """
+    Quote what the exit of a parked vehicle would cost right now, using the same
+    rules as POST /exit. Nothing is written: the record stays active.
+
+    **valid_until** is when the next hour starts and the quote goes up.
+    """
+    try:
+        quote = await use_case.execute(plate)
+        return {
+            "message": "Parking quote calculated successfully",
+            "plate": quote.plate,
+            "parking_record_id": quote.record.id,
+            "vehicle_type": quote.vehicle.vehicle_type,
+            "entry_time": quote.record.entry_time.isoformat(),
+            "subscription_id": quote.record.subscription_id,
+            "quote": _quote_data(quote)
+        }
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error calculating parking quote: {str(e)}"
+        )
+
+
 @router.get("/active", status_code=status.HTTP_200_OK)
 async def list_active_vehicles(
-    current_admin: any = Depends(get_current_admin)
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    with_quote: bool = False,
+    current_admin: any = Depends(get_current_admin),
+    use_case: ListParkingRecordsUseCase = Depends(get_list_parking_records_use_case),
+    quote_use_case: ParkingQuoteUseCase = Depends(get_parking_quote_use_case)
 ):
     """
-    List all vehicles currently parked (active parking records) with detailed information.
+    List vehicles currently parked (active parking records), newest first, one page at a time.
+    Served from the in-memory occupancy index when it is loaded.
+
+    - **limit**: page size (max 500)
+    - **cursor**: `next_cursor` of the previous page; omit it for the first page
+    - **fields**: comma-separated columns to return (same names as GET /records)
+    - **with_quote**: add each vehicle's would-be exit fee right now (same rules as POST /exit,
+      priced for the whole page at once; nothing is written). Implies the `plate` field.
     """
     try:
-        from app.infrastructure.database.session import SessionLocal
-        from app.infrastructure.database.models.vehicles import ParkingRecord as ParkingRecordModel, Vehicle as VehicleModel
-        from sqlalchemy import select
-        from sqlalchemy.orm import joinedload
-        
-        async with SessionLocal() as session:
-            result = await session.execute(
-                select(ParkingRecordModel)
-                .options(joinedload(ParkingRecordModel.vehicle))
-                .where(ParkingRecordModel.exit_time.is_(None))
-                .order_by(ParkingRecordModel.entry_time.desc())
-            )
-            active_records = result.scalars().all()
-            
-            records_data = []
-            for record in active_records:
-                # Calculate duration so far
-                from datetime import timezone
-                now = datetime.now(timezone.utc)
-                duration = now - record.entry_time
-                hours = int(duration.total_seconds() // 3600)
-                minutes = int((duration.total_seconds() % 3600) // 60)
-                duration_str = f"{hours}h {minutes}m"
-                
-                records_data.append({
-                    "id": record.id,
-                    "vehicle_id": record.vehicle_id,
-                    "plate": record.vehicle.plate,
-                    "vehicle_type": record.vehicle.vehicle_type,
-                    "owner_name": record.vehicle.owner_name,
-                    "owner_phone": record.vehicle.owner_phone,
-                    "brand": record.vehicle.brand,
-                    "model": record.vehicle.model,
-                    "color": record.vehicle.color,
-                    "entry_time": record.entry_time.isoformat(),
-                    "helmet_count": record.helmet_count,
-                    "helmet_charge": record.helmet_charge,
-                    "notes": record.notes,
-                    "duration_so_far": duration_str
-                })
-            
-            return {
-                "message": "Active parking records retrieved successfully",
-                "count": len(records_data),
-                "records": records_data
-            }
+        requested = parse_fields(fields, ACTIVE_FIELDS)
+        if with_quote and "plate" not in requested:
+            requested.append("plate")
+        page = await use_case.execute(fields=requested, status='active', limit=limit, cursor=cursor)
+
+        if with_quote:
+            quotes = await quote_use_case.quote_plates([record["plate"] for record in page.records])
+            for record in page.records:
+                # Salió entre la página y la cotización: sin cotización
+                quote = quotes.get(record["plate"])
+                record["quote"] = _quote_data(quote) if quote else None
+
+        return {
+            "message": "Active parking records retrieved successfully",
+            "count": len(page.records),
+            "records": page.records,
+            "next_cursor": page.next_cursor
+        }
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -477,54 +688,23 @@ async def get_today_stats(
     Get parking statistics for today.
     """
     try:
-        from app.infrastructure.database.session import SessionLocal
-        from app.infrastructure.database.models.vehicles import ParkingRecord as ParkingRecordModel
-        from sqlalchemy import select, func
-        from datetime import date
+        from app.core.datetime_utils import business_today
         
-        async with SessionLocal() as session:
-            today = date.today()
-            
-            # Total entries today
-            total_entries_result = await session.execute(
-                select(func.count(ParkingRecordModel.id))
-                .where(func.date(ParkingRecordModel.entry_time) == today)
-            )
-            total_entries = total_entries_result.scalar()
-            
-            # Active vehicles (currently parked)
-            active_result = await session.execute(
-                select(func.count(ParkingRecordModel.id))
-                .where(ParkingRecordModel.exit_time.is_(None))
-            )
-            active_count = active_result.scalar()
-            
-            # Completed today (vehicles that exited today)
-            completed_result = await session.execute(
-                select(func.count(ParkingRecordModel.id))
-                .where(func.date(ParkingRecordModel.exit_time) == today)
-            )
-            completed_count = completed_result.scalar()
-            
-            # Total revenue today
-            revenue_result = await session.execute(
-                select(func.sum(ParkingRecordModel.total_cost))
-                .where(func.date(ParkingRecordModel.exit_time) == today)
-                .where(ParkingRecordModel.payment_status == "paid")
-            )
-            total_revenue = revenue_result.scalar() or 0
-            
-            return {
-                "message": "Today's statistics retrieved successfully",
-                "date": today.isoformat(),
-                "stats": {
-                    "total_entries": total_entries,
-                    "active_vehicles": active_count,
-                    "completed_exits": completed_count,
-                    "total_revenue": total_revenue,
-                    "total_revenue_formatted": f"${total_revenue / 100:,.0f} COP"
-                }
+        today = business_today()
+        stats = await DailyStatsService().get_parking_stats(today)
+        total_revenue = stats["revenue"]
+        
+        return {
+            "message": "Today's statistics retrieved successfully",
+            "date": today.isoformat(),
+            "stats": {
+                "total_entries": stats["total_entries"],
+                "active_vehicles": stats["active_vehicles"],
+                "completed_exits": stats["completed_exits"],
+                "total_revenue": total_revenue,
+                "total_revenue_formatted": f"${total_revenue / 100:,.0f} COP"
             }
+        }
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from datetime import date, timedelta
 from typing import Optional
 
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.reporting.services.dashboard_service import DashboardService
 from app.domain.reporting.services.revenue_service import RevenueService
+from app.domain.reporting.services.financial_rollup_service import FinancialRollupService
 from app.domain.reporting.services.washing_analytics_service import WashingAnalyticsService
 
 from app.infrastructure.repositories.financial.expense_repository_impl import ExpenseRepositoryImpl
@@ -17,10 +18,17 @@ from app.infrastructure.repositories.washing.washing_service_repository_impl imp
 
 from app.application.dto.reporting.dashboard_response import DashboardMetricsResponse
 from app.api.dependencies.auth import get_current_admin
+from app.api.dependencies.reporting import get_financial_rollup_service
+from app.core.config import settings
 
 router = APIRouter()
 
-def get_dashboard_service(db: AsyncSession = Depends(get_session)):
+def get_dashboard_service(
+    db: AsyncSession = Depends(get_session),
+    rollup_service: Optional[FinancialRollupService] = Depends(get_financial_rollup_service)
+):
+    # The dashboard runs its stages concurrently: only RevenueService uses the
+    # request session, every repository below opens its own.
     revenue_service = RevenueService(db)
     expense_repo = ExpenseRepositoryImpl()
     bonus_repo = BonusRepositoryImpl()
@@ -37,11 +45,13 @@ def get_dashboard_service(db: AsyncSession = Depends(get_session)):
         bonus_repository=bonus_repo,
         washing_analytics_service=washing_analytics,
         occupancy_repository=occupancy_repo,
-        washer_repository=washer_repo
+        washer_repository=washer_repo,
+        rollup_service=rollup_service
     )
 
 @router.get("/dashboard", response_model=DashboardMetricsResponse)
 async def get_dashboard_metrics(
+    response: Response,
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     service: DashboardService = Depends(get_dashboard_service),
@@ -56,4 +66,12 @@ async def get_dashboard_metrics(
     if not start_date:
         start_date = end_date - timedelta(days=30)
         
-    return await service.get_dashboard_metrics(start_date, end_date)
+    metrics = await service.get_dashboard_metrics(start_date, end_date)
+    
+    if settings.DEBUG:
+        # Per-stage timings, visible in the browser devtools "Timing" tab
+        response.headers["Server-Timing"] = ", ".join(
+            f"{stage};dur={duration:.1f}" for stage, duration in service.stage_timings.items()
+        )
+    
+    return metrics
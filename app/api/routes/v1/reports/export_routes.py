@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, status
-from fastapi.responses import StreamingResponse
-from datetime import date, timedelta
-from typing import Optional
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, status
+from fastapi.responses import FileResponse, StreamingResponse
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
 
 from app.application.reports.export_reports_use_case import ExportReportsUseCase
-from app.domain.reporting.services.export_service import ExportService
+from app.application.reports.export_job_queue import ExportJobQueue, export_job_queue
+from app.application.reports.report_exporters import report_exporters
+from app.application.reports.analytics_datasets import dataset_exporters, open_dataset_stream
+from app.application.dto.reporting.export_job_response import ExportJobRequest, ExportJobResponse, ExportableReport
+from app.domain.reporting.entities.export_job import ExportJob, DONE
+from app.domain.reporting.services.export_registry import ReportExporterRegistry, ReportExportParams
+from app.core.config import settings
+from app.core.datetime_utils import to_business_aware
+from app.domain.reporting.services.export_service import ExportService, EXPORT_FORMATS
 from app.infrastructure.repositories.parking.parking_record_repository_impl import ParkingRecordRepositoryImpl
-from app.infrastructure.repositories.parking.vehicle_repository_impl import VehicleRepositoryImpl
 from app.api.dependencies.auth import get_current_admin
 
 router = APIRouter(prefix="/export", tags=["Reports Export"])
@@ -28,11 +35,12 @@ async def export_parking_history(
         if not start_date:
             start_date = end_date - timedelta(days=30)
             
+        # No injected session: the CSV stream keeps its own cursor open after
+        # this handler returns, until the last chunk is sent.
         parking_repo = ParkingRecordRepositoryImpl()
-        vehicle_repo = VehicleRepositoryImpl()
         export_service = ExportService()
         
-        use_case = ExportReportsUseCase(parking_repo, vehicle_repo, export_service)
+        use_case = ExportReportsUseCase(parking_repo, export_service)
         
         file_stream = await use_case.export_parking_history(start_date, end_date, format)
         
@@ -57,3 +65,224 @@ async def export_parking_history(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error exporting report: {str(e)}"
         )
+
+
+def get_report_exporters() -> ReportExporterRegistry:
+    return report_exporters
+
+
+@router.get("/reports", response_model=List[ExportableReport])
+async def list_exportable_reports(
+    registry: ReportExporterRegistry = Depends(get_report_exporters),
+    current_admin: any = Depends(get_current_admin)
+):
+    """Reportes exportables, con sus formatos y columnas."""
+    return [
+        ExportableReport(
+            name=exporter.name,
+            title=exporter.title,
+            formats=list(exporter.formats),
+            columns=[column.key for column in exporter.columns]
+        )
+        for exporter in map(registry.get, registry.names())
+    ]
+
+
+@router.get("/reports/{report}")
+async def export_report(
+    report: str,
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    format: str = Query("csv", enum=list(EXPORT_FORMATS)),
+    group_by: str = Query("day", enum=["day", "week", "month"], description="revenue, activity"),
+    bucket_minutes: int = Query(60, ge=1, le=1440, description="occupancy"),
+    registry: ReportExporterRegistry = Depends(get_report_exporters),
+    current_admin: any = Depends(get_current_admin)
+):
+    """
+    Exporta cualquier reporte registrado en CSV, Excel, Parquet, Arrow o PDF.
+    Todos los formatos salen del mismo iterador de filas tipadas.
+    Si no se envían fechas, por defecto toma los últimos 30 días.
+    """
+    if report not in registry:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown report: {report}")
+    exporter = registry.get(report)
+
+    if not end_date:
+        end_date = date.today()
+    if not start_date:
+        start_date = end_date - timedelta(days=30)
+
+    try:
+        if format not in exporter.formats:
+            raise ValueError(f"Unsupported format for {report}: {format}")
+        params = ReportExportParams(start_date, end_date, group_by, bucket_minutes)
+        stream = await ExportService().export_rows(exporter.rows(params), exporter.columns, format, exporter.title)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    media_type, extension = EXPORT_FORMATS[format]
+    filename = f"{report.replace('-', '_')}_{start_date}_{end_date}.{extension}"
+    return StreamingResponse(
+        stream,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
+def get_dataset_exporters() -> ReportExporterRegistry:
+    return dataset_exporters
+
+
+@router.get("/datasets", response_model=List[ExportableReport])
+async def list_export_datasets(
+    registry: ReportExporterRegistry = Depends(get_dataset_exporters),
+    current_admin: any = Depends(get_current_admin)
+):
+    """Tablas de historia disponibles para la ingesta analítica incremental."""
+    return [
+        ExportableReport(
+            name=exporter.name,
+            title=exporter.title,
+            formats=list(exporter.formats),
+            columns=[column.key for column in exporter.columns]
+        )
+        for exporter in map(registry.get, registry.names())
+    ]
+
+
+@router.get("/datasets/{dataset}")
+async def export_dataset(
+    dataset: str,
+    since: Optional[datetime] = Query(None, description="Marca de agua de la extracción anterior (X-Export-Watermark)"),
+    format: str = Query("parquet", enum=["parquet", "arrow", "csv"]),
+    registry: ReportExporterRegistry = Depends(get_dataset_exporters),
+    current_admin: any = Depends(get_current_admin)
+):
+    """
+    Exporta las filas de una tabla de historia cuyo updated_at cambió desde
+    `since` (sin `since`, la historia completa), con columnas tipadas: centavos
+    enteros, timestamps con zona y categorías para tipo de vehículo y estado de pago.
+
+    La respuesta trae la nueva marca de agua en X-Export-Watermark; la siguiente
+    extracción la envía como `since`. Las filas borradas no aparecen.
+    """
+    if dataset not in registry:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown dataset: {dataset}")
+    exporter = registry.get(dataset)
+
+    try:
+        if format not in exporter.formats:
+            raise ValueError(f"Unsupported format for {dataset}: {format}")
+        # The watermark comes from the database clock, in the session that reads the rows
+        window, rows = await open_dataset_stream(
+            exporter, to_business_aware(since) if since else None, settings.EXPORT_WATERMARK_LAG_SECONDS
+        )
+        stream = await ExportService().export_rows(rows, exporter.columns, format, exporter.title)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    until = window.until.astimezone(timezone.utc)
+
+    media_type, extension = EXPORT_FORMATS[format]
+    filename = f"{dataset.replace('-', '_')}_{until:%Y%m%dT%H%M%SZ}.{extension}"
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "X-Export-Watermark": until.isoformat(),
+    }
+    if window.since is not None:
+        headers["X-Export-Since"] = window.since.isoformat()
+    return StreamingResponse(stream, media_type=media_type, headers=headers)
+
+
+def get_export_job_queue() -> ExportJobQueue:
+    return export_job_queue
+
+
+def _job_response(job: ExportJob, request: Request, reused: bool = False) -> ExportJobResponse:
+    download_url = None
+    if job.status == DONE:
+        download_url = str(request.url_for("download_export_job", job_id=job.id))
+    return ExportJobResponse(
+        id=job.id,
+        report=job.report,
+        start_date=job.start_date,
+        end_date=job.end_date,
+        format=job.format,
+        group_by=job.group_by,
+        bucket_minutes=job.bucket_minutes,
+        status=job.status,
+        progress=round(job.progress, 4),
+        rows_written=job.rows_written,
+        total_rows=job.total_rows,
+        file_size=job.file_size,
+        error=job.error,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+        expires_at=job.expires_at,
+        download_url=download_url,
+        reused=reused
+    )
+
+
+@router.post("/jobs", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_export_job(
+    body: ExportJobRequest,
+    request: Request,
+    queue: ExportJobQueue = Depends(get_export_job_queue),
+    current_admin: any = Depends(get_current_admin)
+):
+    """
+    Encola una exportación y responde de inmediato.
+    Si ya existe un trabajo idéntico (mismo reporte, parámetros y formato) en curso
+    o aún descargable, se devuelve ese mismo trabajo.
+    """
+    end_date = body.end_date or date.today()
+    start_date = body.start_date or end_date - timedelta(days=30)
+    try:
+        job, created = queue.submit(
+            body.report, start_date, end_date, body.format,
+            group_by=body.group_by,
+            bucket_minutes=body.bucket_minutes,
+            requested_by=getattr(current_admin, "id", None)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    return _job_response(job, request, reused=not created)
+
+
+@router.get("/jobs/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: str,
+    request: Request,
+    queue: ExportJobQueue = Depends(get_export_job_queue),
+    current_admin: any = Depends(get_current_admin)
+):
+    """Estado y progreso de un trabajo de exportación."""
+    job = queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export job not found or expired")
+    return _job_response(job, request)
+
+
+@router.get("/jobs/{job_id}/download", name="download_export_job")
+async def download_export_job(
+    job_id: str,
+    queue: ExportJobQueue = Depends(get_export_job_queue),
+    current_admin: any = Depends(get_current_admin)
+):
+    """Descarga el archivo de un trabajo terminado (sin volver a generarlo)."""
+    job = queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export job not found or expired")
+    if job.status != DONE:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Export job is {job.status}")
+
+    media_type, extension = EXPORT_FORMATS[job.format]
+    return FileResponse(
+        job.file_path,
+        media_type=media_type,
+        filename=f"{job.report.replace('-', '_')}_{job.start_date}_{job.end_date}.{extension}"
+    )
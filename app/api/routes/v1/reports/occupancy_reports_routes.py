@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from datetime import date
 from typing import Optional
 
 from app.domain.reporting.services.occupancy_reporting_service import OccupancyReportingService
 from app.infrastructure.repositories.reporting.occupancy_reporting_repository_impl import OccupancyReportingRepositoryImpl
-from app.application.dto.reporting.occupancy_report_response import OccupancyReportResponse
+from app.application.dto.reporting.occupancy_report_response import OccupancyReportResponse, OccupancySeriesResponse
+from app.core.datetime_utils import business_today
 
 router = APIRouter()
 
@@ -21,6 +22,27 @@ async def get_occupancy_report(
     Obtiene el reporte de ocupación por hora para una fecha específica.
     """
     if report_date is None:
-        report_date = date.today()
+        report_date = business_today()
         
     return await service.get_occupancy_report(report_date)
+
+@router.get("/occupancy/series", response_model=OccupancySeriesResponse)
+async def get_occupancy_series(
+    start_date: Optional[date] = Query(None, description="Fecha inicial (YYYY-MM-DD). Por defecto es hoy."),
+    end_date: Optional[date] = Query(None, description="Fecha final inclusive (YYYY-MM-DD). Por defecto igual a start_date."),
+    bucket_minutes: int = Query(60, ge=1, le=1440, description="Tamaño de franja en minutos (5, 15, 60, ...)."),
+    service: OccupancyReportingService = Depends(get_occupancy_service)
+):
+    """
+    Obtiene la ocupación por franjas de tamaño arbitrario en un rango de días,
+    con pico, promedio y percentiles (p50, p90, p95, p99).
+    """
+    if start_date is None:
+        start_date = business_today()
+    if end_date is None:
+        end_date = start_date
+
+    try:
+        return await service.get_occupancy_series(start_date, end_date, bucket_minutes)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
+from typing import Optional
 from app.infrastructure.database.session import get_session
 from app.domain.reporting.services.performance_service import PerformanceService
+from app.domain.reporting.services.financial_rollup_service import FinancialRollupService
+from app.api.dependencies.reporting import get_financial_rollup_service
 from app.infrastructure.repositories.financial.expense_repository_impl import ExpenseRepositoryImpl
 from app.infrastructure.repositories.financial.bonus_repository_impl import BonusRepositoryImpl
 from app.api.schemas.reporting_schemas import PerformanceReportResponse
@@ -13,13 +16,14 @@ router = APIRouter()
 async def get_performance_report(
     start_date: date = Query(..., description="Fecha de inicio del reporte"),
     end_date: date = Query(..., description="Fecha de fin del reporte"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_session),
+    rollup_service: Optional[FinancialRollupService] = Depends(get_financial_rollup_service)
 ):
     """
     Obtiene el reporte de rendimiento operativo (Ingresos - Gastos - Bonos).
     """
     expense_repo = ExpenseRepositoryImpl()
     bonus_repo = BonusRepositoryImpl()
-    service = PerformanceService(db, expense_repo, bonus_repo)
+    service = PerformanceService(db, expense_repo, bonus_repo, rollup_service)
     
     return await service.calculate_performance(start_date, end_date)
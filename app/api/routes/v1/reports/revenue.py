@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, Query
 from datetime import date
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.infrastructure.database.session import get_session
 from app.domain.reporting.services.revenue_service import RevenueService
+from app.domain.reporting.services.financial_rollup_service import FinancialRollupService
+from app.api.dependencies.reporting import get_financial_rollup_service
 from app.api.schemas.reporting_schemas import RevenueReportResponse
 
 router = APIRouter(prefix="/revenue", tags=["Reports"])
@@ -12,7 +15,8 @@ async def get_revenue_report(
     start_date: date = Query(..., description="Start date for the report"),
     end_date: date = Query(..., description="End date for the report"),
     group_by: str = Query("day", enum=["day", "week", "month"], description="Group results by day, week, or month"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_session),
+    rollup_service: Optional[FinancialRollupService] = Depends(get_financial_rollup_service)
 ):
-    service = RevenueService(db)
+    service = RevenueService(db, rollup_service)
     return await service.get_consolidated_revenue(start_date, end_date, group_by)
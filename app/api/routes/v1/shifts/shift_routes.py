@@ -7,30 +7,38 @@ from app.infrastructure.repositories.financial.expense_repository_impl import Ex
 from app.infrastructure.repositories.washing.washing_service_repository_impl import WashingServiceRepositoryImpl
 from app.infrastructure.repositories.parking.parking_record_repository_impl import ParkingRecordRepositoryImpl
 from app.api.dependencies.auth import get_current_user
+from app.infrastructure.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.domain.reporting.services.daily_stats_service import invalidate_daily_stats
+from app.infrastructure.cache.active_shift_cache import invalidate_active_shift
 
 router = APIRouter(prefix="/shifts", tags=["Shifts"])
 
-def get_shift_repository():
-    return ShiftRepositoryImpl()
+def get_shift_repository(uow: UnitOfWork = Depends(get_unit_of_work)):
+    return ShiftRepositoryImpl(uow.session)
 
-def get_expense_repository():
-    return ExpenseRepositoryImpl()
+def get_expense_repository(uow: UnitOfWork = Depends(get_unit_of_work)):
+    return ExpenseRepositoryImpl(uow.session)
 
-def get_washing_repository():
-    return WashingServiceRepositoryImpl()
+def get_washing_repository(uow: UnitOfWork = Depends(get_unit_of_work)):
+    return WashingServiceRepositoryImpl(uow.session)
 
-def get_parking_repository():
-    return ParkingRecordRepositoryImpl()
+def get_parking_repository(uow: UnitOfWork = Depends(get_unit_of_work)):
+    return ParkingRecordRepositoryImpl(uow.session)
 
 @router.post("/start", response_model=ShiftResponse, status_code=status.HTTP_201_CREATED)
 async def start_shift(
     shift_data: ShiftCreate,
     shift_repository: ShiftRepositoryImpl = Depends(get_shift_repository),
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work)
 ):
     use_case = StartShift(shift_repository)
     try:
-        return await use_case.execute(admin_id=current_user.id, initial_cash=shift_data.initial_cash)
+        shift = await use_case.execute(admin_id=current_user.id, initial_cash=shift_data.initial_cash)
+        uow.after_commit(invalidate_daily_stats)
+        # Again once committed: a concurrent request may have cached the old state in between
+        uow.after_commit(lambda: invalidate_active_shift(current_user.id))
+        return shift
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -40,7 +48,8 @@ async def close_shift(
     expense_repository: ExpenseRepositoryImpl = Depends(get_expense_repository),
     washing_repository: WashingServiceRepositoryImpl = Depends(get_washing_repository),
     parking_repository: ParkingRecordRepositoryImpl = Depends(get_parking_repository),
-    current_user = Depends(get_current_user)
+    current_user = Depends(get_current_user),
+    uow: UnitOfWork = Depends(get_unit_of_work)
 ):
     use_case = CloseShift(
         shift_repository,
@@ -49,6 +58,10 @@ async def close_shift(
         parking_repository
     )
     try:
-        return await use_case.execute(admin_id=current_user.id)
+        shift = await use_case.execute(admin_id=current_user.id)
+        uow.after_commit(invalidate_daily_stats)
+        # Again once committed: a concurrent request may have cached the old state in between
+        uow.after_commit(lambda: invalidate_active_shift(current_user.id))
+        return shift
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from typing import List, Optional
 from datetime import date
 
 from app.application.dto.washing.washing_service_dtos import WashingServiceRequest, WashingServiceResponse
@@ -8,46 +8,35 @@ from app.infrastructure.repositories.washing.washing_service_repository_impl imp
 from app.infrastructure.repositories.parking.vehicle_repository_impl import VehicleRepositoryImpl
 from app.infrastructure.repositories.parking.parking_record_repository_impl import ParkingRecordRepositoryImpl
 from app.api.dependencies.auth import get_current_admin
+from app.infrastructure.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.api.dependencies.occupancy import get_occupancy_index
+from app.api.dependencies.shift import get_current_shift_id
+from app.domain.reporting.services.daily_stats_service import invalidate_daily_stats
+from app.domain.parking.services.occupancy_index import OccupancyIndex
 
 router = APIRouter(prefix="", tags=["Washing Services"])
 
-def get_create_washing_service_use_case() -> CreateWashingServiceUseCase:
-    washing_repo = WashingServiceRepositoryImpl()
-    vehicle_repo = VehicleRepositoryImpl()
-    parking_record_repo = ParkingRecordRepositoryImpl()
-    return CreateWashingServiceUseCase(washing_repo, vehicle_repo, parking_record_repo)
+def get_create_washing_service_use_case(
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    occupancy_index: Optional[OccupancyIndex] = Depends(get_occupancy_index)
+) -> CreateWashingServiceUseCase:
+    washing_repo = WashingServiceRepositoryImpl(uow.session)
+    vehicle_repo = VehicleRepositoryImpl(uow.session)
+    parking_record_repo = ParkingRecordRepositoryImpl(uow.session)
+    return CreateWashingServiceUseCase(washing_repo, vehicle_repo, parking_record_repo, occupancy_index, uow.after_commit)
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=WashingServiceResponse)
 async def create_washing_service(
     request: WashingServiceRequest,
     current_admin: any = Depends(get_current_admin),
-    use_case: CreateWashingServiceUseCase = Depends(get_create_washing_service_use_case)
+    shift_id: int = Depends(get_current_shift_id),
+    use_case: CreateWashingServiceUseCase = Depends(get_create_washing_service_use_case),
+    uow: UnitOfWork = Depends(get_unit_of_work)
 ):
     """
     Register a new washing service.
     """
     try:
-        # Get active shift (placeholder logic similar to parking)
-        from app.infrastructure.database.session import SessionLocal
-        from app.infrastructure.database.models.financial import Shift
-        from sqlalchemy import select
-        
-        async with SessionLocal() as session:
-            result = await session.execute(
-                select(Shift)
-                .where(Shift.admin_id == current_admin.id)
-                .where(Shift.shift_date == date.today())
-                .where(Shift.end_time.is_(None))
-            )
-            active_shift = result.scalar_one_or_none()
-            
-            if not active_shift:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="No active shift found. Please start a shift first."
-                )
-            shift_id = active_shift.id
-
         service = await use_case.execute(
             plate=request.plate,
             vehicle_type=request.vehicle_type,
@@ -60,6 +49,7 @@ async def create_washing_service(
             washer_id=request.washer_id,
             notes=request.notes
         )
+        uow.after_commit(invalidate_daily_stats)
         
         return WashingServiceResponse(
             id=service.id,
@@ -176,6 +166,7 @@ async def complete_service(
         use_case = CompleteWashingServiceUseCase(washing_repo)
         
         service = await use_case.execute(service_id)
+        invalidate_daily_stats()
         
         # Get plate for response
         vehicle_repo = VehicleRepositoryImpl()
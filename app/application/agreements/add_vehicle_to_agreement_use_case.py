@@ -1,5 +1,6 @@
 from app.domain.agreements.repositories.agreement_repository import IAgreementRepository
 from app.domain.parking.repositories.vehicle_repository import IVehicleRepository
+from app.application.pricing.sync_pricing_catalog_use_case import SyncPricingCatalogUseCase, pricing_catalog_sync
 
 class AddVehicleToAgreementUseCase:
     """Use case for adding a vehicle to an agreement"""
@@ -7,10 +8,12 @@ class AddVehicleToAgreementUseCase:
     def __init__(
         self,
         agreement_repo: IAgreementRepository,
-        vehicle_repo: IVehicleRepository
+        vehicle_repo: IVehicleRepository,
+        pricing_sync: SyncPricingCatalogUseCase = pricing_catalog_sync
     ):
         self.agreement_repo = agreement_repo
         self.vehicle_repo = vehicle_repo
+        self.pricing_sync = pricing_sync
     
     async def execute(self, agreement_id: int, plate: str):
         # Verify agreement exists
@@ -30,5 +33,6 @@ class AddVehicleToAgreementUseCase:
         
         # Add vehicle to agreement
         await self.agreement_repo.add_vehicle_to_agreement(agreement_id, vehicle.id)
+        await self.pricing_sync.publish()
         
         return {"message": f"Vehicle {plate} added to agreement {agreement.company_name}"}
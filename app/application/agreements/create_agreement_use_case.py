@@ -2,12 +2,14 @@ from datetime import date
 from typing import Optional
 from app.domain.agreements.entities.agreement import Agreement
 from app.domain.agreements.repositories.agreement_repository import IAgreementRepository
+from app.application.pricing.sync_pricing_catalog_use_case import SyncPricingCatalogUseCase, pricing_catalog_sync
 
 class CreateAgreementUseCase:
     """Use case for creating a new agreement"""
     
-    def __init__(self, agreement_repo: IAgreementRepository):
+    def __init__(self, agreement_repo: IAgreementRepository, pricing_sync: SyncPricingCatalogUseCase = pricing_catalog_sync):
         self.agreement_repo = agreement_repo
+        self.pricing_sync = pricing_sync
     
     async def execute(
         self,
@@ -40,4 +42,6 @@ class CreateAgreementUseCase:
             notes=notes
         )
         
-        return await self.agreement_repo.create(agreement)
+        agreement = await self.agreement_repo.create(agreement)
+        await self.pricing_sync.publish()
+        return agreement
@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+from typing import List
+from app.application.dto.parking.entry_request import EntryRequest
+
+# Una ráfaga (apertura, evento) cabe de sobra; más filas alargan la transacción
+MAX_BATCH_ENTRIES = 500
+
+
+class EntryBatchRequest(BaseModel):
+    entries: List[EntryRequest] = Field(..., min_length=1, max_length=MAX_BATCH_ENTRIES)
@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+from typing import List
+from app.application.dto.parking.exit_request import ExitRequest
+
+# Salida masiva (fin de evento, retorno de flota); el mismo límite que las entradas
+MAX_BATCH_EXITS = 500
+
+
+class ExitBatchRequest(BaseModel):
+    exits: List[ExitRequest] = Field(..., min_length=1, max_length=MAX_BATCH_EXITS)
@@ -0,0 +1,37 @@
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from datetime import date, datetime
+
+class ExportJobRequest(BaseModel):
+    report: str = "parking-history"  # any name listed by GET /reports/export/reports
+    start_date: Optional[date] = None  # default: 30 days before end_date
+    end_date: Optional[date] = None  # default: today
+    format: Literal["csv", "excel", "parquet", "arrow", "pdf"] = "csv"
+    group_by: Literal["day", "week", "month"] = "day"  # revenue, activity
+    bucket_minutes: int = Field(60, ge=1, le=1440)  # occupancy
+
+class ExportJobResponse(BaseModel):
+    id: str
+    report: str
+    start_date: date
+    end_date: date
+    format: str
+    group_by: str
+    bucket_minutes: int
+    status: str  # queued, running, done, failed
+    progress: float = Field(..., ge=0, le=1)
+    rows_written: int
+    total_rows: Optional[int] = None
+    file_size: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    download_url: Optional[str] = None
+    reused: bool = False  # True when an identical job already existed
+
+class ExportableReport(BaseModel):
+    name: str
+    title: str
+    formats: List[str]
+    columns: List[str]
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
-from typing import List
-from datetime import date
+from typing import Dict, List, Optional
+from datetime import date, datetime
 
 class OccupancyDataPoint(BaseModel):
     hour: str  # "08:00", "09:00"
@@ -11,3 +11,17 @@ class OccupancyReportResponse(BaseModel):
     items: List[OccupancyDataPoint]
     total_peak_occupancy: int
     peak_hour: str
+
+class OccupancyBucket(BaseModel):
+    start: datetime
+    count: int
+
+class OccupancySeriesResponse(BaseModel):
+    start_date: date
+    end_date: date
+    bucket_minutes: int
+    items: List[OccupancyBucket]
+    peak_occupancy: int
+    peak_at: Optional[datetime] = None
+    average_occupancy: float
+    percentiles: Dict[str, float]
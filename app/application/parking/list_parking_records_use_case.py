@@ -0,0 +1,152 @@
+import base64
+import json
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from app.domain.parking.entities.parking_record import ParkingRecord
+from app.domain.parking.entities.vehicle import Vehicle
+from app.domain.parking.repositories.parking_record_repository import (
+    IParkingRecordRepository,
+    PARKING_RECORD_FIELDS,
+    PARKING_RECORD_VEHICLE_FIELDS,
+)
+from app.domain.parking.services.occupancy_index import OccupancyIndex
+
+# Campos que se derivan en Python de columnas proyectadas (solo para la página)
+DERIVED_FIELDS = {
+    "duration_so_far": ("duration_seconds",),
+    "duration_hours": ("duration_seconds", "exit_time"),
+}
+
+# Respuestas por defecto (las de antes de `fields=`)
+RECORD_FIELDS = (
+    "id", "vehicle_id", "plate", "vehicle_type", "owner_name", "owner_phone", "brand", "model",
+    "color", "entry_time", "exit_time", "helmet_count", "helmet_charge", "total_cost",
+    "payment_status", "notes", "duration_so_far", "duration_hours",
+)
+ACTIVE_FIELDS = (
+    "id", "vehicle_id", "plate", "vehicle_type", "owner_name", "owner_phone", "brand", "model",
+    "color", "entry_time", "helmet_count", "helmet_charge", "notes", "duration_so_far",
+)
+
+# El cursor siempre necesita la clave de orden
+_CURSOR_FIELDS = ("entry_time", "id")
+
+
+def encode_cursor(entry_time: datetime, record_id: int) -> str:
+    raw = json.dumps([entry_time.isoformat(), record_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        entry_time, record_id = json.loads(raw)
+        return datetime.fromisoformat(entry_time), int(record_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def parse_fields(fields: Optional[str], default: Sequence[str]) -> List[str]:
+    """`fields=a,b,c` -> lista validada; None o vacío -> `default`."""
+    if not fields:
+        return list(default)
+    requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in PARKING_RECORD_FIELDS and f not in DERIVED_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. "
+            f"Available: {', '.join((*PARKING_RECORD_FIELDS, *DERIVED_FIELDS))}"
+        )
+    return requested
+
+
+@dataclass
+class ParkingRecordPage:
+    records: List[Dict[str, Any]]
+    # None en la última página
+    next_cursor: Optional[str] = None
+
+
+class ListParkingRecordsUseCase:
+    """
+    Lista registros de parqueo por páginas, del más reciente al más antiguo.
+
+    Paginación por cursor sobre (entry_time, id): cada página es una consulta
+    por índice que arranca donde terminó la anterior, sin OFFSET. Solo se
+    seleccionan las columnas pedidas (consulta Core, sin objetos ORM) y la
+    duración se calcula en SQL. Los activos se sirven del índice de ocupación
+    cuando está cargado, sin consultar la base de datos.
+    """
+
+    def __init__(
+        self,
+        parking_record_repo: IParkingRecordRepository,
+        occupancy_index: Optional[OccupancyIndex] = None
+    ):
+        self.parking_record_repo = parking_record_repo
+        self.occupancy_index = occupancy_index
+
+    async def execute(
+        self,
+        fields: Sequence[str],
+        status: str = 'all',
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> ParkingRecordPage:
+        if status not in ('all', 'active', 'completed'):
+            raise ValueError("status_filter must be 'all', 'active' or 'completed'")
+        after = decode_cursor(cursor) if cursor else None
+
+        columns = list(dict.fromkeys(
+            column
+            for name in (*fields, *_CURSOR_FIELDS)
+            for column in DERIVED_FIELDS.get(name, (name,))
+        ))
+        # Una fila de más dice si hay otra página
+        if status == 'active' and self.occupancy_index is not None and self.occupancy_index.is_loaded:
+            rows = self._active_page(columns, limit + 1, after)
+        else:
+            rows = await self.parking_record_repo.list_page(columns, status, limit + 1, after)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["entry_time"], rows[-1]["id"])
+        return ParkingRecordPage(records=[self._project(row, fields) for row in rows], next_cursor=next_cursor)
+
+    def _active_page(
+        self, columns: Sequence[str], limit: int, after: Optional[Tuple[datetime, int]]
+    ) -> List[Dict[str, Any]]:
+        now = datetime.now(timezone.utc)
+        return [
+            self._entity_row(entry.vehicle, entry.record, columns, now)
+            for entry in self.occupancy_index.list_page(limit, after)
+        ]
+
+    @staticmethod
+    def _entity_row(vehicle: Vehicle, record: ParkingRecord, columns: Sequence[str], now: datetime) -> Dict[str, Any]:
+        row = {}
+        for name in columns:
+            if name == "duration_seconds":
+                row[name] = math.floor(((record.exit_time or now) - record.entry_time).total_seconds())
+            elif name in PARKING_RECORD_VEHICLE_FIELDS:
+                row[name] = getattr(vehicle, name)
+            else:
+                row[name] = getattr(record, name)
+        return row
+
+    @staticmethod
+    def _project(row: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+        data = {}
+        for name in fields:
+            if name == "duration_so_far":
+                seconds = row["duration_seconds"]
+                data[name] = f"{seconds // 3600}h {(seconds % 3600) // 60}m"
+            elif name == "duration_hours":
+                # Solo para registros cerrados, como antes
+                data[name] = round(row["duration_seconds"] / 3600, 2) if row["exit_time"] else None
+            else:
+                data[name] = row[name]
+        return data
@@ -1,12 +1,14 @@
 from typing import List, Optional
 from app.domain.parking.entities.rate import Rate
 from app.domain.parking.repositories.rate_repository import IRateRepository
+from app.application.pricing.sync_pricing_catalog_use_case import SyncPricingCatalogUseCase, pricing_catalog_sync
 
 class ManageRatesUseCase:
     """Use case for managing parking rates"""
     
-    def __init__(self, rate_repo: IRateRepository):
+    def __init__(self, rate_repo: IRateRepository, pricing_sync: SyncPricingCatalogUseCase = pricing_catalog_sync):
         self.rate_repo = rate_repo
+        self.pricing_sync = pricing_sync
     
     async def create_rate(
         self,
@@ -37,7 +39,9 @@ class ManageRatesUseCase:
             is_active=is_active
         )
         
-        return await self.rate_repo.create(rate)
+        rate = await self.rate_repo.create(rate)
+        await self.pricing_sync.publish()
+        return rate
     
     async def update_rate(
         self,
@@ -58,7 +62,9 @@ class ManageRatesUseCase:
         rate.description = description
         rate.is_active = is_active
         
-        return await self.rate_repo.update(rate_id, rate)
+        rate = await self.rate_repo.update(rate_id, rate)
+        await self.pricing_sync.publish()
+        return rate
     
     async def delete_rate(self, rate_id: int):
         rate = await self.rate_repo.get_by_id(rate_id)
@@ -66,6 +72,7 @@ class ManageRatesUseCase:
             raise ValueError(f"Rate with ID {rate_id} not found")
             
         await self.rate_repo.delete(rate_id)
+        await self.pricing_sync.publish()
         
     async def list_rates(self) -> List[Rate]:
         return await self.rate_repo.list_active()
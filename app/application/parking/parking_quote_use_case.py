@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+from app.domain.parking.entities.parking_record import ParkingRecord
+from app.domain.parking.entities.vehicle import Vehicle
+from app.domain.parking.repositories.parking_record_repository import IParkingRecordRepository
+from app.domain.parking.repositories.rate_repository import IRateRepository
+from app.domain.agreements.repositories.agreement_repository import IAgreementRepository
+from app.domain.washing.repositories.washing_service_repository import IWashingServiceRepository
+from app.domain.parking.services.occupancy_index import OccupancyIndex
+from app.domain.parking.services.pricing_catalog import PricingCatalog
+from app.domain.parking.services.tariff_engine import TariffInput, TariffQuote, TariffTables, price_records
+
+
+@dataclass
+class ParkingQuote:
+    """Lo que costaría la salida de un vehículo en `quoted_at`, o por qué no se puede cotizar."""
+    plate: str
+    vehicle: Vehicle
+    record: ParkingRecord
+    quoted_at: datetime
+    tariff: Optional[TariffQuote] = None
+    error: Optional[str] = None
+
+    @property
+    def valid_until(self) -> Optional[datetime]:
+        """Hasta cuándo vale la cotización: el instante en que empieza la siguiente hora."""
+        if self.tariff is None:
+            return None
+        return self.record.entry_time + timedelta(minutes=self.tariff.free_minutes + self.tariff.hours * 60)
+
+
+class ParkingQuoteUseCase:
+    """
+    Cotiza la salida de vehículos que siguen en el parqueadero con las mismas
+    reglas de cobro que VehicleExitUseCase, sin escribir nada.
+
+    El registro activo sale del índice de ocupación (o de una consulta), la
+    suscripción ya está en el registro y tarifas y convenios del catálogo de
+    precios (las tarifas que no están en él, del repositorio); sin catálogo se
+    cargan con una consulta por conjunto cada uno.
+    Solo los lavados vinculados se consultan, una vez para todo el lote.
+    """
+
+    def __init__(
+        self,
+        parking_record_repo: IParkingRecordRepository,
+        rate_repo: IRateRepository,
+        agreement_repo: IAgreementRepository,
+        washing_repo: IWashingServiceRepository,
+        occupancy_index: Optional[OccupancyIndex] = None,
+        pricing_catalog: Optional[PricingCatalog] = None
+    ):
+        self.parking_record_repo = parking_record_repo
+        self.rate_repo = rate_repo
+        self.agreement_repo = agreement_repo
+        self.washing_repo = washing_repo
+        self.occupancy_index = occupancy_index
+        self.pricing_catalog = pricing_catalog
+
+    async def execute(self, plate: str, quoted_at: Optional[datetime] = None) -> ParkingQuote:
+        plate = plate.upper().strip()
+        quote = (await self.quote_plates([plate], quoted_at)).get(plate)
+        if quote is None:
+            raise ValueError(f"No active parking record found for vehicle {plate}")
+        if quote.error:
+            raise ValueError(quote.error)
+        return quote
+
+    async def quote_plates(self, plates: Sequence[str], quoted_at: Optional[datetime] = None) -> Dict[str, ParkingQuote]:
+        """Cotización de cada placa parqueada; las que no están parqueadas no aparecen."""
+        active: Dict[str, Tuple[Vehicle, ParkingRecord]] = {}
+        missing = []
+        for plate in plates:
+            entry = self.occupancy_index.get(plate) if self.occupancy_index is not None else None
+            if entry is not None:
+                active[plate] = (entry.vehicle, entry.record)
+            else:
+                missing.append(plate)
+        if missing:
+            active.update(await self.parking_record_repo.get_active_with_vehicles_by_plates(missing))
+
+        quotes = await self.quote_many(list(active.values()), quoted_at)
+        return dict(zip(active, quotes))
+
+    async def quote_many(
+        self,
+        active: Sequence[Tuple[Vehicle, ParkingRecord]],
+        quoted_at: Optional[datetime] = None
+    ) -> List[ParkingQuote]:
+        """Cotiza todos los pares (vehículo, registro activo) a la vez con price_records."""
+        quoted_at = quoted_at or datetime.now(timezone.utc)
+        if not active:
+            return []
+
+        records = [record for _, record in active]
+        washing_services = await self.washing_repo.get_by_ids(
+            r.washing_service_id for r in records if r.washing_service_id
+        )
+        batch = price_records(
+            [
+                TariffInput.for_record(
+                    vehicle,
+                    record,
+                    quoted_at,
+                    washing_services[record.washing_service_id].service_type
+                    if record.washing_service_id in washing_services else None
+                )
+                for vehicle, record in active
+            ],
+            await self._tariff_tables(records)
+        )
+
+        quotes = []
+        for position, (vehicle, record) in enumerate(active):
+            tariff = batch.quote(position)
+            quotes.append(ParkingQuote(
+                plate=vehicle.plate,
+                vehicle=vehicle,
+                record=record,
+                quoted_at=quoted_at,
+                tariff=tariff,
+                error=None if tariff is not None else "Rate not found for parking record"
+            ))
+        return quotes
+
+    async def _tariff_tables(self, records: Sequence[ParkingRecord]) -> TariffTables:
+        # Con suscripción el parqueo es gratis: ni convenio ni tarifa
+        unsubscribed = [r for r in records if not r.subscription_id]
+        if self.pricing_catalog is not None and self.pricing_catalog.is_ready:
+            tables = self.pricing_catalog.tariff_tables()
+            # Tarifas que no están en el snapshot (p. ej. creadas en otro worker
+            # desde el último refresco) se buscan en el repositorio, como en CatalogRateRepository
+            missing = {r.parking_rate_id for r in unsubscribed} - tables.rates_by_id.keys()
+            if not missing:
+                return tables
+            # El snapshot es compartido: se completa una copia
+            rates_by_id = dict(tables.rates_by_id)
+            rates_by_id.update(await self.rate_repo.get_by_ids(missing))
+            return TariffTables(rates_by_id=rates_by_id, agreements_by_vehicle=tables.agreements_by_vehicle)
+        return TariffTables(
+            rates_by_id=await self.rate_repo.get_by_ids(r.parking_rate_id for r in unsubscribed),
+            agreements_by_vehicle=await self.agreement_repo.get_agreements_by_vehicle_ids(
+                [r.vehicle_id for r in unsubscribed]
+            ),
+        )
@@ -0,0 +1,50 @@
+import asyncio
+import logging
+from app.domain.parking.repositories.parking_record_repository import IParkingRecordRepository
+from app.domain.parking.services.occupancy_index import OccupancyIndex, ReconciliationReport
+
+logger = logging.getLogger(__name__)
+
+
+class ReconcileOccupancyIndexUseCase:
+    """Use case for checking the in-memory occupancy index against the database"""
+
+    def __init__(
+        self,
+        parking_record_repo: IParkingRecordRepository,
+        occupancy_index: OccupancyIndex
+    ):
+        self.parking_record_repo = parking_record_repo
+        self.occupancy_index = occupancy_index
+
+    async def load(self) -> int:
+        """Fill the index from the active records. Returns how many were loaded."""
+        entries = await self.parking_record_repo.list_active_with_vehicles()
+        self.occupancy_index.load(entries)
+        return len(entries)
+
+    async def execute(self) -> ReconciliationReport:
+        """
+        Replace the index content with the database state, except for plates
+        that had an entry or exit while the query was running.
+        """
+        self.occupancy_index.begin_reconciliation()
+        entries = await self.parking_record_repo.list_active_with_vehicles()
+        report = self.occupancy_index.apply_snapshot(entries)
+
+        if not report.in_sync:
+            logger.warning(
+                "Occupancy index drift: missing=%s stale=%s changed=%s",
+                report.missing, report.stale, report.changed
+            )
+        return report
+
+
+async def run_occupancy_reconciliation(use_case: ReconcileOccupancyIndexUseCase, interval_seconds: int) -> None:
+    """Background loop started with the application; errors never stop it."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await use_case.execute()
+        except Exception:
+            logger.exception("Occupancy index reconciliation failed")
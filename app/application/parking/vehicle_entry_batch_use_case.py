@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from app.application.dto.parking.entry_request import EntryRequest
+from app.application.parking.vehicle_entry_use_case import helmet_charge_for
+from app.domain.parking.entities.vehicle import Vehicle
+from app.domain.parking.entities.parking_record import ParkingRecord
+from app.domain.parking.repositories.vehicle_repository import IVehicleRepository
+from app.domain.parking.repositories.parking_record_repository import IParkingRecordRepository
+from app.domain.parking.repositories.rate_repository import IRateRepository
+from app.domain.subscriptions.repositories.subscription_repository import ISubscriptionRepository
+from app.domain.parking.services.occupancy_index import AfterCommit, OccupancyIndex
+
+
+@dataclass
+class EntryBatchItemResult:
+    """Resultado de una entrada del lote: el registro creado o el motivo del rechazo."""
+    index: int
+    plate: str
+    record: Optional[ParkingRecord] = None
+    error: Optional[str] = None
+
+    @property
+    def created(self) -> bool:
+        return self.record is not None
+
+
+class VehicleEntryBatchUseCase:
+    """
+    Registra un lote de entradas con consultas por conjunto.
+
+    Vehículos, suscripciones y tarifas se cargan con una consulta cada uno
+    (WHERE ... IN), los vehículos nuevos se insertan juntos y todos los
+    registros con un solo INSERT multi-fila. El número de consultas no depende
+    del tamaño del lote. Las reglas son las de VehicleEntryUseCase; una entrada
+    inválida se reporta en su resultado sin rechazar el resto del lote.
+    """
+
+    def __init__(
+        self,
+        vehicle_repo: IVehicleRepository,
+        parking_record_repo: IParkingRecordRepository,
+        rate_repo: IRateRepository,
+        subscription_repo: ISubscriptionRepository,
+        occupancy_index: Optional[OccupancyIndex] = None,
+        after_commit: Optional[AfterCommit] = None
+    ):
+        self.vehicle_repo = vehicle_repo
+        self.parking_record_repo = parking_record_repo
+        self.rate_repo = rate_repo
+        self.subscription_repo = subscription_repo
+        self.occupancy_index = occupancy_index
+        # Sin unidad de trabajo (repositorios que confirman solos) se aplica en el acto
+        self.after_commit = after_commit or (lambda callback: callback())
+
+    async def execute(self, entries: List[EntryRequest], shift_id: int, admin_id: int) -> List[EntryBatchItemResult]:
+        results = [
+            EntryBatchItemResult(index=i, plate=entry.plate.upper().strip())
+            for i, entry in enumerate(entries)
+        ]
+        vehicle_types = [entry.vehicle_type.lower().strip() for entry in entries]
+
+        # Una placa repetida dentro del lote: solo cuenta la primera
+        pending: Dict[str, int] = {}
+        for result in results:
+            if result.plate in pending:
+                result.error = f"Vehicle {result.plate} is repeated in the batch"
+            else:
+                pending[result.plate] = result.index
+
+        # Tarifas primero: una entrada sin tarifa no debe crear su vehículo
+        rates = await self.rate_repo.get_active_by_types(
+            {vehicle_types[i] for i in pending.values()}, "hour"
+        )
+        for plate, i in list(pending.items()):
+            if vehicle_types[i] not in rates:
+                results[i].error = f"No active rate found for vehicle type: {vehicle_types[i]}"
+                del pending[plate]
+        if not pending:
+            return results
+
+        vehicles = await self.vehicle_repo.get_by_plates(list(pending))
+        new_vehicles = [
+            Vehicle(
+                id=None,
+                plate=plate,
+                vehicle_type=vehicle_types[i],
+                owner_name=entries[i].owner_name,
+                owner_phone=entries[i].owner_phone,
+                brand=entries[i].brand,
+                model=entries[i].model,
+                color=entries[i].color,
+                is_frequent=False,
+                notes=entries[i].notes
+            )
+            for plate, i in pending.items()
+            if plate not in vehicles
+        ]
+        if new_vehicles:
+            vehicles.update(await self.vehicle_repo.create_many(new_vehicles))
+
+        subscriptions = await self.subscription_repo.get_active_by_vehicle_ids(
+            [vehicles[plate].id for plate in pending], date.today()
+        )
+
+        entry_time = datetime.now(timezone.utc)
+        records = []
+        for plate, i in pending.items():
+            entry = entries[i]
+            vehicle = vehicles[plate]
+            subscription = subscriptions.get(vehicle.id)
+            records.append(ParkingRecord(
+                id=None,
+                vehicle_id=vehicle.id,
+                shift_id=shift_id,
+                admin_id=admin_id,
+                entry_time=entry_time,
+                parking_rate_id=rates[vehicle_types[i]].id,
+                exit_time=None,
+                subscription_id=subscription.id if subscription else None,
+                washing_service_id=None,
+                helmet_count=entry.helmet_count,
+                helmet_charge=helmet_charge_for(entry.helmet_count),
+                total_cost=0,  # Will be calculated on exit
+                payment_status="pending",
+                notes=entry.notes
+            ))
+
+        # Los vehículos que ya tienen un registro activo no se insertan
+        created = {record.vehicle_id: record for record in await self.parking_record_repo.create_many(records)}
+        added: List[Tuple[Vehicle, ParkingRecord]] = []
+        for plate, i in pending.items():
+            vehicle = vehicles[plate]
+            record = created.get(vehicle.id)
+            if record is None:
+                results[i].error = f"Vehicle {plate} already has an active parking record"
+                continue
+            results[i].record = record
+            added.append((vehicle, record))
+
+        if self.occupancy_index is not None and added:
+            index = self.occupancy_index
+
+            def add_to_index() -> None:
+                for vehicle, record in added:
+                    index.add(vehicle, record)
+
+            # El índice cambia solo si el lote se confirma
+            self.after_commit(add_to_index)
+        return results
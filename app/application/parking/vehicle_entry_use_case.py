@@ -6,6 +6,15 @@ from app.domain.parking.repositories.vehicle_repository import IVehicleRepositor
 from app.domain.parking.repositories.parking_record_repository import IParkingRecordRepository
 from app.domain.parking.repositories.rate_repository import IRateRepository
 from app.domain.subscriptions.repositories.subscription_repository import ISubscriptionRepository
+from app.domain.parking.services.occupancy_index import AfterCommit, OccupancyIndex
+
+# Helmet charge: 1000 pesos (100000 centavos) per helmet
+HELMET_CHARGE_PER_UNIT = 100000
+
+
+def helmet_charge_for(helmet_count: int) -> int:
+    return helmet_count * HELMET_CHARGE_PER_UNIT if helmet_count > 0 else 0
+
 
 class VehicleEntryUseCase:
     """Use case for registering vehicle entry to parking"""
@@ -15,12 +24,17 @@ class VehicleEntryUseCase:
         vehicle_repo: IVehicleRepository,
         parking_record_repo: IParkingRecordRepository,
         rate_repo: IRateRepository,
-        subscription_repo: ISubscriptionRepository
+        subscription_repo: ISubscriptionRepository,
+        occupancy_index: Optional[OccupancyIndex] = None,
+        after_commit: Optional[AfterCommit] = None
     ):
         self.vehicle_repo = vehicle_repo
         self.parking_record_repo = parking_record_repo
         self.rate_repo = rate_repo
         self.subscription_repo = subscription_repo
+        self.occupancy_index = occupancy_index
+        # Sin unidad de trabajo (repositorios que confirman solos) se aplica en el acto
+        self.after_commit = after_commit or (lambda callback: callback())
     
     async def execute(
         self,
@@ -41,8 +55,15 @@ class VehicleEntryUseCase:
         plate = plate.upper().strip()
         vehicle_type = vehicle_type.lower().strip()
         
-        # Check if vehicle exists, if not create it
-        vehicle = await self.vehicle_repo.get_by_plate(plate)
+        # A vehicle this worker knows is parked is rejected without a query
+        index = self.occupancy_index
+        if index is not None and index.is_loaded and index.is_parked(plate):
+            raise ValueError(f"Vehicle {plate} already has an active parking record")
+
+        # Vehicle and its active record in one lookup; if not registered, create it
+        vehicle, active_record = await self.parking_record_repo.get_vehicle_with_active_record(plate)
+        if active_record is not None:
+            raise ValueError(f"Vehicle {plate} already has an active parking record")
         
         if vehicle is None:
             # Create new vehicle
@@ -59,11 +80,6 @@ class VehicleEntryUseCase:
                 notes=notes
             )
             vehicle = await self.vehicle_repo.create(vehicle)
-        else:
-            # Check if vehicle already has an active parking record
-            active_record = await self.parking_record_repo.get_active_by_vehicle_id(vehicle.id)
-            if active_record:
-                raise ValueError(f"Vehicle {plate} already has an active parking record")
         
         # Check for active subscription
         from datetime import date
@@ -77,10 +93,7 @@ class VehicleEntryUseCase:
             raise ValueError(f"No active rate found for vehicle type: {vehicle_type}")
         
         # Calculate helmet charge if applicable
-        helmet_charge = 0
-        if helmet_count > 0:
-            # Helmet charge: 1000 pesos (100000 centavos) per helmet
-            helmet_charge = helmet_count * 100000
+        helmet_charge = helmet_charge_for(helmet_count)
         
         # Create parking record
         parking_record = ParkingRecord(
@@ -100,7 +113,12 @@ class VehicleEntryUseCase:
             notes=notes
         )
         
-        # Save parking record
+        # Save parking record: a concurrent entry for the same vehicle is
+        # rejected by the unique partial index (same ValueError)
         parking_record = await self.parking_record_repo.create(parking_record)
         
+        if self.occupancy_index is not None:
+            index = self.occupancy_index
+            self.after_commit(lambda: index.add(vehicle, parking_record))
+        
         return parking_record
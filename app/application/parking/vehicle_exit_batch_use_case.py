@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from app.application.dto.parking.exit_request import ExitRequest
+from app.domain.parking.entities.parking_record import ParkingRecord
+from app.domain.parking.repositories.parking_record_repository import IParkingRecordRepository
+from app.domain.parking.repositories.rate_repository import IRateRepository
+from app.domain.agreements.repositories.agreement_repository import IAgreementRepository
+from app.domain.washing.repositories.washing_service_repository import IWashingServiceRepository
+from app.domain.parking.services.occupancy_index import AfterCommit, OccupancyIndex
+from app.domain.parking.services.tariff_engine import TariffInput, TariffTables, price_records
+
+
+@dataclass
+class ExitBatchItemResult:
+    """Resultado de una salida del lote: el registro cerrado (recibo) o el motivo del rechazo."""
+    index: int
+    plate: str
+    record: Optional[ParkingRecord] = None
+    error: Optional[str] = None
+
+    @property
+    def closed(self) -> bool:
+        return self.record is not None
+
+
+class VehicleExitBatchUseCase:
+    """
+    Registra un lote de salidas con consultas por conjunto.
+
+    Registros activos (con su vehículo), lavados, convenios y tarifas se cargan
+    con una consulta cada uno, el cobro de todo el lote se calcula en memoria con
+    el motor de tarifas (price_records) y todos los registros se cierran con un solo
+    UPDATE ... FROM (VALUES ...). Una salida inválida se reporta en su
+    resultado sin rechazar el resto del lote.
+    """
+
+    def __init__(
+        self,
+        parking_record_repo: IParkingRecordRepository,
+        rate_repo: IRateRepository,
+        agreement_repo: IAgreementRepository,
+        washing_repo: IWashingServiceRepository,
+        occupancy_index: Optional[OccupancyIndex] = None,
+        after_commit: Optional[AfterCommit] = None
+    ):
+        self.parking_record_repo = parking_record_repo
+        self.rate_repo = rate_repo
+        self.agreement_repo = agreement_repo
+        self.washing_repo = washing_repo
+        self.occupancy_index = occupancy_index
+        # Sin unidad de trabajo (repositorios que confirman solos) se aplica en el acto
+        self.after_commit = after_commit or (lambda callback: callback())
+
+    async def execute(self, exits: List[ExitRequest]) -> List[ExitBatchItemResult]:
+        results = [
+            ExitBatchItemResult(index=i, plate=item.plate.upper().strip())
+            for i, item in enumerate(exits)
+        ]
+
+        # Una placa repetida dentro del lote: solo cuenta la primera
+        pending: Dict[str, int] = {}
+        for result in results:
+            if result.plate in pending:
+                result.error = f"Vehicle {result.plate} is repeated in the batch"
+            else:
+                pending[result.plate] = result.index
+
+        # Filas bloqueadas y leídas de la BD, como en VehicleExitUseCase: se cobra el estado actual
+        active = await self.parking_record_repo.get_active_with_vehicles_by_plates(list(pending), lock=True)
+        for plate, i in list(pending.items()):
+            if plate not in active:
+                results[i].error = f"No active parking record found for vehicle {plate}"
+                del pending[plate]
+        if not pending:
+            return results
+
+        records = [active[plate][1] for plate in pending]
+        washing_services = await self.washing_repo.get_by_ids(
+            r.washing_service_id for r in records if r.washing_service_id
+        )
+        # Con suscripción el parqueo es gratis: ni convenio ni tarifa
+        agreements = await self.agreement_repo.get_agreements_by_vehicle_ids(
+            [r.vehicle_id for r in records if not r.subscription_id]
+        )
+        rates = await self.rate_repo.get_by_ids(
+            r.parking_rate_id for r in records if not r.subscription_id
+        )
+
+        # Cobro en memoria de todo el lote (motor de tarifas vectorizado)
+        exit_time = datetime.now(timezone.utc)
+        batch = price_records(
+            [
+                TariffInput.for_record(
+                    vehicle,
+                    record,
+                    exit_time,
+                    washing_services[record.washing_service_id].service_type
+                    if record.washing_service_id in washing_services else None
+                )
+                for vehicle, record in (active[plate] for plate in pending)
+            ],
+            TariffTables(rates_by_id=rates, agreements_by_vehicle=agreements)
+        )
+
+        to_close: List[Tuple[str, ParkingRecord]] = []
+        for position, (plate, i) in enumerate(pending.items()):
+            record = active[plate][1]
+            if not batch.priced[position]:
+                results[i].error = "Rate not found for parking record"
+                continue
+
+            record.exit_time = exit_time
+            record.total_cost = int(batch.total_cost[position])
+            record.payment_status = "paid"  # Assuming immediate payment
+            if exits[i].notes:
+                record.notes = exits[i].notes
+            to_close.append((plate, record))
+
+        # Los registros que otra petición cerró entretanto no se cobran dos veces
+        closed = {
+            record.id: record
+            for record in await self.parking_record_repo.close_many([record for _, record in to_close])
+        }
+        removed: List[str] = []
+        for plate, record in to_close:
+            i = pending[plate]
+            results[i].record = closed.get(record.id)
+            if results[i].record is None:
+                results[i].error = f"No active parking record found for vehicle {plate}"
+                continue
+            removed.append(plate)
+
+        if self.occupancy_index is not None and removed:
+            index = self.occupancy_index
+
+            def remove_from_index() -> None:
+                for plate in removed:
+                    index.remove(plate)
+
+            # El índice cambia solo si el lote se confirma
+            self.after_commit(remove_from_index)
+        return results
@@ -1,13 +1,15 @@
 from datetime import datetime, timezone, date
-from typing import Optional
+from typing import Optional, Tuple
 from app.domain.parking.entities.parking_record import ParkingRecord
+from app.domain.parking.entities.vehicle import Vehicle
 from app.domain.parking.repositories.vehicle_repository import IVehicleRepository
-from app.core.washing_config import WashingServiceConfig
 from app.domain.parking.repositories.parking_record_repository import IParkingRecordRepository
 from app.domain.parking.repositories.rate_repository import IRateRepository
 from app.domain.subscriptions.repositories.subscription_repository import ISubscriptionRepository
 from app.domain.agreements.repositories.agreement_repository import IAgreementRepository
 from app.domain.washing.repositories.washing_service_repository import IWashingServiceRepository
+from app.domain.parking.services.occupancy_index import AfterCommit, OccupancyIndex
+from app.domain.parking.services.tariff_engine import TariffInput, TariffTables, price_record
 
 
 class VehicleExitUseCase:
@@ -20,7 +22,9 @@ class VehicleExitUseCase:
         rate_repo: IRateRepository,
         subscription_repo: ISubscriptionRepository,
         agreement_repo: IAgreementRepository,
-        washing_repo: IWashingServiceRepository
+        washing_repo: IWashingServiceRepository,
+        occupancy_index: Optional[OccupancyIndex] = None,
+        after_commit: Optional[AfterCommit] = None
     ):
         self.vehicle_repo = vehicle_repo
         self.parking_record_repo = parking_record_repo
@@ -28,6 +32,9 @@ class VehicleExitUseCase:
         self.subscription_repo = subscription_repo
         self.agreement_repo = agreement_repo
         self.washing_repo = washing_repo
+        self.occupancy_index = occupancy_index
+        # Sin unidad de trabajo (repositorios que confirman solos) se aplica en el acto
+        self.after_commit = after_commit or (lambda callback: callback())
     
     async def execute(
         self,
@@ -56,94 +63,64 @@ class VehicleExitUseCase:
         # Normalize plate to uppercase
         plate = plate.upper().strip()
         
-        # Find vehicle
-        vehicle = await self.vehicle_repo.get_by_plate(plate)
-        if not vehicle:
-            raise ValueError(f"Vehicle with plate {plate} not found")
-        
-        # Find active parking record
-        parking_record = await self.parking_record_repo.get_active_by_vehicle_id(vehicle.id)
-        if not parking_record:
-            raise ValueError(f"No active parking record found for vehicle {plate}")
+        # Find vehicle and its active parking record (locked until commit)
+        vehicle, parking_record = await self._find_active(plate)
         
         # Set exit time
         exit_time = datetime.now(timezone.utc)
         parking_record.exit_time = exit_time
         
-        # Calculate parking duration in minutes
-        duration = exit_time - parking_record.entry_time
-        minutes_total = duration.total_seconds() / 60
-        
-        # Check for free parking minutes from washing service
-        free_minutes = 0
+        # Linked washing service (its free minutes are applied by the engine)
+        washing_service_type = None
         if parking_record.washing_service_id:
             washing_service = await self.washing_repo.get_by_id(parking_record.washing_service_id)
             if washing_service:
-                # Get free minutes from config
-                free_minutes = WashingServiceConfig.get_free_minutes(
-                    vehicle.vehicle_type,
-                    washing_service.service_type
-                )
-        
-        # Apply free minutes
-        billable_minutes = max(0, minutes_total - free_minutes)
+                washing_service_type = washing_service.service_type
         
-        # Convert to hours (rounded up)
-        import math
-        hours_rounded = max(1, math.ceil(billable_minutes / 60))
-        
-        # If billable minutes is 0 (covered by free time), cost should be 0?
-        # Rule: "La tarifa mínima es de 1 minuto." -> If billable > 0, min 1 hour charge usually.
-        # But if fully covered by free time, it should be 0.
-        if billable_minutes == 0:
-            hours_rounded = 0
-        
-        # Initialize parking cost
-        parking_cost = 0
-        
-        # Check if vehicle has active subscription
-        if parking_record.subscription_id:
-            # Subscription: parking is free, only charge helmets
-            parking_cost = 0
-        else:
-            # No subscription: check for agreement or apply standard rate
+        # With a subscription parking is free: no agreement or rate needed
+        agreement = rate = None
+        if not parking_record.subscription_id:
             agreement = await self.agreement_repo.get_agreement_by_vehicle_id(vehicle.id)
-            
-            if agreement and agreement.is_active == "active":
-                # Has active agreement
-                if agreement.special_rate:
-                    # Use special rate (fixed rate per hour)
-                    parking_cost = agreement.special_rate * hours_rounded
-                else:
-                    # Apply discount percentage to standard rate
-                    rate = await self.rate_repo.get_by_id(parking_record.parking_rate_id)
-                    if not rate:
-                        raise ValueError(f"Rate not found for parking record")
-                    
-                    standard_cost = rate.price * hours_rounded
-                    discount = standard_cost * (agreement.discount_percentage / 100)
-                    parking_cost = standard_cost - discount
-            else:
-                # No agreement: use standard rate
+            if not (agreement and agreement.is_active == "active" and agreement.special_rate):
                 rate = await self.rate_repo.get_by_id(parking_record.parking_rate_id)
-                if not rate:
-                    raise ValueError(f"Rate not found for parking record")
-                
-                parking_cost = rate.price * hours_rounded
         
-        # Calculate total cost (parking + helmet charge)
-        total_cost = int(parking_cost) + parking_record.helmet_charge
+        quote = price_record(
+            TariffInput.for_record(vehicle, parking_record, exit_time, washing_service_type),
+            TariffTables(
+                rates_by_id={rate.id: rate} if rate else {},
+                agreements_by_vehicle={vehicle.id: agreement} if agreement else {}
+            )
+        )
         
-        parking_record.total_cost = total_cost
+        parking_record.total_cost = quote.total_cost
         parking_record.payment_status = "paid"  # Assuming immediate payment
         
         if notes:
             parking_record.notes = notes
         
-        # Update parking record
-        updated_record = await self.parking_record_repo.update(
-            parking_record.id,
-            parking_record
-        )
+        # Close parking record (only if nobody closed it in the meantime)
+        updated_record = await self.parking_record_repo.close(parking_record)
+        
+        if updated_record is None:
+            raise ValueError(f"No active parking record found for vehicle {plate}")
+        
+        if self.occupancy_index is not None:
+            index = self.occupancy_index
+            self.after_commit(lambda: index.remove(plate))
         
         return updated_record
+
+    async def _find_active(self, plate: str) -> Tuple[Vehicle, ParkingRecord]:
+        """
+        Vehicle and active record for a plate, read from the database in one
+        query and locked FOR UPDATE. The occupancy index copy is not used for
+        pricing: a washing service, subscription or helmet change made by
+        another worker would be missing from it.
+        """
+        active = await self.parking_record_repo.get_active_with_vehicles_by_plates([plate], lock=True)
+        if plate in active:
+            return active[plate]
+        
+        if not await self.vehicle_repo.get_by_plate(plate):
+            raise ValueError(f"Vehicle with plate {plate} not found")
+        raise ValueError(f"No active parking record found for vehicle {plate}")
@@ -0,0 +1,61 @@
+import asyncio
+import logging
+from app.domain.parking.repositories.pricing_catalog_repository import IPricingCatalogRepository
+from app.domain.parking.services.pricing_catalog import PricingCatalog, pricing_catalog
+from app.infrastructure.repositories.parking.pricing_catalog_repository_impl import PricingCatalogRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+class SyncPricingCatalogUseCase:
+    """Use case for keeping the in-memory pricing catalogue in step with the database"""
+
+    def __init__(self, catalog_repo: IPricingCatalogRepository, catalog: PricingCatalog):
+        self.catalog_repo = catalog_repo
+        self.catalog = catalog
+
+    async def load(self) -> bool:
+        """
+        Load rates and agreements. The version is read first: a write that
+        lands during the load bumps it again, so the next refresh reloads.
+        """
+        version = await self.catalog_repo.get_version()
+        rates = await self.catalog_repo.list_rates()
+        agreements = await self.catalog_repo.list_agreements_by_vehicle()
+        return self.catalog.load(version, rates, agreements)
+
+    async def refresh(self) -> bool:
+        """Reload only when the shared version changed (one indexed read otherwise)."""
+        version = await self.catalog_repo.get_version()
+        if self.catalog.is_ready and version == self.catalog.version:
+            return False
+        return await self.load()
+
+    async def publish(self) -> None:
+        """
+        Called after a rate or agreement write: bump the shared version so every
+        worker reloads, and reload this one right away. If the reload fails the
+        catalogue stays invalidated (database lookups) until the next refresh.
+        """
+        version = await self.catalog_repo.bump_version()
+        if not self.catalog.is_loaded:
+            return
+        self.catalog.invalidate(min_version=version)
+        try:
+            await self.load()
+        except Exception:
+            logger.exception("Pricing catalogue reload failed")
+
+
+async def run_pricing_catalog_sync(use_case: SyncPricingCatalogUseCase, interval_seconds: float) -> None:
+    """Background loop started with the application; errors never stop it."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await use_case.refresh()
+        except Exception:
+            logger.exception("Pricing catalogue refresh failed")
+
+
+# Instancia del proceso: la usan el arranque, el job y los casos de uso que escriben
+pricing_catalog_sync = SyncPricingCatalogUseCase(PricingCatalogRepositoryImpl(), pricing_catalog)
@@ -0,0 +1,150 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.reporting.services.export_registry import ChangeWindow, DatasetExporter, ReportExporterRegistry
+from app.domain.reporting.services.export_service import ReportColumn
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.reporting.analytics_export_repository_impl import AnalyticsExportRepositoryImpl
+
+# Raw history tables for the nightly analytics sync. Values are not formatted:
+# money is integer cents, timestamps keep their zone and low-cardinality text
+# (vehicle type, payment status, ...) is a category (dictionary) column.
+
+_CREATED_UPDATED = [
+    ReportColumn("created_at", "Created At", "datetime"),
+    ReportColumn("updated_at", "Updated At", "datetime"),
+]
+
+PARKING_RECORD_COLUMNS = [
+    ReportColumn("id", "ID", "int"),
+    ReportColumn("vehicle_id", "Vehicle ID", "int"),
+    ReportColumn("plate", "Plate"),
+    ReportColumn("vehicle_type", "Vehicle Type", "category"),
+    ReportColumn("entry_time", "Entry Time", "datetime"),
+    ReportColumn("exit_time", "Exit Time", "datetime"),
+    ReportColumn("parking_rate_id", "Rate ID", "int"),
+    ReportColumn("subscription_id", "Subscription ID", "int"),
+    ReportColumn("washing_service_id", "Washing Service ID", "int"),
+    ReportColumn("helmet_count", "Helmets", "int"),
+    ReportColumn("helmet_charge", "Helmet Charge", "money"),
+    ReportColumn("total_cost", "Total Cost", "money"),
+    ReportColumn("payment_status", "Payment Status", "category"),
+    ReportColumn("shift_id", "Shift ID", "int"),
+    ReportColumn("admin_id", "Admin ID", "int"),
+    *_CREATED_UPDATED,
+]
+
+WASHING_SERVICE_COLUMNS = [
+    ReportColumn("id", "ID", "int"),
+    ReportColumn("vehicle_id", "Vehicle ID", "int"),
+    ReportColumn("plate", "Plate"),
+    ReportColumn("vehicle_type", "Vehicle Type", "category"),
+    ReportColumn("parking_record_id", "Parking Record ID", "int"),
+    ReportColumn("washer_id", "Washer ID", "int"),
+    ReportColumn("service_type", "Service Type", "category"),
+    ReportColumn("service_date", "Service Date", "datetime"),
+    ReportColumn("start_time", "Start Time", "datetime"),
+    ReportColumn("end_time", "End Time", "datetime"),
+    ReportColumn("price", "Price", "money"),
+    ReportColumn("payment_status", "Payment Status", "category"),
+    ReportColumn("shift_id", "Shift ID", "int"),
+    ReportColumn("admin_id", "Admin ID", "int"),
+    *_CREATED_UPDATED,
+]
+
+EXPENSE_COLUMNS = [
+    ReportColumn("id", "ID", "int"),
+    ReportColumn("shift_id", "Shift ID", "int"),
+    ReportColumn("expense_type", "Expense Type", "category"),
+    ReportColumn("amount", "Amount", "money"),
+    ReportColumn("description", "Description"),
+    ReportColumn("expense_date", "Expense Date", "date"),
+    *_CREATED_UPDATED,
+]
+
+BONUS_COLUMNS = [
+    ReportColumn("id", "ID", "int"),
+    ReportColumn("washer_id", "Washer ID", "int"),
+    ReportColumn("shift_id", "Shift ID", "int"),
+    ReportColumn("amount", "Amount", "money"),
+    ReportColumn("reason", "Reason"),
+    ReportColumn("bonus_date", "Bonus Date", "date"),
+    *_CREATED_UPDATED,
+]
+
+SUBSCRIPTION_COLUMNS = [
+    ReportColumn("id", "ID", "int"),
+    ReportColumn("vehicle_id", "Vehicle ID", "int"),
+    ReportColumn("plate", "Plate"),
+    ReportColumn("vehicle_type", "Vehicle Type", "category"),
+    ReportColumn("start_date", "Start Date", "date"),
+    ReportColumn("end_date", "End Date", "date"),
+    ReportColumn("monthly_fee", "Monthly Fee", "money"),
+    ReportColumn("payment_status", "Payment Status", "category"),
+    *_CREATED_UPDATED,
+]
+
+
+async def open_dataset_stream(
+    exporter: DatasetExporter, since: Optional[datetime], lag_seconds: int
+) -> Tuple[ChangeWindow, AsyncIterator[Dict[str, Any]]]:
+    """
+    Change window and rows of `exporter`, both read in one session: `until` is
+    now() - lag on the database clock (the one that writes updated_at), not on
+    the app server's. The session is closed once the rows are consumed.
+    """
+    session = SessionLocal()
+    try:
+        repository = AnalyticsExportRepositoryImpl(session)
+        window = ChangeWindow(since, await repository.get_watermark(lag_seconds))
+    except BaseException:
+        await session.close()
+        raise
+    return window, _closing(exporter.rows(repository, window), session)
+
+
+async def _closing(rows: AsyncIterator[Dict[str, Any]], session: AsyncSession) -> AsyncIterator[Dict[str, Any]]:
+    # The response streams after the route returns: the rows own the session
+    try:
+        async for row in rows:
+            yield row
+    finally:
+        await session.close()
+
+
+def build_dataset_exporters() -> ReportExporterRegistry[DatasetExporter]:
+    registry: ReportExporterRegistry[DatasetExporter] = ReportExporterRegistry()
+    registry.register(DatasetExporter(
+        name="parking-records",
+        title="Parking Records",
+        columns=PARKING_RECORD_COLUMNS,
+        rows=lambda repository, w: repository.stream_parking_records(w.since, w.until),
+    ))
+    registry.register(DatasetExporter(
+        name="washing-services",
+        title="Washing Services",
+        columns=WASHING_SERVICE_COLUMNS,
+        rows=lambda repository, w: repository.stream_washing_services(w.since, w.until),
+    ))
+    registry.register(DatasetExporter(
+        name="expenses",
+        title="Expenses",
+        columns=EXPENSE_COLUMNS,
+        rows=lambda repository, w: repository.stream_expenses(w.since, w.until),
+    ))
+    registry.register(DatasetExporter(
+        name="bonuses",
+        title="Bonuses",
+        columns=BONUS_COLUMNS,
+        rows=lambda repository, w: repository.stream_bonuses(w.since, w.until),
+    ))
+    registry.register(DatasetExporter(
+        name="subscriptions",
+        title="Monthly Subscriptions",
+        columns=SUBSCRIPTION_COLUMNS,
+        rows=lambda repository, w: repository.stream_subscriptions(w.since, w.until),
+    ))
+    return registry
+
+
+dataset_exporters = build_dataset_exporters()
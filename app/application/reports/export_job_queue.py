@@ -0,0 +1,251 @@
+import asyncio
+import logging
+import os
+import re
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from app.application.reports.report_exporters import report_exporters
+from app.core.config import settings
+from app.core.datetime_utils import business_today
+from app.domain.reporting.entities.export_job import ExportJob, QUEUED, RUNNING, DONE, FAILED
+from app.domain.reporting.services.export_registry import ReportExporterRegistry, ReportExportParams
+from app.domain.reporting.services.export_service import ExportService, EXPORT_FORMATS
+
+logger = logging.getLogger(__name__)
+
+# Only files named like a job artifact are ever deleted from the export directory
+_JOB_FILE = re.compile(r"^[0-9a-f]{32}\.(csv|xlsx|parquet|arrows|pdf)(\.part)?$")
+
+
+class ExportJobQueue:
+    """
+    In-process queue of export jobs.
+
+    Any report of the exporter registry can be queued. Workers are asyncio
+    tasks; the CPU-heavy parts of each export (xlsx cells, Parquet row groups,
+    PDF pages) already run in worker threads, so they don't block the loop.
+    Finished files stay in `directory` for `ttl_seconds`. A request for the same
+    report, parameters and format while a job is queued, running or still
+    downloadable returns that job instead of building the file again, unless
+    the finished file covers today: today's data keeps changing.
+
+    Jobs live in this process only: with several server workers, poll and
+    download from the worker that accepted the job (sticky sessions) or run a
+    single worker for exports.
+    """
+
+    def __init__(
+        self,
+        registry: ReportExporterRegistry,
+        export_service: ExportService,
+        directory: str,
+        workers: int = 2,
+        ttl_seconds: int = 3600,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        self.registry = registry
+        self.export_service = export_service
+        self.directory = directory
+        self.workers = workers
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.clock = clock
+        self.jobs: Dict[str, ExportJob] = {}
+        self._by_key: Dict[tuple, str] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return self._queue is not None
+
+    async def start(self, gc_interval_seconds: int = 300) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._remove_orphans()
+
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._gc_loop(gc_interval_seconds)))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def submit(
+        self,
+        report: str,
+        start_date: date,
+        end_date: date,
+        format: str,
+        group_by: str = "day",
+        bucket_minutes: int = 60,
+        requested_by: Optional[int] = None
+    ) -> Tuple[ExportJob, bool]:
+        """Enqueue an export. Returns (job, created); created is False for a reused job."""
+        if not self.running:
+            raise RuntimeError("Export job queue is not running")
+        exporter = self.registry.get(report)
+        if format not in exporter.formats:
+            raise ValueError(f"Unsupported format for {report}: {format}")
+        # Validates the range before anything is queued
+        ReportExportParams(start_date, end_date, group_by, bucket_minutes)
+
+        job = ExportJob(
+            id=uuid.uuid4().hex,
+            report=report,
+            start_date=start_date,
+            end_date=end_date,
+            format=format,
+            group_by=group_by,
+            bucket_minutes=bucket_minutes,
+            requested_by=requested_by,
+            created_at=self.clock(),
+        )
+        existing = self.jobs.get(self._by_key.get(job.dedup_key, ""))
+        if existing is not None and self._reusable(existing):
+            return existing, False
+
+        self.jobs[job.id] = job
+        self._by_key[job.dedup_key] = job.id
+        self._queue.put_nowait(job)
+        return job, True
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        job = self.jobs.get(job_id)
+        if job is not None and self._expired(job):
+            return None
+        return job
+
+    def _expired(self, job: ExportJob) -> bool:
+        return job.expires_at is not None and job.expires_at <= self.clock()
+
+    def _reusable(self, job: ExportJob) -> bool:
+        if job.status in (QUEUED, RUNNING):
+            return True
+        # A finished file that includes today misses everything recorded since
+        return job.status == DONE and not self._expired(job) and job.end_date < business_today()
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception("Export job %s failed", job.id)
+                job.status = FAILED
+                job.error = str(e)
+                job.finished_at = self.clock()
+                job.expires_at = job.finished_at + self.ttl
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: ExportJob) -> None:
+        job.status = RUNNING
+        job.started_at = self.clock()
+        exporter = self.registry.get(job.report)
+        params = ReportExportParams(job.start_date, job.end_date, job.group_by, job.bucket_minutes)
+        if exporter.count is not None:
+            job.total_rows = await exporter.count(params)
+
+        async def counted_rows() -> AsyncIterator[Dict[str, Any]]:
+            async for row in exporter.rows(params):
+                job.rows_written += 1
+                yield row
+
+        stream = await self.export_service.export_rows(counted_rows(), exporter.columns, job.format, exporter.title)
+
+        _, extension = EXPORT_FORMATS[job.format]
+        path = os.path.join(self.directory, f"{job.id}.{extension}")
+        partial = f"{path}.part"
+        try:
+            await self._write(stream, partial)
+            os.replace(partial, path)
+        except BaseException:
+            self._remove_file(partial)
+            raise
+
+        job.file_path = path
+        job.file_size = os.path.getsize(path)
+        job.status = DONE
+        job.finished_at = self.clock()
+        job.expires_at = job.finished_at + self.ttl
+
+    @staticmethod
+    async def _write(stream: Union[AsyncIterator[bytes], Iterator[bytes]], path: str) -> None:
+        file = await asyncio.to_thread(open, path, "wb")
+        try:
+            if hasattr(stream, "__aiter__"):
+                async for chunk in stream:
+                    await asyncio.to_thread(file.write, chunk)
+            else:
+                # Chunks of an already generated file: read and write off the loop
+                def copy() -> None:
+                    for chunk in stream:
+                        file.write(chunk)
+                await asyncio.to_thread(copy)
+        finally:
+            await asyncio.to_thread(file.close)
+
+    def collect_garbage(self) -> int:
+        """Forget expired jobs and delete their files. Returns how many were removed."""
+        expired = [job for job in self.jobs.values() if self._expired(job)]
+        for job in expired:
+            del self.jobs[job.id]
+            if self._by_key.get(job.dedup_key) == job.id:
+                del self._by_key[job.dedup_key]
+            if job.file_path:
+                self._remove_file(job.file_path)
+        return len(expired) + self._remove_orphans()
+
+    def _remove_orphans(self) -> int:
+        """
+        Delete artifacts no job of this process tracks (e.g. left by a previous
+        run) once they are older than the TTL. The directory is shared by every
+        server worker, so younger files may be another worker's live job.
+        """
+        tracked = {job.file_path for job in self.jobs.values() if job.file_path}
+        cutoff = (self.clock() - self.ttl).timestamp()
+        removed = 0
+        for entry in os.scandir(self.directory):
+            if not _JOB_FILE.match(entry.name) or entry.path in tracked:
+                continue
+            try:
+                stale = entry.stat().st_mtime < cutoff
+            except FileNotFoundError:
+                continue
+            if stale:
+                self._remove_file(entry.path)
+                removed += 1
+        return removed
+
+    async def _gc_loop(self, interval_seconds: int) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = self.collect_garbage()
+                if removed:
+                    logger.info("Removed %s expired export job(s)", removed)
+            except Exception:
+                logger.exception("Export job garbage collection failed")
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+export_job_queue = ExportJobQueue(
+    report_exporters,
+    ExportService(),
+    directory=settings.EXPORT_JOB_DIR,
+    workers=settings.EXPORT_JOB_WORKERS,
+    ttl_seconds=settings.EXPORT_JOB_TTL_SECONDS,
+)
@@ -1,55 +1,152 @@
 from datetime import date
-from typing import IO
+from typing import IO, Any, AsyncIterator, Dict, Iterator, Union
 from app.domain.parking.repositories.parking_record_repository import IParkingRecordRepository
-from app.domain.reporting.services.export_service import ExportService
-from app.domain.parking.repositories.vehicle_repository import IVehicleRepository
+from app.core.datetime_utils import to_local_naive
+from app.domain.reporting.services.export_service import ExportService, ExcelColumn, PdfColumn, ReportColumn
+
+PARKING_HISTORY_COLUMNS = [
+    "ID", "Plate", "Entry Time", "Exit Time", "Duration (Hours)", "Total Cost", "Status", "Notes"
+]
+
+# Same columns as the CSV, but typed: Excel gets real dates and numbers
+PARKING_HISTORY_EXCEL_COLUMNS = [
+    ExcelColumn("ID", "id", width=10),
+    ExcelColumn("Plate", "plate", width=12),
+    ExcelColumn("Entry Time", "entry_time", number_format="yyyy-mm-dd hh:mm:ss", width=20),
+    ExcelColumn("Exit Time", "exit_time", number_format="yyyy-mm-dd hh:mm:ss", width=20),
+    ExcelColumn("Duration (Hours)", "duration_hours", number_format="0.00", width=16),
+    ExcelColumn("Total Cost", "total_cost", number_format='"$"#,##0', width=14),
+    ExcelColumn("Status", "payment_status", width=12),
+    ExcelColumn("Notes", "notes", width=40),
+]
+
+# Fixed widths (points) for a landscape letter page with 36 pt margins
+PARKING_HISTORY_PDF_COLUMNS = [
+    PdfColumn("ID", "ID", 50),
+    PdfColumn("Plate", "Plate", 70),
+    PdfColumn("Entry Time", "Entry Time", 110),
+    PdfColumn("Exit Time", "Exit Time", 110),
+    PdfColumn("Duration (Hours)", "Duration (Hours)", 80),
+    PdfColumn("Total Cost", "Total Cost", 80),
+    PdfColumn("Status", "Status", 70),
+    PdfColumn("Notes", "Notes", 150),
+]
+
 
 class ExportReportsUseCase:
     """Use case for exporting reports"""
+
+    # Typed columns used by the generic exporters (raw cents and aware datetimes)
+    EXPORT_COLUMNS = [
+        ReportColumn("id", "ID", "int"),
+        ReportColumn("plate", "Plate", "str"),
+        ReportColumn("entry_time", "Entry Time", "datetime"),
+        ReportColumn("exit_time", "Exit Time", "datetime"),
+        ReportColumn("duration_hours", "Duration (Hours)", "float"),
+        ReportColumn("total_cost", "Total Cost", "money"),
+        ReportColumn("payment_status", "Status", "category"),
+        ReportColumn("notes", "Notes", "str"),
+    ]
     
     def __init__(
         self,
         parking_record_repo: IParkingRecordRepository,
-        vehicle_repo: IVehicleRepository,
         export_service: ExportService
     ):
         self.parking_record_repo = parking_record_repo
-        self.vehicle_repo = vehicle_repo
         self.export_service = export_service
+
+    @staticmethod
+    def _format_history_row(row: Dict[str, Any]) -> Dict[str, str]:
+        entry_time = row["entry_time"]
+        exit_time = row["exit_time"]
+        return {
+            "ID": row["id"],
+            "Plate": row["plate"] or "Unknown",
+            "Entry Time": to_local_naive(entry_time).strftime("%Y-%m-%d %H:%M:%S"),
+            "Exit Time": to_local_naive(exit_time).strftime("%Y-%m-%d %H:%M:%S") if exit_time else "Active",
+            "Duration (Hours)": f"{(exit_time - entry_time).total_seconds() / 3600:.2f}" if exit_time else "-",
+            "Total Cost": f"${(row['total_cost'] or 0) / 100:,.0f}",
+            "Status": row["payment_status"],
+            "Notes": row["notes"] or ""
+        }
+
+    @staticmethod
+    def _typed_history_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        entry_time = row["entry_time"]
+        exit_time = row["exit_time"]
+        return {
+            "id": row["id"],
+            "plate": row["plate"] or "Unknown",
+            "entry_time": to_local_naive(entry_time),
+            "exit_time": to_local_naive(exit_time),
+            "duration_hours": (exit_time - entry_time).total_seconds() / 3600 if exit_time else None,
+            "total_cost": (row["total_cost"] or 0) / 100,
+            "payment_status": row["payment_status"],
+            "notes": row["notes"] or None
+        }
+
+    async def iter_rows(self, start_date: date, end_date: date) -> AsyncIterator[Dict[str, Any]]:
+        """Rows for the exporters (see EXPORT_COLUMNS), straight from the cursor."""
+        async for row in self.parking_record_repo.stream_history(start_date, end_date):
+            entry_time = row["entry_time"]
+            exit_time = row["exit_time"]
+            yield {
+                "id": row["id"],
+                "plate": row["plate"],
+                "entry_time": entry_time,
+                "exit_time": exit_time,
+                "duration_hours": (exit_time - entry_time).total_seconds() / 3600 if exit_time else None,
+                "total_cost": row["total_cost"] or 0,
+                "payment_status": row["payment_status"],
+                "notes": row["notes"]
+            }
+
+    async def iter_parking_history(self, start_date: date, end_date: date) -> AsyncIterator[Dict[str, str]]:
+        """Formatted history rows, read from a cursor joined to vehicles (no per-row lookups)."""
+        async for row in self.parking_record_repo.stream_history(start_date, end_date):
+            yield self._format_history_row(row)
+
+    async def count_parking_history(self, start_date: date, end_date: date) -> int:
+        """Rows an export of the range will contain (used for job progress)."""
+        return await self.parking_record_repo.count_by_date_range(start_date, end_date)
     
     async def export_parking_history(
         self, 
         start_date: date, 
         end_date: date, 
         format: str = "csv"
-    ) -> IO:
+    ) -> Union[IO, Iterator[bytes], AsyncIterator[bytes]]:
         """
         Export parking history for a date range.
+
+        CSV is streamed: the result is an async iterator of chunks whose memory
+        use does not depend on the size of the range. Excel is written with
+        write-only sheets straight from the cursor (the zip container has to be
+        complete before sending it). PDF is drawn page by page in a worker
+        thread.
         """
-        records = await self.parking_record_repo.list_by_date_range(start_date, end_date)
-        
-        # Prepare data for export
-        data = []
-        for record in records:
-            vehicle = await self.vehicle_repo.get_by_id(record.vehicle_id)
-            plate = vehicle.plate if vehicle else "Unknown"
-            
-            data.append({
-                "ID": record.id,
-                "Plate": plate,
-                "Entry Time": record.entry_time.strftime("%Y-%m-%d %H:%M:%S"),
-                "Exit Time": record.exit_time.strftime("%Y-%m-%d %H:%M:%S") if record.exit_time else "Active",
-                "Duration (Hours)": f"{(record.exit_time - record.entry_time).total_seconds() / 3600:.2f}" if record.exit_time else "-",
-                "Total Cost": f"${record.total_cost / 100:,.0f}",
-                "Status": record.payment_status,
-                "Notes": record.notes or ""
-            })
-            
         if format.lower() == "csv":
-            return self.export_service.export_to_csv(data)
-        elif format.lower() == "excel":
-            return self.export_service.export_to_excel(data)
-        elif format.lower() == "pdf":
-            return self.export_service.export_to_pdf(data, title=f"Parking History Report ({start_date} to {end_date})")
-        else:
+            return self.export_service.stream_csv(
+                self.iter_parking_history(start_date, end_date), PARKING_HISTORY_COLUMNS
+            )
+
+        if format.lower() == "excel":
+            typed_rows = (
+                self._typed_history_row(row)
+                async for row in self.parking_record_repo.stream_history(start_date, end_date)
+            )
+            workbook = await self.export_service.export_to_excel_stream(
+                typed_rows, PARKING_HISTORY_EXCEL_COLUMNS, sheet_title="Parking History"
+            )
+            return self.export_service.iter_file(workbook)
+
+        if format.lower() != "pdf":
             raise ValueError(f"Unsupported format: {format}")
+
+        document = await self.export_service.export_to_pdf_paginated(
+            self.iter_parking_history(start_date, end_date),
+            PARKING_HISTORY_PDF_COLUMNS,
+            title=f"Parking History Report ({start_date} to {end_date})"
+        )
+        return self.export_service.iter_file(document)
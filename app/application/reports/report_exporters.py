@@ -0,0 +1,103 @@
+from app.application.reports.export_reports_use_case import ExportReportsUseCase
+from app.core.config import settings
+from app.domain.reporting.services.export_registry import ReportExporter, ReportExporterRegistry, ReportExportParams
+from app.domain.reporting.services.export_service import ExportService
+from app.domain.reporting.services.revenue_service import RevenueService
+from app.domain.reporting.services.performance_service import PerformanceService
+from app.domain.reporting.services.occupancy_reporting_service import OccupancyReportingService
+from app.domain.reporting.services.washing_analytics_service import WashingAnalyticsService
+from app.domain.reporting.services.activity_reporting_service import ActivityReportingService
+from app.domain.reporting.services.agreement_reporting_service import AgreementReportingService
+from app.domain.reporting.services.financial_rollup_service import FinancialRollupService
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.parking.parking_record_repository_impl import ParkingRecordRepositoryImpl
+from app.infrastructure.repositories.financial.expense_repository_impl import ExpenseRepositoryImpl
+from app.infrastructure.repositories.financial.bonus_repository_impl import BonusRepositoryImpl
+from app.infrastructure.repositories.reporting.financial_rollup_repository_impl import FinancialRollupRepositoryImpl
+from app.infrastructure.repositories.reporting.occupancy_reporting_repository_impl import OccupancyReportingRepositoryImpl
+from app.infrastructure.repositories.reporting.activity_reporting_repository_impl import ActivityReportingRepositoryImpl
+from app.infrastructure.repositories.reporting.agreement_reporting_repository_impl import AgreementReportingRepositoryImpl
+from app.infrastructure.repositories.washing.washing_service_repository_impl import WashingServiceRepositoryImpl
+
+# Every exporter builds its service per export with repositories that open
+# their own sessions: an export may outlive the request that started it.
+
+
+def _rollup_service():
+    if not settings.ROLLUP_ENABLED:
+        return None
+    return FinancialRollupService(FinancialRollupRepositoryImpl(), settings.ROLLUP_LOOKBACK_DAYS)
+
+
+def _parking_history():
+    return ExportReportsUseCase(ParkingRecordRepositoryImpl(), ExportService())
+
+
+async def _revenue_rows(params: ReportExportParams):
+    # The session is only used without rollups; it takes no connection until its first query
+    async with SessionLocal() as session:
+        service = RevenueService(session, _rollup_service())
+        async for row in service.iter_rows(params.start_date, params.end_date, params.group_by):
+            yield row
+
+
+async def _performance_rows(params: ReportExportParams):
+    async with SessionLocal() as session:
+        service = PerformanceService(session, ExpenseRepositoryImpl(), BonusRepositoryImpl(), _rollup_service())
+        async for row in service.iter_rows(params.start_date, params.end_date):
+            yield row
+
+
+def build_report_exporters() -> ReportExporterRegistry:
+    registry = ReportExporterRegistry()
+    registry.register(ReportExporter(
+        name="parking-history",
+        title="Parking History",
+        columns=ExportReportsUseCase.EXPORT_COLUMNS,
+        rows=lambda p: _parking_history().iter_rows(p.start_date, p.end_date),
+        count=lambda p: _parking_history().count_parking_history(p.start_date, p.end_date),
+    ))
+    registry.register(ReportExporter(
+        name="revenue",
+        title="Revenue",
+        columns=RevenueService.EXPORT_COLUMNS,
+        rows=_revenue_rows,
+    ))
+    registry.register(ReportExporter(
+        name="performance",
+        title="Performance",
+        columns=PerformanceService.EXPORT_COLUMNS,
+        rows=_performance_rows,
+    ))
+    registry.register(ReportExporter(
+        name="occupancy",
+        title="Occupancy",
+        columns=OccupancyReportingService.EXPORT_COLUMNS,
+        rows=lambda p: OccupancyReportingService(OccupancyReportingRepositoryImpl()).iter_rows(
+            p.start_date, p.end_date, p.bucket_minutes
+        ),
+    ))
+    registry.register(ReportExporter(
+        name="washing-analytics",
+        title="Washing Analytics",
+        columns=WashingAnalyticsService.EXPORT_COLUMNS,
+        rows=lambda p: WashingAnalyticsService(WashingServiceRepositoryImpl()).iter_rows(p.start_date, p.end_date),
+    ))
+    registry.register(ReportExporter(
+        name="activity",
+        title="Activity",
+        columns=ActivityReportingService.EXPORT_COLUMNS,
+        rows=lambda p: ActivityReportingService(ActivityReportingRepositoryImpl()).iter_rows(
+            p.start_date, p.end_date, p.group_by
+        ),
+    ))
+    registry.register(ReportExporter(
+        name="agreements",
+        title="Agreements",
+        columns=AgreementReportingService.EXPORT_COLUMNS,
+        rows=lambda p: AgreementReportingService(AgreementReportingRepositoryImpl()).iter_rows(p.start_date, p.end_date),
+    ))
+    return registry
+
+
+report_exporters = build_report_exporters()
@@ -5,6 +5,7 @@ from app.domain.washing.repositories.washing_service_repository import IWashingS
 from app.domain.parking.repositories.vehicle_repository import IVehicleRepository
 from app.domain.parking.repositories.parking_record_repository import IParkingRecordRepository
 from app.domain.parking.entities.vehicle import Vehicle
+from app.domain.parking.services.occupancy_index import AfterCommit, OccupancyIndex
 
 class CreateWashingServiceUseCase:
     """Use case for registering a new washing service"""
@@ -13,11 +14,16 @@ class CreateWashingServiceUseCase:
         self,
         washing_repo: IWashingServiceRepository,
         vehicle_repo: IVehicleRepository,
-        parking_record_repo: IParkingRecordRepository
+        parking_record_repo: IParkingRecordRepository,
+        occupancy_index: Optional[OccupancyIndex] = None,
+        after_commit: Optional[AfterCommit] = None
     ):
         self.washing_repo = washing_repo
         self.vehicle_repo = vehicle_repo
         self.parking_record_repo = parking_record_repo
+        self.occupancy_index = occupancy_index
+        # Sin unidad de trabajo (repositorios que confirman solos) se aplica en el acto
+        self.after_commit = after_commit or (lambda callback: callback())
     
     async def execute(
         self,
@@ -76,6 +82,9 @@ class CreateWashingServiceUseCase:
         # Update parking record to link to this washing service
         if active_record:
             active_record.washing_service_id = created_service.id
-            await self.parking_record_repo.update(active_record.id, active_record)
+            updated_record = await self.parking_record_repo.update(active_record.id, active_record)
+            if self.occupancy_index is not None:
+                index = self.occupancy_index
+                self.after_commit(lambda: index.update_record(plate, updated_record))
         
         return created_service
@@ -0,0 +1,52 @@
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Optional, Tuple
+from zoneinfo import ZoneInfo
+from app.core.config import settings
+
+
+def business_timezone() -> tzinfo:
+    """Zone that defines the business day: TIMEZONE if set, else the process local zone."""
+    if settings.TIMEZONE:
+        return ZoneInfo(settings.TIMEZONE)
+    return datetime.now().astimezone().tzinfo
+
+
+def business_today() -> date:
+    return datetime.now(business_timezone()).date()
+
+
+def day_bounds(day: date) -> Tuple[datetime, datetime]:
+    """
+    Half-open [start, end) timestamp range covering one business day.
+
+    Filtering with `col >= start AND col < end` keeps the plain b-tree index
+    on the column usable, unlike `func.date(col) == day`.
+    """
+    return date_range_bounds(day, day)
+
+
+def date_range_bounds(start_date: date, end_date: date) -> Tuple[datetime, datetime]:
+    """Half-open [start, end) timestamp range covering start_date..end_date inclusive."""
+    tz = business_timezone()
+    start = datetime.combine(start_date, time.min, tzinfo=tz)
+    end = datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=tz)
+    return start, end
+
+
+def business_date(value: datetime) -> date:
+    """Business day a timestamp falls on."""
+    return to_business_aware(value).astimezone(business_timezone()).date()
+
+
+def to_local_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Wall-clock time in the business zone without tzinfo (for formats with no zones, e.g. Excel)."""
+    if value is None:
+        return None
+    return value.astimezone(business_timezone()).replace(tzinfo=None)
+
+
+def to_business_aware(value: datetime) -> datetime:
+    """Aware datetime; naive values are read as wall-clock time in the business zone."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=business_timezone())
+    return value
@@ -1,11 +1,20 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Union, Optional
+from typing import Any, Union, Optional, Tuple
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
 ALGORITHM = settings.ALGORITHM
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# min = max = default: any hash made with a different cost is rehashed on the next login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
 
 def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None, additional_claims: dict = None) -> str:
     if expires_delta:
@@ -38,5 +47,48 @@ def verify_password_reset_token(token: str) -> Optional[str]:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+class PasswordHasher:
+    """
+    bcrypt off the event loop, on a bounded thread pool.
+
+    A hash or verify takes ~100-300 ms of CPU at cost 12; the bcrypt C
+    extension releases the GIL, so the pool runs up to `workers` of them in
+    parallel while the loop keeps serving other requests. Extra calls wait
+    in the pool queue instead of piling up threads.
+    """
+
+    def __init__(self, context: CryptContext, workers: int):
+        self.context = context
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _run(self, fn, *args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run(self.context.verify, password, password_hash)
+
+    async def verify_and_update(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify and, when the stored hash uses another cost (BCRYPT_ROUNDS
+        changed), also return a new hash to store. (False, None) if it fails.
+        """
+        return await self._run(self.context.verify_and_update, password, password_hash)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(pwd_context, workers=settings.PASSWORD_HASH_WORKERS)
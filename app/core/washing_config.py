@@ -27,17 +27,14 @@ class WashingServiceConfig:
         }
     }
     
+    # Case-insensitive index built once: {(vehicle_type, service_name.lower()): free_minutes}
+    _FREE_MINUTES_BY_KEY = {
+        (vehicle_type, name.lower()): minutes
+        for vehicle_type, services in _FREE_MINUTES.items()
+        for name, minutes in services.items()
+    }
+    
     @classmethod
     def get_free_minutes(cls, vehicle_type: str, service_name: str) -> int:
         """Get free parking minutes for a specific vehicle type and service (case-insensitive)"""
-        vehicle_config = cls._FREE_MINUTES.get(vehicle_type.lower())
-        if not vehicle_config:
-            return 0
-            
-        # Case-insensitive lookup for service name
-        service_name_lower = service_name.lower()
-        for name, minutes in vehicle_config.items():
-            if name.lower() == service_name_lower:
-                return minutes
-                
-        return 0
+        return cls._FREE_MINUTES_BY_KEY.get((vehicle_type.lower(), service_name.lower()), 0)
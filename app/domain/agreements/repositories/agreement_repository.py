@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date
 from app.domain.agreements.entities.agreement import Agreement
 
@@ -42,3 +42,8 @@ class IAgreementRepository(ABC):
     async def get_agreement_by_vehicle_id(self, vehicle_id: int) -> Optional[Agreement]:
         """Obtiene el convenio activo de un vehículo."""
         pass
+
+    @abstractmethod
+    async def get_agreements_by_vehicle_ids(self, vehicle_ids: List[int]) -> Dict[int, Agreement]:
+        """Convenio activo de cada vehículo que tiene uno, en una sola consulta."""
+        pass
@@ -4,6 +4,7 @@ from app.domain.financial.repositories.shift_repository import ShiftRepository
 from app.domain.financial.repositories.expense_repository import ExpenseRepository
 from app.domain.washing.repositories.washing_service_repository import IWashingServiceRepository
 from app.domain.parking.repositories.parking_record_repository import IParkingRecordRepository
+from app.infrastructure.cache.active_shift_cache import invalidate_active_shift
 
 class CloseShift:
     def __init__(
@@ -38,4 +39,6 @@ class CloseShift:
         shift.final_cash = shift.initial_cash + total_income - total_expenses
         
         # Save
-        return await self.shift_repository.save(shift)
+        shift = await self.shift_repository.save(shift)
+        invalidate_active_shift(admin_id)
+        return shift
@@ -1,6 +1,7 @@
 from datetime import datetime
 from app.domain.financial.entities.shift import Shift
 from app.domain.financial.repositories.shift_repository import ShiftRepository
+from app.infrastructure.cache.active_shift_cache import invalidate_active_shift
 
 class StartShift:
     def __init__(self, shift_repository: ShiftRepository):
@@ -21,4 +22,6 @@ class StartShift:
             total_expenses=0
         )
 
-        return await self.shift_repository.save(new_shift)
+        shift = await self.shift_repository.save(new_shift)
+        invalidate_active_shift(admin_id)
+        return shift
@@ -1,13 +1,33 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from datetime import date # Added import for date
+from typing import Any, AsyncIterator, Dict, Optional, List, Sequence, Tuple
+from datetime import date, datetime # Added import for date
 from app.domain.parking.entities.parking_record import ParkingRecord
+from app.domain.parking.entities.vehicle import Vehicle
+
+# Columnas que list_page puede proyectar. Las del vehículo agregan el join;
+# duration_seconds se calcula en SQL (hasta la salida o hasta ahora).
+PARKING_RECORD_VEHICLE_FIELDS = ("plate", "vehicle_type", "owner_name", "owner_phone", "brand", "model", "color")
+PARKING_RECORD_FIELDS = (
+    "id", "vehicle_id", "entry_time", "exit_time", "parking_rate_id", "subscription_id",
+    "washing_service_id", "helmet_count", "helmet_charge", "total_cost", "payment_status",
+    "notes", "shift_id", "admin_id",
+    *PARKING_RECORD_VEHICLE_FIELDS,
+    "duration_seconds",
+)
 
 class IParkingRecordRepository(ABC):
     @abstractmethod
     async def create(self, record: ParkingRecord) -> ParkingRecord:
         pass
 
+    @abstractmethod
+    async def create_many(self, records: List[ParkingRecord]) -> List[ParkingRecord]:
+        """
+        Inserta varios registros en un solo INSERT. Los de vehículos que ya
+        tienen un registro activo se omiten: solo se retornan los insertados.
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, record_id: int) -> Optional[ParkingRecord]:
         pass
@@ -23,3 +43,68 @@ class IParkingRecordRepository(ABC):
     @abstractmethod
     async def list_active(self) -> List[ParkingRecord]:
         pass
+
+    @abstractmethod
+    async def close(self, record: ParkingRecord) -> Optional[ParkingRecord]:
+        """Persist exit data only if the record is still active; None otherwise."""
+        pass
+
+    @abstractmethod
+    async def close_many(self, records: List[ParkingRecord]) -> List[ParkingRecord]:
+        """
+        Persist exit data for several records in one UPDATE. Records already
+        closed elsewhere are skipped: only the closed ones are returned.
+        """
+        pass
+
+    @abstractmethod
+    async def get_active_with_vehicles_by_plates(
+        self, plates: List[str], lock: bool = False
+    ) -> Dict[str, Tuple[Vehicle, ParkingRecord]]:
+        """
+        Vehicle and active record of each plate that is parked, in one query.
+        With `lock` the records are read FOR UPDATE, so they cannot change
+        before the caller's transaction ends (exit pricing).
+        """
+        pass
+
+    @abstractmethod
+    async def get_vehicle_with_active_record(
+        self, plate: str
+    ) -> Tuple[Optional[Vehicle], Optional[ParkingRecord]]:
+        """
+        Vehicle of the plate and its active record (None if it is not parked),
+        in one query; (None, None) when the plate is not registered.
+        """
+        pass
+
+    @abstractmethod
+    async def list_active_with_vehicles(self) -> List[Tuple[Vehicle, ParkingRecord]]:
+        pass
+
+    @abstractmethod
+    async def list_page(
+        self,
+        fields: Sequence[str],
+        status: str = 'all',
+        limit: int = 50,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        One page of records, newest first by (entry_time, id), with only `fields`
+        (names from PARKING_RECORD_FIELDS). `status` is 'all', 'active' or
+        'completed'; `after` is the (entry_time, id) of the previous page's last row.
+        """
+        pass
+
+    @abstractmethod
+    async def count_by_date_range(self, start_date: date, end_date: date) -> int:
+        pass
+
+    @abstractmethod
+    def stream_history(self, start_date: date, end_date: date, batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Records that entered in [start_date, end_date] joined to their plate,
+        newest first, fetched from a server-side cursor in batches.
+        """
+        pass
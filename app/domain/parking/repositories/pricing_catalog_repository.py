@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from app.domain.agreements.entities.agreement import Agreement
+from app.domain.parking.entities.rate import Rate
+
+
+class IPricingCatalogRepository(ABC):
+    @abstractmethod
+    async def get_version(self) -> int:
+        """Versión compartida actual del catálogo de precios."""
+        pass
+
+    @abstractmethod
+    async def bump_version(self) -> int:
+        """Incrementa la versión compartida y retorna la nueva."""
+        pass
+
+    @abstractmethod
+    async def list_rates(self) -> List[Rate]:
+        """Todas las tarifas, activas e inactivas."""
+        pass
+
+    @abstractmethod
+    async def list_agreements_by_vehicle(self) -> Dict[int, Agreement]:
+        """Convenio activo de cada vehículo asociado a uno."""
+        pass
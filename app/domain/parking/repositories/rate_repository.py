@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from app.domain.parking.entities.rate import Rate
 
 class IRateRepository(ABC):
@@ -7,10 +7,19 @@ class IRateRepository(ABC):
     async def get_active_by_type(self, vehicle_type: str, rate_type: str) -> Optional[Rate]:
         pass
 
+    @abstractmethod
+    async def get_active_by_types(self, vehicle_types: Iterable[str], rate_type: str) -> Dict[str, Rate]:
+        """Tarifa activa de cada tipo de vehículo, en una sola consulta."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, rate_id: int) -> Optional[Rate]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, rate_ids: Iterable[int]) -> Dict[int, Rate]:
+        pass
+
     @abstractmethod
     async def list_active(self) -> List[Rate]:
         pass
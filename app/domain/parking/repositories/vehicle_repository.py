@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 from app.domain.parking.entities.vehicle import Vehicle
 
 class IVehicleRepository(ABC):
@@ -7,10 +7,23 @@ class IVehicleRepository(ABC):
     async def get_by_plate(self, plate: str) -> Optional[Vehicle]:
         pass
 
+    @abstractmethod
+    async def get_by_plates(self, plates: List[str]) -> Dict[str, Vehicle]:
+        """Vehículos existentes por placa, en una sola consulta."""
+        pass
+
     @abstractmethod
     async def create(self, vehicle: Vehicle) -> Vehicle:
         pass
 
+    @abstractmethod
+    async def create_many(self, vehicles: List[Vehicle]) -> Dict[str, Vehicle]:
+        """
+        Inserta varios vehículos en un solo INSERT y los retorna por placa.
+        Una placa creada entretanto por otra petición se retorna tal como está.
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, vehicle_id: int) -> Optional[Vehicle]:
         pass
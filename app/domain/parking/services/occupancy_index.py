@@ -0,0 +1,186 @@
+"""
+Índice en memoria de la ocupación activa del parqueadero.
+
+Mantiene un mapa placa -> (vehículo, registro de parqueo activo) para responder
+"¿esta placa está parqueada?" sin ir a la base de datos. Se carga al iniciar la
+aplicación, se actualiza en cada entrada/salida y un job de reconciliación lo
+compara periódicamente contra la base de datos.
+
+El índice es por proceso: con varios workers cada uno tiene su copia, por eso
+los casos de uso lo tratan como una caché (un "no está" se confirma contra la
+base de datos cuando importa) y la reconciliación corrige las diferencias.
+"""
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from app.domain.parking.entities.vehicle import Vehicle
+from app.domain.parking.entities.parking_record import ParkingRecord
+
+# UnitOfWork.after_commit: los casos de uso cambian el índice solo cuando su
+# transacción confirma, para que un rollback no deje entradas fantasma
+AfterCommit = Callable[[Callable[[], None]], None]
+
+
+@dataclass
+class ActiveParking:
+    """Vehículo parqueado y su registro activo."""
+    vehicle: Vehicle
+    record: ParkingRecord
+
+
+@dataclass
+class ReconciliationReport:
+    """Diferencias encontradas entre el índice y la base de datos."""
+    active_in_db: int = 0
+    missing: List[str] = field(default_factory=list)
+    stale: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    reconciled_at: Optional[datetime] = None
+
+    @property
+    def in_sync(self) -> bool:
+        return not (self.missing or self.stale or self.changed)
+
+
+class OccupancyIndex:
+    """Mapa placa -> ActiveParking con operaciones O(1)."""
+
+    def __init__(self):
+        self._by_plate: Dict[str, ActiveParking] = {}
+        self._loaded = False
+        self._touched: Optional[Set[str]] = None
+        self.last_report: Optional[ReconciliationReport] = None
+
+    @staticmethod
+    def _key(plate: str) -> str:
+        return plate.upper().strip()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._by_plate)
+
+    def _touch(self, plate: str) -> None:
+        if self._touched is not None:
+            self._touched.add(plate)
+
+    def load(self, entries: Iterable[Tuple[Vehicle, ParkingRecord]]) -> None:
+        """Reemplaza todo el contenido con las entradas activas de la base de datos."""
+        self._by_plate = {
+            self._key(vehicle.plate): ActiveParking(vehicle=vehicle, record=record)
+            for vehicle, record in entries
+        }
+        self._loaded = True
+
+    def clear(self) -> None:
+        self._by_plate = {}
+        self._loaded = False
+
+    def get(self, plate: str) -> Optional[ActiveParking]:
+        return self._by_plate.get(self._key(plate))
+
+    def is_parked(self, plate: str) -> bool:
+        return self._key(plate) in self._by_plate
+
+    def add(self, vehicle: Vehicle, record: ParkingRecord) -> None:
+        key = self._key(vehicle.plate)
+        self._by_plate[key] = ActiveParking(vehicle=vehicle, record=record)
+        self._touch(key)
+
+    def update_record(self, plate: str, record: ParkingRecord) -> None:
+        """Actualiza el registro activo de una placa (p. ej. al vincular un lavado)."""
+        key = self._key(plate)
+        entry = self._by_plate.get(key)
+        if entry is not None and entry.record.id == record.id:
+            entry.record = record
+            self._touch(key)
+
+    def remove(self, plate: str) -> Optional[ActiveParking]:
+        key = self._key(plate)
+        self._touch(key)
+        return self._by_plate.pop(key, None)
+
+    def list_active(self) -> List[ActiveParking]:
+        """Entradas activas, de la más reciente a la más antigua."""
+        return sorted(
+            self._by_plate.values(),
+            key=lambda entry: entry.record.entry_time,
+            reverse=True
+        )
+
+    def list_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[ActiveParking]:
+        """
+        Como list_active pero por páginas, ordenadas por (entry_time, id): las
+        `limit` siguientes a `after`, sin ordenar todo el parqueadero.
+        """
+        entries: Iterable[ActiveParking] = self._by_plate.values()
+        if after is not None:
+            entries = (e for e in entries if (e.record.entry_time, e.record.id) < after)
+        return heapq.nlargest(limit, entries, key=lambda e: (e.record.entry_time, e.record.id))
+
+    def begin_reconciliation(self) -> None:
+        """
+        Empieza a registrar las placas modificadas mientras se consulta la base
+        de datos, para no pisar con la foto de la BD cambios más recientes.
+        """
+        self._touched = set()
+
+    def apply_snapshot(self, entries: Iterable[Tuple[Vehicle, ParkingRecord]]) -> ReconciliationReport:
+        """
+        Compara el índice contra la foto de la base de datos y la aplica, salvo
+        para las placas que cambiaron desde begin_reconciliation().
+        """
+        touched = self._touched or set()
+        self._touched = None
+
+        snapshot = {
+            self._key(vehicle.plate): ActiveParking(vehicle=vehicle, record=record)
+            for vehicle, record in entries
+        }
+        report = ReconciliationReport(
+            active_in_db=len(snapshot),
+            reconciled_at=datetime.now(timezone.utc)
+        )
+
+        for plate in set(snapshot) | set(self._by_plate):
+            if plate in touched:
+                report.skipped.append(plate)
+                continue
+
+            db_entry = snapshot.get(plate)
+            mem_entry = self._by_plate.get(plate)
+            if mem_entry is None:
+                report.missing.append(plate)
+                self._by_plate[plate] = db_entry
+            elif db_entry is None:
+                report.stale.append(plate)
+                del self._by_plate[plate]
+            elif mem_entry.record != db_entry.record or mem_entry.vehicle != db_entry.vehicle:
+                report.changed.append(plate)
+                self._by_plate[plate] = db_entry
+
+        self._loaded = True
+        self.last_report = report
+        return report
+
+    def stats(self) -> dict:
+        report = self.last_report
+        return {
+            "loaded": self._loaded,
+            "active": len(self._by_plate),
+            "last_reconciliation": None if report is None else {
+                "at": report.reconciled_at.isoformat() if report.reconciled_at else None,
+                "active_in_db": report.active_in_db,
+                "missing": len(report.missing),
+                "stale": len(report.stale),
+                "changed": len(report.changed),
+                "skipped": len(report.skipped),
+            },
+        }
+
+
+occupancy_index = OccupancyIndex()
@@ -0,0 +1,130 @@
+"""
+Catálogo de precios en memoria: tarifas y convenios por vehículo.
+
+Las tarifas y los convenios cambian pocas veces al mes, pero se consultan en
+cada entrada y salida. El catálogo guarda una instantánea inmutable:
+
+  * tarifas activas por (tipo de vehículo, tipo de tarifa)
+  * todas las tarifas por id (los registros antiguos apuntan a tarifas inactivas)
+  * convenio activo de cada vehículo asociado a uno
+
+Cada instantánea lleva la versión compartida (tabla cache_versions) con la que
+se cargó. Las escrituras incrementan esa versión y cada worker la consulta
+periódicamente para recargar; mientras el catálogo no esté listo (sin cargar o
+invalidado) los repositorios consultan la base de datos.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+from app.domain.agreements.entities.agreement import Agreement
+from app.domain.parking.entities.rate import Rate
+from app.domain.parking.services.tariff_engine import TariffTables
+
+
+@dataclass(frozen=True)
+class PricingSnapshot:
+    version: int
+    rates_by_id: Dict[int, Rate]
+    active_rates: Dict[Tuple[str, str], Rate]
+    agreements_by_vehicle: Dict[int, Agreement]
+    loaded_at: datetime
+
+
+class PricingCatalog:
+    """Instantánea versionada de tarifas y convenios con búsquedas O(1)."""
+
+    def __init__(self):
+        self._snapshot: Optional[PricingSnapshot] = None
+        self._stale = False
+        # Versión mínima aceptable tras una escritura local
+        self._min_version = 0
+        self.hits = 0
+        self.fallbacks = 0
+        self.reloads = 0
+
+    @property
+    def is_ready(self) -> bool:
+        return self._snapshot is not None and not self._stale
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def version(self) -> Optional[int]:
+        return self._snapshot.version if self._snapshot is not None else None
+
+    def load(self, version: int, rates: Iterable[Rate], agreements_by_vehicle: Dict[int, Agreement]) -> bool:
+        """
+        Replace the snapshot. A load older than the current snapshot or than a
+        local write is ignored (returns False): it may have read the data
+        before that write was committed.
+        """
+        if version < self._min_version:
+            return False
+        if self._snapshot is not None and version < self._snapshot.version:
+            return False
+
+        rates_by_id: Dict[int, Rate] = {}
+        active_rates: Dict[Tuple[str, str], Rate] = {}
+        for rate in sorted(rates, key=lambda r: r.id):
+            rates_by_id[rate.id] = rate
+            if rate.is_active:
+                # Con dos activas del mismo tipo gana la más reciente
+                active_rates[(rate.vehicle_type, rate.rate_type)] = rate
+
+        self._snapshot = PricingSnapshot(
+            version=version,
+            rates_by_id=rates_by_id,
+            active_rates=active_rates,
+            agreements_by_vehicle=dict(agreements_by_vehicle),
+            loaded_at=datetime.now(timezone.utc),
+        )
+        self._stale = False
+        self._min_version = version
+        self.reloads += 1
+        return True
+
+    def invalidate(self, min_version: int = 0) -> None:
+        """Stop serving the snapshot until a load of at least `min_version`."""
+        self._stale = True
+        self._min_version = max(self._min_version, min_version)
+
+    # Búsquedas: solo válidas con is_ready
+
+    def tariff_tables(self) -> TariffTables:
+        """Tablas del snapshot actual para el motor de tarifas (sin copiar)."""
+        self.hits += 1
+        return TariffTables(
+            rates_by_id=self._snapshot.rates_by_id,
+            agreements_by_vehicle=self._snapshot.agreements_by_vehicle,
+        )
+
+    def active_rate(self, vehicle_type: str, rate_type: str) -> Optional[Rate]:
+        self.hits += 1
+        return self._snapshot.active_rates.get((vehicle_type, rate_type))
+
+    def rate(self, rate_id: int) -> Optional[Rate]:
+        self.hits += 1
+        return self._snapshot.rates_by_id.get(rate_id)
+
+    def agreement_for(self, vehicle_id: int) -> Optional[Agreement]:
+        self.hits += 1
+        return self._snapshot.agreements_by_vehicle.get(vehicle_id)
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "ready": self.is_ready,
+            "version": snapshot.version if snapshot else None,
+            "loaded_at": snapshot.loaded_at.isoformat() if snapshot else None,
+            "rates": len(snapshot.rates_by_id) if snapshot else 0,
+            "agreement_vehicles": len(snapshot.agreements_by_vehicle) if snapshot else 0,
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "reloads": self.reloads,
+        }
+
+
+# Instancia del proceso, cargada al iniciar la aplicación
+pricing_catalog = PricingCatalog()
@@ -0,0 +1,231 @@
+"""
+Motor de tarifas: calcula el cobro de una estadía sin acceder a la base de datos.
+
+Reglas:
+  1. Con suscripción activa el parqueo es gratis: solo se cobran los cascos.
+  2. Un lavado vinculado descuenta sus minutos gratis de la estadía.
+  3. Se cobra por hora iniciada (mínimo 1), salvo que los minutos gratis cubran
+     toda la estadía.
+  4. Un convenio activo con tarifa especial la cobra por hora; sin ella, aplica
+     su porcentaje de descuento a la tarifa del registro.
+  5. Sin convenio se cobra la tarifa del registro.
+
+price_record calcula un registro. price_records calcula miles con arreglos
+NumPy (cierres masivos, simulaciones de tarifas sobre el histórico) y da
+exactamente los mismos valores: las mismas operaciones en punto flotante y el
+mismo truncamiento a entero. price_arrays es el núcleo por columnas, para
+quien ya tiene los datos como arreglos.
+"""
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Mapping, Optional, Sequence
+import numpy as np
+from app.core.washing_config import WashingServiceConfig
+from app.domain.agreements.entities.agreement import Agreement
+from app.domain.parking.entities.parking_record import ParkingRecord
+from app.domain.parking.entities.rate import Rate
+from app.domain.parking.entities.vehicle import Vehicle
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class TariffInput:
+    """Lo que el cobro necesita de un registro de parqueo y su vehículo."""
+    vehicle_id: int
+    vehicle_type: str
+    entry_time: datetime
+    exit_time: datetime
+    parking_rate_id: Optional[int]
+    helmet_charge: int = 0
+    subscription_id: Optional[int] = None
+    washing_service_type: Optional[str] = None
+
+    @classmethod
+    def for_record(
+        cls,
+        vehicle: Vehicle,
+        record: ParkingRecord,
+        exit_time: datetime,
+        washing_service_type: Optional[str] = None
+    ) -> "TariffInput":
+        return cls(
+            vehicle_id=vehicle.id,
+            vehicle_type=vehicle.vehicle_type,
+            entry_time=record.entry_time,
+            exit_time=exit_time,
+            parking_rate_id=record.parking_rate_id,
+            helmet_charge=record.helmet_charge,
+            subscription_id=record.subscription_id,
+            washing_service_type=washing_service_type,
+        )
+
+
+@dataclass(frozen=True)
+class TariffTables:
+    """
+    Tarifas y convenios contra los que se calcula. Para simular otra tarifa
+    basta con pasar otras tablas (p. ej. dataclasses.replace con otros precios).
+    """
+    rates_by_id: Mapping[int, Rate]
+    agreements_by_vehicle: Mapping[int, Agreement]
+    free_minutes: Callable[[str, str], int] = WashingServiceConfig.get_free_minutes
+
+
+@dataclass(frozen=True)
+class TariffQuote:
+    free_minutes: int
+    hours: int
+    parking_cost: int
+    helmet_charge: int
+    total_cost: int
+
+
+@dataclass
+class TariffBatch:
+    """Resultado de price_records / price_arrays: una posición por registro."""
+    free_minutes: np.ndarray
+    hours: np.ndarray
+    parking_cost: np.ndarray
+    helmet_charge: np.ndarray
+    total_cost: np.ndarray
+    # False donde el registro no tiene tarifa (y la necesita): no tiene cobro
+    priced: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.total_cost)
+
+    def quote(self, i: int) -> Optional[TariffQuote]:
+        if not self.priced[i]:
+            return None
+        return TariffQuote(
+            free_minutes=int(self.free_minutes[i]),
+            hours=int(self.hours[i]),
+            parking_cost=int(self.parking_cost[i]),
+            helmet_charge=int(self.helmet_charge[i]),
+            total_cost=int(self.total_cost[i]),
+        )
+
+
+def billable_hours(entry_time: datetime, exit_time: datetime, free_minutes: int = 0) -> int:
+    """Hours to charge: rounded up, at least 1, and 0 when free minutes cover the stay."""
+    minutes_total = (exit_time - entry_time).total_seconds() / 60
+    billable_minutes = max(0, minutes_total - free_minutes)
+    # Rule: "La tarifa mínima es de 1 minuto." -> If billable > 0, min 1 hour charge.
+    # But if fully covered by free time, it should be 0.
+    if billable_minutes == 0:
+        return 0
+    return max(1, math.ceil(billable_minutes / 60))
+
+
+def parking_cost(hours: int, agreement: Optional[Agreement], rate: Optional[Rate]) -> int:
+    """
+    Parking cost without helmets for a vehicle without subscription.
+    `rate` is only needed when there is no special rate.
+    """
+    if agreement and agreement.is_active == "active" and agreement.special_rate:
+        # Use special rate (fixed rate per hour)
+        return int(agreement.special_rate * hours)
+    if not rate:
+        raise ValueError(f"Rate not found for parking record")
+    cost = rate.price * hours
+    if agreement and agreement.is_active == "active":
+        # Apply discount percentage to standard rate
+        cost = cost - cost * (agreement.discount_percentage / 100)
+    return int(cost)
+
+
+def _free_minutes(item: TariffInput, tables: TariffTables) -> int:
+    if not item.washing_service_type:
+        return 0
+    return tables.free_minutes(item.vehicle_type, item.washing_service_type)
+
+
+def price_record(item: TariffInput, tables: TariffTables) -> TariffQuote:
+    """Cobro de un registro. ValueError si necesita una tarifa que no está en las tablas."""
+    free_minutes = _free_minutes(item, tables)
+    hours = billable_hours(item.entry_time, item.exit_time, free_minutes)
+
+    cost = 0
+    if not item.subscription_id:
+        cost = parking_cost(
+            hours,
+            tables.agreements_by_vehicle.get(item.vehicle_id),
+            tables.rates_by_id.get(item.parking_rate_id),
+        )
+    return TariffQuote(
+        free_minutes=free_minutes,
+        hours=hours,
+        parking_cost=cost,
+        helmet_charge=item.helmet_charge,
+        total_cost=cost + item.helmet_charge,
+    )
+
+
+def price_arrays(
+    duration_us: np.ndarray,
+    free_minutes: np.ndarray,
+    subscribed: np.ndarray,
+    has_rate: np.ndarray,
+    rate_price: np.ndarray,
+    has_agreement: np.ndarray,
+    special_rate: np.ndarray,
+    discount_percentage: np.ndarray,
+    helmet_charge: np.ndarray,
+) -> TariffBatch:
+    """
+    Vectorised price_record over columns. `duration_us` is each stay in whole
+    microseconds; `special_rate` is 0 where the agreement has none. Money is
+    integer cents (int64).
+    """
+    minutes_total = duration_us / 1e6 / 60
+    billable_minutes = np.maximum(0.0, minutes_total - free_minutes)
+    hours = np.where(billable_minutes == 0, 0, np.maximum(1, np.ceil(billable_minutes / 60))).astype(np.int64)
+
+    uses_special = has_agreement & (special_rate != 0)
+    standard_cost = rate_price * hours
+    discounted = standard_cost - standard_cost * (discount_percentage / 100)
+    cost = np.where(
+        uses_special,
+        special_rate * hours,
+        np.where(has_agreement, np.trunc(discounted), standard_cost),
+    ).astype(np.int64)
+
+    priced = subscribed | uses_special | has_rate
+    cost = np.where(subscribed | ~priced, 0, cost)
+    return TariffBatch(
+        free_minutes=free_minutes.astype(np.int64),
+        hours=hours,
+        parking_cost=cost,
+        helmet_charge=helmet_charge.astype(np.int64),
+        total_cost=cost + helmet_charge,
+        priced=priced,
+    )
+
+
+def tariff_columns(items: Sequence[TariffInput], tables: TariffTables) -> Dict[str, np.ndarray]:
+    """Columnas de price_arrays para unos registros, resueltas contra las tablas."""
+    n = len(items)
+    rates = [tables.rates_by_id.get(item.parking_rate_id) for item in items]
+    agreements = []
+    for item in items:
+        agreement = tables.agreements_by_vehicle.get(item.vehicle_id)
+        agreements.append(agreement if agreement and agreement.is_active == "active" else None)
+
+    return {
+        "duration_us": np.fromiter(((i.exit_time - i.entry_time) // _MICROSECOND for i in items), np.int64, n),
+        "free_minutes": np.fromiter((_free_minutes(i, tables) for i in items), np.int64, n),
+        "subscribed": np.fromiter((bool(i.subscription_id) for i in items), bool, n),
+        "has_rate": np.fromiter((r is not None for r in rates), bool, n),
+        "rate_price": np.fromiter((r.price if r else 0 for r in rates), np.int64, n),
+        "has_agreement": np.fromiter((a is not None for a in agreements), bool, n),
+        "special_rate": np.fromiter((a.special_rate or 0 if a else 0 for a in agreements), np.int64, n),
+        "discount_percentage": np.fromiter((a.discount_percentage or 0 if a else 0 for a in agreements), np.float64, n),
+        "helmet_charge": np.fromiter((i.helmet_charge or 0 for i in items), np.int64, n),
+    }
+
+
+def price_records(items: Sequence[TariffInput], tables: TariffTables) -> TariffBatch:
+    """Cobro de muchos registros: arma las columnas y llama a price_arrays."""
+    return price_arrays(**tariff_columns(items, tables))
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class DailyFinancialSummary:
+    """Consolidated figures of one business day (amounts in cents)."""
+    day: date
+    parking_income: int = 0
+    washing_income: int = 0
+    subscription_income: int = 0
+    total_expenses: int = 0
+    total_bonuses: int = 0
+    parking_count: int = 0
+    washing_count: int = 0
+    subscription_count: int = 0
+    occupancy_seconds: float = 0.0
+
+    @property
+    def total_income(self) -> int:
+        return self.parking_income + self.washing_income + self.subscription_income
+
+    @property
+    def net_profit(self) -> int:
+        # R = Ingresos – (Gastos + Bonos)
+        return self.total_income - (self.total_expenses + self.total_bonuses)
@@ -0,0 +1,44 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Optional, Tuple
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class ExportJob:
+    """Export generated in the background and kept on disk until it expires."""
+    id: str
+    report: str
+    start_date: date
+    end_date: date
+    format: str
+    group_by: str = "day"
+    bucket_minutes: int = 60
+    requested_by: Optional[int] = None
+    status: str = QUEUED
+    total_rows: Optional[int] = None
+    rows_written: int = 0
+    file_path: Optional[str] = None
+    file_size: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+
+    @property
+    def dedup_key(self) -> Tuple[str, date, date, str, str, int]:
+        return (self.report, self.start_date, self.end_date, self.format, self.group_by, self.bucket_minutes)
+
+    @property
+    def progress(self) -> float:
+        """0.0 - 1.0; rows written over rows expected."""
+        if self.status == DONE:
+            return 1.0
+        if not self.total_rows:
+            return 0.0
+        return min(1.0, self.rows_written / self.total_rows)
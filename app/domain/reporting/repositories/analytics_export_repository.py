@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
+
+
+class AnalyticsExportRepository(ABC):
+    """
+    Filas crudas de las tablas de historia para la ingesta analítica.
+
+    Cada método recorre con un cursor del servidor las filas cuyo updated_at
+    está en (since, until], ordenadas por (updated_at, id); since None = toda
+    la historia. Los valores van sin formatear: centavos enteros y datetimes aware.
+    """
+
+    @abstractmethod
+    async def get_watermark(self, lag_seconds: int) -> datetime:
+        """
+        now() - lag según el reloj de la base de datos, el mismo que escribe
+        updated_at; sirve de `until` para los recorridos de esta sesión.
+        """
+        pass
+
+    @abstractmethod
+    def stream_parking_records(
+        self, since: Optional[datetime], until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Registros de parqueo con la placa y el tipo del vehículo."""
+        pass
+
+    @abstractmethod
+    def stream_washing_services(
+        self, since: Optional[datetime], until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Servicios de lavado con la placa y el tipo del vehículo."""
+        pass
+
+    @abstractmethod
+    def stream_expenses(
+        self, since: Optional[datetime], until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def stream_bonuses(
+        self, since: Optional[datetime], until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def stream_subscriptions(
+        self, since: Optional[datetime], until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Mensualidades con la placa y el tipo del vehículo."""
+        pass
@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from datetime import date, datetime
+from app.domain.reporting.entities.daily_financial_summary import DailyFinancialSummary
+
+
+class FinancialRollupRepository(ABC):
+    @abstractmethod
+    async def get_daily(self, start_date: date, end_date: date) -> List[DailyFinancialSummary]:
+        """Resúmenes diarios ya materializados en el rango (inclusive)."""
+        pass
+
+    @abstractmethod
+    async def upsert_daily(self, summaries: List[DailyFinancialSummary]) -> None:
+        """Guarda o reemplaza los resúmenes diarios (idempotente)."""
+        pass
+
+    @abstractmethod
+    async def get_latest_day(self) -> Optional[date]:
+        """Último día materializado, o None si no hay ninguno."""
+        pass
+
+    @abstractmethod
+    async def get_dirty_marks(self) -> Dict[date, datetime]:
+        """Todos los días marcados, con la hora de su última marca (sin desmarcarlos)."""
+        pass
+
+    @abstractmethod
+    async def clear_dirty_marks(self, marks: Dict[date, datetime]) -> None:
+        """
+        Desmarca los días de `marks` cuya marca no cambió: un día marcado otra vez
+        después de leerlo sigue marcado para el siguiente refresh.
+        """
+        pass
+
+    @abstractmethod
+    async def get_dirty_days(self, start_date: date, end_date: date) -> List[date]:
+        """Días marcados del rango (inclusive), aún sin recalcular."""
+        pass
+
+    @abstractmethod
+    async def compute_daily(self, start_date: date, end_date: date) -> List[DailyFinancialSummary]:
+        """
+        Calcula los resúmenes diarios desde las tablas de origen (parqueos,
+        lavados, mensualidades, gastos y bonos). Devuelve un elemento por día.
+        """
+        pass
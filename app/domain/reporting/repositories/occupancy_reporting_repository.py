@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime
 from app.infrastructure.database.models.vehicles import ParkingRecord
 
 class OccupancyReportingRepository(ABC):
@@ -12,6 +12,14 @@ class OccupancyReportingRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_stay_intervals(self, start_time: datetime, end_time: datetime) -> List[Tuple[datetime, Optional[datetime]]]:
+        """
+        Pares (entrada, salida) de los registros que se solapan con el rango.
+        Salida None = el vehículo sigue parqueado.
+        """
+        pass
+
     @abstractmethod
     async def get_total_parking_duration_seconds(self, start_time: datetime, end_time: datetime) -> float:
         """
@@ -19,3 +27,11 @@ class OccupancyReportingRepository(ABC):
         Útil para calcular ocupación promedio.
         """
         pass
+
+    @abstractmethod
+    async def get_parking_duration_seconds_by_day(self, start_date: date, end_date: date) -> Dict[date, float]:
+        """
+        get_total_parking_duration_seconds de cada día del negocio del rango
+        (inclusive), en una sola consulta. Los días sin estancias no aparecen.
+        """
+        pass
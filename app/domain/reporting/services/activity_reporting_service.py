@@ -1,10 +1,17 @@
 from datetime import date, datetime
-from typing import List, Dict
+from typing import Any, AsyncIterator, List, Dict
 from collections import defaultdict
 from app.domain.reporting.repositories.activity_reporting_repository import IActivityReportingRepository
 from app.application.dto.reporting.activity_report_response import ActivityReportResponse, ActivityReportItem
+from app.domain.reporting.services.export_service import ReportColumn
 
 class ActivityReportingService:
+    EXPORT_COLUMNS = [
+        ReportColumn("label", "Period", "str"),
+        ReportColumn("count", "Services", "int"),
+        ReportColumn("total_amount", "Total Amount", "money"),
+    ]
+
     def __init__(self, repo: IActivityReportingRepository):
         self.repo = repo
 
@@ -55,3 +62,9 @@ class ActivityReportingService:
             group_by=group_by,
             items=grouped_items
         )
+
+    async def iter_rows(self, start_date: date, end_date: date, group_by: str = "day") -> AsyncIterator[Dict[str, Any]]:
+        """Rows for the exporters (see EXPORT_COLUMNS)."""
+        report = await self.get_activity_report(start_date, end_date, group_by)
+        for item in report.items:
+            yield item.model_dump()
@@ -1,10 +1,18 @@
 from datetime import date
+from typing import Any, AsyncIterator, Dict
 import csv
 import io
 from app.domain.reporting.repositories.agreement_reporting_repository import IAgreementReportingRepository
 from app.application.dto.reporting.agreement_report_response import AgreementReportResponse
+from app.domain.reporting.services.export_service import ReportColumn
 
 class AgreementReportingService:
+    EXPORT_COLUMNS = [
+        ReportColumn("company_name", "Company Name", "str"),
+        ReportColumn("total_washes", "Total Washes", "int"),
+        ReportColumn("total_amount", "Total Amount", "money"),
+    ]
+
     def __init__(self, repo: IAgreementReportingRepository):
         self.repo = repo
 
@@ -16,6 +24,12 @@ class AgreementReportingService:
             items=items
         )
 
+    async def iter_rows(self, start_date: date, end_date: date) -> AsyncIterator[Dict[str, Any]]:
+        """Rows for the exporters (see EXPORT_COLUMNS)."""
+        report = await self.get_report(start_date, end_date)
+        for item in report.items:
+            yield item.model_dump()
+
     async def generate_csv(self, start_date: date, end_date: date) -> str:
         report = await self.get_report(start_date, end_date)
         
@@ -0,0 +1,150 @@
+import asyncio
+from datetime import date
+from typing import Awaitable, Callable, Dict, Hashable
+from sqlalchemy import select, func, or_, and_
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.core.config import settings
+from app.core.datetime_utils import day_bounds
+from app.infrastructure.cache.ttl_cache import TTLCache
+from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.database.models.vehicles import ParkingRecord
+from app.infrastructure.database.models.services import WashingService
+from app.infrastructure.database.models.subscriptions import MonthlySubscription
+from app.infrastructure.database.models.financial import Shift
+
+# Compartida por /parking/stats/today y /reports/stats/summary; la invalidan
+# las entradas, salidas y lavados (ver invalidate_daily_stats).
+daily_stats_cache = TTLCache(ttl_seconds=settings.STATS_CACHE_TTL_SECONDS)
+
+# Consultas en curso, para que los misses simultáneos compartan una sola
+_in_flight: Dict[Hashable, asyncio.Task] = {}
+
+
+def invalidate_daily_stats() -> None:
+    daily_stats_cache.clear()
+
+
+class DailyStatsService:
+    """
+    Today's counters with one conditional-aggregation query per table
+    (COUNT/SUM ... FILTER (WHERE ...)). Tables are queried concurrently, each
+    on its own session, and results are cached per business date.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker = SessionLocal, cache: TTLCache = daily_stats_cache):
+        self.session_factory = session_factory
+        self.cache = cache
+
+    async def _cached(self, key: Hashable, loader: Callable[[], Awaitable[dict]]) -> dict:
+        value = self.cache.get(key)
+        if value is not None:
+            return value
+
+        # Concurrent misses for the same key share one query. A load that
+        # started before an invalidation is neither shared nor cached.
+        generation = self.cache.generation
+        flight_key = (id(self.cache), key, generation)
+        task = _in_flight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            _in_flight[flight_key] = task
+            task.add_done_callback(lambda _: _in_flight.pop(flight_key, None))
+
+        value = await asyncio.shield(task)
+        if self.cache.generation == generation:
+            self.cache.set(key, value)
+        return value
+
+    async def _fetch_one(self, stmt):
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            return result.one()
+
+    async def get_parking_stats(self, day: date) -> dict:
+        return await self._cached(("parking", day), lambda: self._load_parking_stats(day))
+
+    async def _load_parking_stats(self, day: date) -> dict:
+        day_start, day_end = day_bounds(day)
+        entered_today = and_(ParkingRecord.entry_time >= day_start, ParkingRecord.entry_time < day_end)
+        exited_today = and_(ParkingRecord.exit_time >= day_start, ParkingRecord.exit_time < day_end)
+        active = ParkingRecord.exit_time.is_(None)
+
+        row = await self._fetch_one(
+            select(
+                func.count().filter(entered_today).label("total_entries"),
+                func.count().filter(active).label("active_vehicles"),
+                func.count().filter(exited_today).label("completed_exits"),
+                func.coalesce(
+                    func.sum(ParkingRecord.total_cost).filter(
+                        and_(exited_today, ParkingRecord.payment_status == "paid")
+                    ),
+                    0
+                ).label("revenue"),
+            )
+            # Only rows that can match any filter: each branch has its own index
+            .where(or_(entered_today, active, exited_today))
+        )
+        return {
+            "total_entries": row.total_entries,
+            "active_vehicles": row.active_vehicles,
+            "completed_exits": row.completed_exits,
+            "revenue": row.revenue,
+        }
+
+    async def _load_washing_stats(self, day: date) -> dict:
+        day_start, day_end = day_bounds(day)
+        served_today = and_(WashingService.service_date >= day_start, WashingService.service_date < day_end)
+        active = WashingService.end_time.is_(None)
+
+        row = await self._fetch_one(
+            select(
+                func.count().filter(served_today).label("total_services"),
+                func.count().filter(active).label("active_services"),
+                func.coalesce(
+                    func.sum(WashingService.price).filter(
+                        and_(served_today, WashingService.payment_status == "paid")
+                    ),
+                    0
+                ).label("income"),
+            )
+            .where(or_(served_today, active))
+        )
+        return {
+            "total_services": row.total_services,
+            "active_services": row.active_services,
+            "income": row.income,
+        }
+
+    async def _count_active_subscriptions(self, day: date) -> int:
+        row = await self._fetch_one(
+            select(func.count(MonthlySubscription.id))
+            .where(MonthlySubscription.start_date <= day)
+            .where(MonthlySubscription.end_date >= day)
+            .where(MonthlySubscription.payment_status == "paid")
+        )
+        return row[0] or 0
+
+    async def _count_open_shifts(self, day: date) -> int:
+        row = await self._fetch_one(
+            select(func.count(Shift.id))
+            .where(Shift.shift_date == day)
+            .where(Shift.end_time.is_(None))
+        )
+        return row[0] or 0
+
+    async def get_summary(self, day: date) -> dict:
+        return await self._cached(("summary", day), lambda: self._load_summary(day))
+
+    async def _load_summary(self, day: date) -> dict:
+        parking, washing, subscriptions, open_shifts = await asyncio.gather(
+            self.get_parking_stats(day),
+            self._load_washing_stats(day),
+            self._count_active_subscriptions(day),
+            self._count_open_shifts(day),
+        )
+        return {
+            "parking": parking,
+            "washing": washing,
+            "active_subscriptions": subscriptions,
+            "open_shifts": open_shifts,
+        }
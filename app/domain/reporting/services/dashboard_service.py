@@ -1,16 +1,23 @@
-from datetime import date, datetime, time, timedelta
-from typing import List, Dict
+import asyncio
+import time
+from datetime import date, timedelta
+from typing import Awaitable, Dict, Optional, Tuple, TypeVar
 from collections import defaultdict
 
 from app.application.dto.reporting.dashboard_response import (
     DashboardMetricsResponse, GeneralMetrics, OperationalMetrics, TrendPoint
 )
 from app.domain.reporting.services.revenue_service import RevenueService
+from app.domain.reporting.services.financial_rollup_service import FinancialRollupService
 from app.domain.financial.repositories.expense_repository import ExpenseRepository
 from app.domain.financial.repositories.bonus_repository import BonusRepository
 from app.domain.reporting.services.washing_analytics_service import WashingAnalyticsService
 from app.domain.reporting.repositories.occupancy_reporting_repository import OccupancyReportingRepository
 from app.domain.washers.repositories.washer_repository import IWasherRepository
+from app.core.datetime_utils import date_range_bounds
+
+T = TypeVar("T")
+
 
 class DashboardService:
     def __init__(
@@ -20,7 +27,8 @@ class DashboardService:
         bonus_repository: BonusRepository,
         washing_analytics_service: WashingAnalyticsService,
         occupancy_repository: OccupancyReportingRepository,
-        washer_repository: IWasherRepository
+        washer_repository: IWasherRepository,
+        rollup_service: Optional[FinancialRollupService] = None
     ):
         self.revenue_service = revenue_service
         self.expense_repository = expense_repository
@@ -28,20 +36,72 @@ class DashboardService:
         self.washing_analytics_service = washing_analytics_service
         self.occupancy_repository = occupancy_repository
         self.washer_repository = washer_repository
+        self.rollup_service = rollup_service
+        # Duración (ms) de cada etapa de la última llamada, para el header Server-Timing
+        self.stage_timings: Dict[str, float] = {}
+
+    async def _timed(self, stage: str, awaitable: Awaitable[T]) -> T:
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.stage_timings[stage] = (time.perf_counter() - started) * 1000
+
+    async def _load_financials(
+        self, start_date: date, end_date: date
+    ) -> Tuple[Dict[date, int], Dict[date, int], Dict[date, int], float]:
+        """Ingresos, gastos y bonos por día, y segundos de parqueo del rango."""
+        if self.rollup_service is not None:
+            # Días cerrados desde financial_reports; solo hoy se calcula en vivo
+            summaries = await self._timed(
+                "rollups", self.rollup_service.get_daily_summaries(start_date, end_date)
+            )
+            return (
+                {s.day: s.total_income for s in summaries},
+                {s.day: s.total_expenses for s in summaries},
+                {s.day: s.total_bonuses for s in summaries},
+                sum(s.occupancy_seconds for s in summaries),
+            )
+
+        start_dt, end_dt = date_range_bounds(start_date, end_date)
+        revenue_report, daily_expenses, daily_bonuses, total_seconds = await asyncio.gather(
+            self._timed("revenue", self.revenue_service.get_consolidated_revenue(start_date, end_date, group_by='day')),
+            self._timed("expenses", self.expense_repository.get_daily_expenses(start_date, end_date)),
+            self._timed("bonuses", self.bonus_repository.get_daily_bonuses(start_date, end_date)),
+            self._timed("occupancy", self.occupancy_repository.get_total_parking_duration_seconds(start_dt, end_dt)),
+        )
+        return (
+            {item.date: item.total_income for item in revenue_report.data},
+            {item['date']: item['total'] or 0 for item in daily_expenses},
+            {item['date']: item['total'] or 0 for item in daily_bonuses},
+            total_seconds,
+        )
 
     async def get_dashboard_metrics(self, start_date: date, end_date: date) -> DashboardMetricsResponse:
+        # Independent stages run concurrently; repositories without an injected
+        # session open their own, so each stage gets its own pooled connection.
+        # RevenueService is the only user of its session. With rollups enabled the
+        # financial stages collapse into one read of the daily summaries.
+        self.stage_timings = {}
+        start_dt, end_dt = date_range_bounds(start_date, end_date)
+        pipeline_started = time.perf_counter()
+
+        (
+            (daily_income, daily_expenses, daily_bonuses, total_seconds),
+            washing_stats,
+            total_active_washers,
+        ) = await asyncio.gather(
+            self._load_financials(start_date, end_date),
+            self._timed("washing", self.washing_analytics_service.get_duration_analytics(start_date, end_date)),
+            self._timed("washers", self.washer_repository.count_active()),
+        )
+        self.stage_timings["total"] = (time.perf_counter() - pipeline_started) * 1000
+
         # 1. General Metrics
-        # Income
-        revenue_report = await self.revenue_service.get_consolidated_revenue(start_date, end_date, group_by='day')
-        total_income = revenue_report.total_period_income
-        
-        # Expenses
-        total_expenses = await self.expense_repository.get_sum_by_date_range(start_date, end_date)
-        daily_expenses = await self.expense_repository.get_daily_expenses(start_date, end_date)
-        
-        # Bonuses
-        total_bonuses = await self.bonus_repository.get_sum_by_date_range(start_date, end_date)
-        daily_bonuses = await self.bonus_repository.get_daily_bonuses(start_date, end_date)
+        # Totals come from the daily series instead of separate SUM queries
+        total_income = sum(daily_income.values())
+        total_expenses = sum(daily_expenses.values())
+        total_bonuses = sum(daily_bonuses.values())
         
         # Net Performance
         net_performance = total_income - (total_expenses + total_bonuses)
@@ -72,17 +132,12 @@ class DashboardService:
         # Occupancy
         # Calculate average occupancy: (Total Parking Duration in Hours) / (Total Hours in Period)
         # This gives "Average number of cars parked at any given time"
-        start_dt = datetime.combine(start_date, time.min)
-        end_dt = datetime.combine(end_date, time.max)
-        total_seconds = await self.occupancy_repository.get_total_parking_duration_seconds(start_dt, end_dt)
-        
         total_period_hours = (end_dt - start_dt).total_seconds() / 3600.0
         avg_occupancy = 0.0
         if total_period_hours > 0:
             avg_occupancy = (total_seconds / 3600.0) / total_period_hours
             
         # Washing Time
-        washing_stats = await self.washing_analytics_service.get_duration_analytics(start_date, end_date)
         total_minutes = 0.0
         total_services = 0
         unique_washers_with_service = set()
@@ -97,7 +152,6 @@ class DashboardService:
             avg_washing_time = total_minutes / total_services
             
         # Personnel Utilization
-        total_active_washers = await self.washer_repository.count_active()
         utilization = 0.0
         if total_active_washers > 0:
             utilization = (len(unique_washers_with_service) / total_active_washers) * 100.0
@@ -118,22 +172,11 @@ class DashboardService:
             trend_map[current] = TrendPoint(date=current, income=0, expenses=0, bonuses=0)
             current += timedelta(days=1)
             
-        # Fill Income
-        for item in revenue_report.data:
-            if item.date in trend_map:
-                trend_map[item.date].income = item.total_income
-                
-        # Fill Expenses
-        for item in daily_expenses:
-            d = item['date']
-            if d in trend_map:
-                trend_map[d].expenses = item['total']
-                
-        # Fill Bonuses
-        for item in daily_bonuses:
-            d = item['date']
-            if d in trend_map:
-                trend_map[d].bonuses = item['total']
+        # Fill Income, Expenses and Bonuses
+        for d, point in trend_map.items():
+            point.income = daily_income.get(d, 0)
+            point.expenses = daily_expenses.get(d, 0)
+            point.bonuses = daily_bonuses.get(d, 0)
                 
         trends = sorted(trend_map.values(), key=lambda x: x.date)
         
@@ -0,0 +1,91 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+from app.domain.reporting.repositories.analytics_export_repository import AnalyticsExportRepository
+from app.domain.reporting.services.export_service import EXPORT_FORMATS, ReportColumn
+
+
+@dataclass(frozen=True)
+class ReportExportParams:
+    """Parameters shared by every exportable report; each report uses the ones it needs."""
+    start_date: date
+    end_date: date
+    group_by: str = "day"
+    bucket_minutes: int = 60
+
+    def __post_init__(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must be on or after start_date")
+
+
+@dataclass(frozen=True)
+class ReportExporter:
+    """
+    A report that can be exported in any format: its typed columns and a
+    factory for its row iterator. `count` is optional and only used to show
+    progress on background jobs.
+    """
+    name: str
+    title: str
+    columns: Sequence[ReportColumn]
+    rows: Callable[[ReportExportParams], AsyncIterator[Dict[str, Any]]]
+    count: Optional[Callable[[ReportExportParams], Awaitable[int]]] = None
+    formats: Tuple[str, ...] = field(default_factory=lambda: tuple(EXPORT_FORMATS))
+
+
+@dataclass(frozen=True)
+class ChangeWindow:
+    """
+    Rows whose updated_at is in (since, until]. `since` is the watermark of
+    the previous pull (None = full history) and `until` becomes the next one.
+    """
+    since: Optional[datetime]
+    until: datetime
+
+    def __post_init__(self):
+        if self.until.tzinfo is None or (self.since is not None and self.since.tzinfo is None):
+            raise ValueError("since and until must be timezone-aware")
+        if self.since is not None and self.since >= self.until:
+            raise ValueError("since must be before the current watermark")
+
+
+@dataclass(frozen=True)
+class DatasetExporter:
+    """
+    A raw history table exported incrementally for analytics ingestion:
+    typed columns and a factory for the rows changed in a window, read
+    through the repository (and session) that computed the window.
+    """
+    name: str
+    title: str
+    columns: Sequence[ReportColumn]
+    rows: Callable[[AnalyticsExportRepository, ChangeWindow], AsyncIterator[Dict[str, Any]]]
+    formats: Tuple[str, ...] = ("parquet", "arrow", "csv")
+
+
+E = TypeVar("E", ReportExporter, DatasetExporter)
+
+
+class ReportExporterRegistry(Generic[E]):
+    """Exportable reports (or datasets) by name."""
+
+    def __init__(self):
+        self._exporters: Dict[str, E] = {}
+
+    def register(self, exporter: E) -> E:
+        if exporter.name in self._exporters:
+            raise ValueError(f"Report exporter already registered: {exporter.name}")
+        self._exporters[exporter.name] = exporter
+        return exporter
+
+    def get(self, name: str) -> E:
+        exporter = self._exporters.get(name)
+        if exporter is None:
+            raise ValueError(f"Unknown report: {name}")
+        return exporter
+
+    def names(self) -> List[str]:
+        return sorted(self._exporters)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._exporters
@@ -1,11 +1,256 @@
-from typing import List, Dict, Any
+import asyncio
+import csv
+import tempfile
+from dataclasses import dataclass
+from datetime import date
+from typing import IO, List, Dict, Any, AsyncIterable, AsyncIterator, Iterator, Optional, Sequence, Tuple, Union
 import pandas as pd
-from io import BytesIO
+from io import BytesIO, StringIO
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
 from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
+from reportlab.lib.pagesizes import letter, landscape
+from reportlab.pdfgen import canvas as pdf_canvas
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
 from datetime import datetime
+from app.core.config import settings
+from app.core.datetime_utils import to_local_naive
+
+# Filas por hoja en Excel (incluye la fila de encabezado)
+EXCEL_MAX_ROWS = 1_048_576
+# Hasta este tamaño el xlsx generado vive en memoria; luego pasa a disco
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+FILE_CHUNK_BYTES = 64 * 1024
+PARQUET_ROW_GROUP_ROWS = 50_000
+ARROW_BATCH_ROWS = 10_000
+
+# format -> (media type, file extension)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "csv": ("text/csv", "csv"),
+    "excel": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+    "pdf": ("application/pdf", "pdf"),
+}
+
+# Tipos de columna de los reportes exportables:
+#   str, category (texto con pocos valores distintos), int, float,
+#   money (entero en centavos), datetime (aware), date
+COLUMN_TYPES = ("str", "category", "int", "float", "money", "datetime", "date")
+_EXCEL_NUMBER_FORMATS = {
+    "float": "0.00",
+    "money": '"$"#,##0',
+    "datetime": "yyyy-mm-dd hh:mm:ss",
+    "date": "yyyy-mm-dd",
+}
+
+
+@dataclass(frozen=True)
+class ReportColumn:
+    """
+    Typed column of an exportable report. Rows carry raw values (cents,
+    aware datetimes) and each writer converts them for its format.
+    """
+    key: str
+    header: str
+    type: str = "str"
+    width: Optional[float] = None  # PDF width in points; evenly split when None
+
+    def __post_init__(self):
+        if self.type not in COLUMN_TYPES:
+            raise ValueError(f"Unknown column type: {self.type}")
+
+
+def _text_value(value: Any, column_type: str) -> Any:
+    """Value as written to CSV and PDF."""
+    if value is None:
+        return ""
+    if column_type == "money":
+        return f"{value / 100:.2f}"
+    if column_type == "float":
+        return f"{value:.2f}"
+    if column_type == "datetime":
+        return to_local_naive(value).strftime("%Y-%m-%d %H:%M:%S")
+    if column_type == "date":
+        return value.isoformat()
+    return value
+
+
+def _excel_value(value: Any, column_type: str) -> Any:
+    if value is None:
+        return None
+    if column_type == "money":
+        return value / 100
+    if column_type == "datetime":
+        return to_local_naive(value)
+    return value
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ValueError("Parquet and Arrow exports require the pyarrow package")
+    return pyarrow
+
+
+def _arrow_schema(pa, columns: Sequence[ReportColumn]):
+    """
+    Arrow schema for typed report columns: money stays as integer cents,
+    datetimes keep their zone and category columns are dictionary encoded.
+    """
+    arrow_types = {
+        "str": pa.string(),
+        "category": pa.dictionary(pa.int32(), pa.string()),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "money": pa.int64(),
+        "datetime": pa.timestamp("us", tz=settings.TIMEZONE or "UTC"),
+        "date": pa.date32(),
+    }
+    return pa.schema([pa.field(c.key, arrow_types[c.type]) for c in columns])
+
+
+@dataclass(frozen=True)
+class ExcelColumn:
+    """Column of a streamed xlsx export: header, row key and optional cell format."""
+    header: str
+    key: str
+    number_format: Optional[str] = None
+    width: Optional[float] = None
+
+
+class _WriteOnlySheets:
+    """Appends rows to write-only worksheets, opening a new one when a sheet is full."""
+
+    def __init__(self, workbook: Workbook, columns: Sequence[ExcelColumn], title: str, max_rows: int):
+        self.workbook = workbook
+        self.columns = columns
+        self.title = title
+        self.max_rows = max_rows
+        self.sheet = None
+        self.sheet_rows = 0
+        self.sheet_count = 0
+
+    def _new_sheet(self) -> None:
+        self.sheet_count += 1
+        title = self.title if self.sheet_count == 1 else f"{self.title} ({self.sheet_count})"
+        self.sheet = self.workbook.create_sheet(title=title)
+        for index, column in enumerate(self.columns, start=1):
+            if column.width:
+                self.sheet.column_dimensions[get_column_letter(index)].width = column.width
+        self.sheet.append([column.header for column in self.columns])
+        self.sheet_rows = 1
+
+    def append_rows(self, rows: List[Dict[str, Any]]) -> None:
+        if self.sheet is None:
+            self._new_sheet()
+        for row in rows:
+            if self.sheet_rows >= self.max_rows:
+                self._new_sheet()
+            values = []
+            for column in self.columns:
+                value = row.get(column.key)
+                if column.number_format and value is not None:
+                    cell = WriteOnlyCell(self.sheet, value=value)
+                    cell.number_format = column.number_format
+                    value = cell
+                values.append(value)
+            self.sheet.append(values)
+            self.sheet_rows += 1
+
+
+@dataclass(frozen=True)
+class PdfColumn:
+    """Column of a paginated PDF export, with a fixed width in points."""
+    header: str
+    key: str
+    width: float
+
+
+PDF_MARGIN = 36
+PDF_ROW_HEIGHT = 16
+PDF_FONT_SIZE = 8
+PDF_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), PDF_FONT_SIZE),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+])
+
+
+class _PdfPageWriter:
+    """
+    Draws one fixed-size table per page straight on a canvas.
+
+    Column widths and row heights are fixed, so reportlab never measures
+    content; values longer than their column are truncated. Each page is
+    independent, which keeps layout cost linear in the number of rows.
+    """
+
+    def __init__(self, output: IO, columns: Sequence[PdfColumn], title: str, pagesize=landscape(letter)):
+        self.columns = columns
+        self.title = title
+        self.width, self.height = pagesize
+        self.canvas = pdf_canvas.Canvas(output, pagesize=pagesize)
+        self.canvas.setTitle(title)
+        self.generated_on = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.page_number = 0
+        # Approximate characters that fit in each column at PDF_FONT_SIZE
+        self.max_chars = [max(3, int((c.width - 6) / (PDF_FONT_SIZE * 0.5))) for c in columns]
+
+        # Title and footer take a fixed band; the rest is table rows
+        self.table_top = self.height - PDF_MARGIN - 40
+        usable = self.table_top - PDF_MARGIN - 20
+        self.rows_per_page = max(1, int(usable // PDF_ROW_HEIGHT) - 1)
+
+    def _cell(self, value: Any, max_chars: int) -> str:
+        text = "" if value is None else str(value)
+        if len(text) > max_chars:
+            return text[:max_chars - 1] + "…"
+        return text
+
+    def _draw_frame(self) -> None:
+        self.page_number += 1
+        self.canvas.setFont('Helvetica-Bold', 14)
+        self.canvas.drawString(PDF_MARGIN, self.height - PDF_MARGIN - 14, self.title)
+        self.canvas.setFont('Helvetica', 8)
+        self.canvas.drawString(PDF_MARGIN, self.height - PDF_MARGIN - 28, f"Generated on: {self.generated_on}")
+        self.canvas.drawRightString(self.width - PDF_MARGIN, PDF_MARGIN, f"Page {self.page_number}")
+
+    def write_page(self, rows: List[Dict[str, Any]]) -> None:
+        self._draw_frame()
+        table_data = [[c.header for c in self.columns]]
+        for row in rows:
+            table_data.append([
+                self._cell(row.get(c.key), max_chars) for c, max_chars in zip(self.columns, self.max_chars)
+            ])
+        table = Table(
+            table_data,
+            colWidths=[c.width for c in self.columns],
+            rowHeights=PDF_ROW_HEIGHT,
+            repeatRows=1,
+        )
+        table.setStyle(PDF_TABLE_STYLE)
+        _, table_height = table.wrapOn(self.canvas, self.width, self.height)
+        table.drawOn(self.canvas, PDF_MARGIN, self.table_top - table_height)
+        self.canvas.showPage()
+
+    def write_empty(self) -> None:
+        self._draw_frame()
+        self.canvas.setFont('Helvetica', 10)
+        self.canvas.drawString(PDF_MARGIN, self.table_top - 14, "No data available for this report.")
+        self.canvas.showPage()
+
+    def save(self) -> None:
+        self.canvas.save()
+
 
 class ExportService:
     """Service for exporting reports to different formats (CSV, Excel, PDF)"""
@@ -21,6 +266,244 @@ class ExportService:
         output.seek(0)
         return output
 
+    async def stream_csv(
+        self,
+        rows: AsyncIterable[Dict[str, Any]],
+        fieldnames: Sequence[str],
+        chunk_rows: int = 500,
+        header: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream rows as CSV, yielding one encoded chunk every `chunk_rows` rows.
+        The header (`header`, or the field names) goes out immediately, before
+        the first row is fetched, and only one chunk is ever buffered.
+        """
+        buffer = StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames, lineterminator="\n")
+
+        def drain() -> bytes:
+            chunk = buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+            return chunk
+
+        if header is None:
+            writer.writeheader()
+        else:
+            writer.writer.writerow(header)
+        yield drain()
+
+        pending = 0
+        async for row in rows:
+            writer.writerow(row)
+            pending += 1
+            if pending >= chunk_rows:
+                yield drain()
+                pending = 0
+        if pending:
+            yield drain()
+
+    async def export_to_excel_stream(
+        self,
+        rows: AsyncIterable[Dict[str, Any]],
+        columns: Sequence[ExcelColumn],
+        sheet_title: str = "Report",
+        batch_rows: int = 2000,
+        max_rows_per_sheet: int = EXCEL_MAX_ROWS
+    ) -> IO:
+        """
+        Export rows to xlsx with openpyxl write-only worksheets.
+
+        Values keep their type (numbers, datetimes) and get the column's
+        number_format, so Excel can sum and filter them. Rows are consumed in
+        batches and written in a worker thread; memory stays flat because
+        write-only sheets never keep cell objects. Past the Excel row limit
+        the export continues on a new sheet with the same header.
+        Returns a file positioned at the start (spilled to disk when large).
+        """
+        workbook = Workbook(write_only=True)
+        sheets = _WriteOnlySheets(workbook, columns, sheet_title, max_rows_per_sheet)
+
+        batch: List[Dict[str, Any]] = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                await asyncio.to_thread(sheets.append_rows, batch)
+                batch = []
+        # Also creates the sheet (header only) when there were no rows
+        await asyncio.to_thread(sheets.append_rows, batch)
+
+        output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        await asyncio.to_thread(workbook.save, output)
+        output.seek(0)
+        return output
+
+    async def export_to_pdf_paginated(
+        self,
+        rows: AsyncIterable[Dict[str, Any]],
+        columns: Sequence[PdfColumn],
+        title: str = "Report"
+    ) -> IO:
+        """
+        Export rows to a multi-page PDF, one page-sized table at a time.
+
+        Every page repeats the header row and uses the given fixed column
+        widths. Pages are drawn in a worker thread as soon as enough rows for
+        one page arrive, so the event loop keeps serving other requests.
+        Returns a file positioned at the start (spilled to disk when large).
+        """
+        output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        writer = _PdfPageWriter(output, columns, title)
+
+        page: List[Dict[str, Any]] = []
+        pages = 0
+        async for row in rows:
+            page.append(row)
+            if len(page) >= writer.rows_per_page:
+                await asyncio.to_thread(writer.write_page, page)
+                pages += 1
+                page = []
+        if page:
+            await asyncio.to_thread(writer.write_page, page)
+        elif not pages:
+            writer.write_empty()
+
+        await asyncio.to_thread(writer.save)
+        output.seek(0)
+        return output
+
+    async def export_to_parquet_stream(
+        self,
+        rows: AsyncIterable[Dict[str, Any]],
+        columns: Sequence[ReportColumn],
+        row_group_rows: int = PARQUET_ROW_GROUP_ROWS
+    ) -> IO:
+        """
+        Export rows to Parquet with typed Arrow columns (see _arrow_schema),
+        one row group per `row_group_rows` rows.
+        Returns a file positioned at the start (spilled to disk when large).
+        """
+        pa = _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        schema = _arrow_schema(pa, columns)
+
+        output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        writer = pq.ParquetWriter(output, schema, compression="snappy")
+
+        def write(batch: List[Dict[str, Any]]) -> None:
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+
+        batch: List[Dict[str, Any]] = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= row_group_rows:
+                await asyncio.to_thread(write, batch)
+                batch = []
+        if batch:
+            await asyncio.to_thread(write, batch)
+
+        await asyncio.to_thread(writer.close)
+        output.seek(0)
+        return output
+
+    async def stream_arrow(
+        self,
+        rows: AsyncIterable[Dict[str, Any]],
+        columns: Sequence[ReportColumn],
+        batch_rows: int = ARROW_BATCH_ROWS
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream rows as an Arrow IPC stream, one record batch per `batch_rows`
+        rows. Same column types as Parquet; each batch is sent as soon as it is
+        read from the cursor, so nothing is spooled to disk.
+        """
+        pa = _import_pyarrow()
+        schema = _arrow_schema(pa, columns)
+        sink = BytesIO()
+        writer = pa.ipc.new_stream(sink, schema)
+
+        def drain() -> bytes:
+            data = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return data
+
+        def write(batch: List[Dict[str, Any]]) -> bytes:
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            return drain()
+
+        yield drain()  # schema message
+        batch: List[Dict[str, Any]] = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                yield await asyncio.to_thread(write, batch)
+                batch = []
+        if batch:
+            yield await asyncio.to_thread(write, batch)
+        writer.close()
+        yield drain()  # end-of-stream marker
+
+    async def export_rows(
+        self,
+        rows: AsyncIterable[Dict[str, Any]],
+        columns: Sequence[ReportColumn],
+        format: str,
+        title: str = "Report"
+    ) -> Union[AsyncIterator[bytes], Iterator[bytes]]:
+        """
+        Write typed report rows in any of EXPORT_FORMATS.
+
+        All formats consume the same row iterator: CSV and Arrow are streamed
+        as they are written, the others are built with constant memory (write-only xlsx,
+        Parquet row groups, PDF pages) and then sent in chunks.
+        """
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {format}")
+
+        if format == "parquet":
+            return self.iter_file(await self.export_to_parquet_stream(rows, columns))
+
+        if format == "arrow":
+            return self.stream_arrow(rows, columns)
+
+        if format == "excel":
+            excel_columns = [
+                ExcelColumn(c.header, c.key, _EXCEL_NUMBER_FORMATS.get(c.type), width=max(10, len(c.header) + 2))
+                for c in columns
+            ]
+            excel_rows = (
+                {c.key: _excel_value(row.get(c.key), c.type) for c in columns}
+                async for row in rows
+            )
+            workbook = await self.export_to_excel_stream(excel_rows, excel_columns, sheet_title=title[:31])
+            return self.iter_file(workbook)
+
+        text_rows = (
+            {c.key: _text_value(row.get(c.key), c.type) for c in columns}
+            async for row in rows
+        )
+        if format == "csv":
+            return self.stream_csv(text_rows, [c.key for c in columns], header=[c.header for c in columns])
+
+        usable_width = landscape(letter)[0] - 2 * PDF_MARGIN
+        fixed = sum(c.width for c in columns if c.width)
+        flexible = [c for c in columns if not c.width]
+        default_width = (usable_width - fixed) / len(flexible) if flexible else 0
+        pdf_columns = [PdfColumn(c.header, c.key, c.width or default_width) for c in columns]
+        document = await self.export_to_pdf_paginated(text_rows, pdf_columns, title=title)
+        return self.iter_file(document)
+
+    @staticmethod
+    def iter_file(file: IO, chunk_size: int = FILE_CHUNK_BYTES) -> Iterator[bytes]:
+        """Read a generated file in fixed-size chunks and close it at the end."""
+        try:
+            while chunk := file.read(chunk_size):
+                yield chunk
+        finally:
+            file.close()
+
     def export_to_excel(self, data: List[Dict[str, Any]]) -> BytesIO:
         """
         Export list of dictionaries to Excel (xlsx).
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import List, Optional
+from app.core.datetime_utils import business_today
+from app.domain.reporting.entities.daily_financial_summary import DailyFinancialSummary
+from app.domain.reporting.repositories.financial_rollup_repository import FinancialRollupRepository
+
+logger = logging.getLogger(__name__)
+
+
+class FinancialRollupService:
+    """
+    Resúmenes financieros diarios materializados en financial_reports.
+
+    Los días cerrados (anteriores a hoy) se leen de la tabla de rollups; hoy y
+    cualquier día que aún no tenga fila se calculan desde las tablas de origen.
+
+    Un día cerrado todavía puede cambiar: un cobro de hoy de un parqueo que entró
+    ayer (los ingresos van al día de entrada), un gasto o bono con fecha pasada,
+    una mensualidad editada. Esas escrituras marcan el día como sucio; refresh()
+    recalcula los días marcados además de los últimos `lookback_days`, y mientras
+    tanto las lecturas calculan en vivo los días marcados.
+    """
+
+    def __init__(self, repository: FinancialRollupRepository, lookback_days: int = 3):
+        self.repository = repository
+        self.lookback_days = lookback_days
+
+    async def refresh(self) -> int:
+        """Materializa los días cerrados pendientes. Retorna cuántos días escribió."""
+        yesterday = business_today() - timedelta(days=1)
+        latest = await self.repository.get_latest_day()
+
+        start = yesterday - timedelta(days=self.lookback_days - 1)
+        if latest is not None and latest + timedelta(days=1) < start:
+            # Días cerrados que el job no alcanzó a materializar (p. ej. servidor apagado)
+            start = latest + timedelta(days=1)
+
+        # Las marcas se leen antes de recalcular y se borran solo después de
+        # guardar cada tramo: mientras tanto las lecturas siguen calculando en
+        # vivo esos días, y si el proceso cae las marcas siguen ahí. Una
+        # escritura durante el recálculo renueva su marca y no se borra.
+        marks = await self.repository.get_dirty_marks()
+        written = 0
+        runs = [(start, yesterday)] + list(
+            self._runs([day for day in marks if not start <= day <= yesterday])
+        )
+        for run_start, run_end in runs:
+            written += await self.rebuild(run_start, run_end)
+            await self.repository.clear_dirty_marks(
+                {day: marked_at for day, marked_at in marks.items() if run_start <= day <= run_end}
+            )
+        return written
+
+    async def rebuild(self, start_date: date, end_date: date) -> int:
+        """Recalcula y guarda [start_date, end_date]; es idempotente."""
+        end_date = min(end_date, business_today() - timedelta(days=1))
+        if end_date < start_date:
+            return 0
+        summaries = await self.repository.compute_daily(start_date, end_date)
+        await self.repository.upsert_daily(summaries)
+        return len(summaries)
+
+    async def get_daily_summaries(self, start_date: date, end_date: date) -> List[DailyFinancialSummary]:
+        """Un resumen por día del rango, incluidos los días sin movimiento."""
+        if end_date < start_date:
+            return []
+
+        today = business_today()
+        closed_end = min(end_date, today - timedelta(days=1))
+        by_day = {}
+        if start_date <= closed_end:
+            by_day = {s.day: s for s in await self.repository.get_daily(start_date, closed_end)}
+            # Días marcados que el refresh aún no recalculó: en vivo
+            for day in await self.repository.get_dirty_days(start_date, closed_end):
+                by_day.pop(day, None)
+
+        # Tramos sin rollup (días nunca materializados, hoy o fechas futuras)
+        missing: List[DailyFinancialSummary] = []
+        for gap_start, gap_end in self._gaps(start_date, end_date, by_day):
+            missing.extend(await self.repository.compute_daily(gap_start, gap_end))
+        for summary in missing:
+            by_day[summary.day] = summary
+
+        return [by_day[day] for day in sorted(by_day)]
+
+    @staticmethod
+    def _runs(days: List[date]):
+        """Agrupa días ordenados en tramos consecutivos [inicio, fin]."""
+        run_start = run_end = None
+        for day in sorted(days):
+            if run_end is not None and day == run_end + timedelta(days=1):
+                run_end = day
+                continue
+            if run_start is not None:
+                yield run_start, run_end
+            run_start = run_end = day
+        if run_start is not None:
+            yield run_start, run_end
+
+    @staticmethod
+    def _gaps(start_date: date, end_date: date, present: dict):
+        gap_start: Optional[date] = None
+        current = start_date
+        while current <= end_date:
+            if current not in present:
+                gap_start = gap_start or current
+            elif gap_start is not None:
+                yield gap_start, current - timedelta(days=1)
+                gap_start = None
+            current += timedelta(days=1)
+        if gap_start is not None:
+            yield gap_start, end_date
+
+
+async def run_financial_rollup_refresh(service: FinancialRollupService, interval_seconds: int) -> None:
+    """Job periódico arrancado con la aplicación; los errores no lo detienen."""
+    while True:
+        try:
+            written = await service.refresh()
+            logger.info("Financial rollups refreshed: %s day(s)", written)
+        except Exception:
+            logger.exception("Financial rollup refresh failed")
+        await asyncio.sleep(interval_seconds)
@@ -1,23 +1,51 @@
-from datetime import date
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Dict, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.domain.reporting.services.revenue_service import RevenueService
+from app.domain.reporting.services.financial_rollup_service import FinancialRollupService
+from app.domain.reporting.services.export_service import ReportColumn
 from app.domain.financial.repositories.expense_repository import ExpenseRepository
 from app.domain.financial.repositories.bonus_repository import BonusRepository
 from app.api.schemas.reporting_schemas import PerformanceReportResponse
 
 class PerformanceService:
+    EXPORT_COLUMNS = [
+        ReportColumn("date", "Date", "date"),
+        ReportColumn("income", "Income", "money"),
+        ReportColumn("expenses", "Expenses", "money"),
+        ReportColumn("bonuses", "Bonuses", "money"),
+        ReportColumn("net_performance", "Net Performance", "money"),
+    ]
+
     def __init__(
         self, 
         db: AsyncSession, 
         expense_repository: ExpenseRepository,
-        bonus_repository: BonusRepository
+        bonus_repository: BonusRepository,
+        rollup_service: Optional[FinancialRollupService] = None
     ):
         self.db = db
         self.revenue_service = RevenueService(db)
         self.expense_repository = expense_repository
         self.bonus_repository = bonus_repository
+        self.rollup_service = rollup_service
 
     async def calculate_performance(self, start_date: date, end_date: date) -> PerformanceReportResponse:
+        if self.rollup_service is not None:
+            # Ingresos, gastos y bonos vienen en el mismo resumen diario
+            summaries = await self.rollup_service.get_daily_summaries(start_date, end_date)
+            total_income = sum(s.total_income for s in summaries)
+            total_expenses = sum(s.total_expenses for s in summaries)
+            total_bonuses = sum(s.total_bonuses for s in summaries)
+            return PerformanceReportResponse(
+                start_date=start_date,
+                end_date=end_date,
+                total_income=total_income,
+                total_expenses=total_expenses,
+                total_bonuses=total_bonuses,
+                net_performance=total_income - (total_expenses + total_bonuses)
+            )
+
         # 1. Get Total Revenue
         # We use 'day' grouping but we only care about the total_period_income
         revenue_report = await self.revenue_service.get_consolidated_revenue(start_date, end_date, group_by='day')
@@ -41,3 +69,36 @@ class PerformanceService:
             total_bonuses=total_bonuses,
             net_performance=net_performance
         )
+
+    async def iter_rows(self, start_date: date, end_date: date) -> AsyncIterator[Dict[str, Any]]:
+        """Rendimiento por día del rango (ver EXPORT_COLUMNS), incluidos días sin movimiento."""
+        if self.rollup_service is not None:
+            summaries = await self.rollup_service.get_daily_summaries(start_date, end_date)
+            income = {s.day: s.total_income for s in summaries}
+            expenses = {s.day: s.total_expenses for s in summaries}
+            bonuses = {s.day: s.total_bonuses for s in summaries}
+        else:
+            revenue_report = await self.revenue_service.get_consolidated_revenue(start_date, end_date, group_by='day')
+            income = {item.date: item.total_income for item in revenue_report.data}
+            expenses = {
+                item['date']: item['total'] or 0
+                for item in await self.expense_repository.get_daily_expenses(start_date, end_date)
+            }
+            bonuses = {
+                item['date']: item['total'] or 0
+                for item in await self.bonus_repository.get_daily_bonuses(start_date, end_date)
+            }
+
+        current = start_date
+        while current <= end_date:
+            day_income = income.get(current, 0)
+            day_expenses = expenses.get(current, 0)
+            day_bonuses = bonuses.get(current, 0)
+            yield {
+                "date": current,
+                "income": day_income,
+                "expenses": day_expenses,
+                "bonuses": day_bonuses,
+                "net_performance": day_income - (day_expenses + day_bonuses),
+            }
+            current += timedelta(days=1)
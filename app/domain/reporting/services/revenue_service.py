@@ -1,18 +1,76 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, cast, Date
 from datetime import date, timedelta
-from typing import List, Dict
+from typing import Any, AsyncIterator, List, Dict, Optional
 from collections import defaultdict
 from app.infrastructure.database.models.vehicles import ParkingRecord
 from app.infrastructure.database.models.services import WashingService
 from app.infrastructure.database.models.subscriptions import MonthlySubscription
 from app.api.schemas.reporting_schemas import RevenueStats, RevenueReportResponse
+from app.core.datetime_utils import date_range_bounds
+from app.domain.reporting.services.financial_rollup_service import FinancialRollupService
+from app.domain.reporting.services.export_service import ReportColumn
 
 class RevenueService:
-    def __init__(self, db: AsyncSession):
+    EXPORT_COLUMNS = [
+        ReportColumn("date", "Date", "date"),
+        ReportColumn("parking_income", "Parking Income", "money"),
+        ReportColumn("washing_income", "Washing Income", "money"),
+        ReportColumn("subscription_income", "Subscription Income", "money"),
+        ReportColumn("total_income", "Total Income", "money"),
+    ]
+
+    def __init__(self, db: AsyncSession, rollup_service: Optional[FinancialRollupService] = None):
         self.db = db
+        self.rollup_service = rollup_service
 
     async def get_consolidated_revenue(self, start_date: date, end_date: date, group_by: str = 'day') -> RevenueReportResponse:
+        if self.rollup_service is not None:
+            sorted_stats = await self._daily_stats_from_rollups(start_date, end_date)
+        else:
+            sorted_stats = await self._daily_stats_from_raw(start_date, end_date)
+
+        # Handle Grouping
+        final_data = []
+        if group_by == 'day':
+            final_data = sorted_stats
+        elif group_by == 'week':
+            final_data = self._group_by_week(sorted_stats)
+        elif group_by == 'month':
+            final_data = self._group_by_month(sorted_stats)
+        
+        total_period_income = sum(item.total_income for item in final_data)
+
+        return RevenueReportResponse(
+            start_date=start_date,
+            end_date=end_date,
+            group_by=group_by,
+            data=final_data,
+            total_period_income=total_period_income
+        )
+
+    async def iter_rows(self, start_date: date, end_date: date, group_by: str = 'day') -> AsyncIterator[Dict[str, Any]]:
+        """Rows for the exporters (see EXPORT_COLUMNS)."""
+        report = await self.get_consolidated_revenue(start_date, end_date, group_by)
+        for item in report.data:
+            yield item.model_dump()
+
+    async def _daily_stats_from_rollups(self, start_date: date, end_date: date) -> List[RevenueStats]:
+        summaries = await self.rollup_service.get_daily_summaries(start_date, end_date)
+        # Same shape as the raw queries: only days that had income
+        return [
+            RevenueStats(
+                date=summary.day,
+                parking_income=summary.parking_income,
+                washing_income=summary.washing_income,
+                subscription_income=summary.subscription_income,
+                total_income=summary.total_income,
+            )
+            for summary in summaries
+            if summary.total_income
+        ]
+
+    async def _daily_stats_from_raw(self, start_date: date, end_date: date) -> List[RevenueStats]:
         # Initialize a dictionary to hold stats for each date
         daily_stats: Dict[date, RevenueStats] = defaultdict(lambda: RevenueStats(date=date.today()))
 
@@ -21,6 +79,9 @@ class RevenueService:
                 daily_stats[d] = RevenueStats(date=d)
             return daily_stats[d]
 
+        # Half-open timestamp range: keeps the entry_time/service_date indexes usable
+        range_start, range_end = date_range_bounds(start_date, end_date)
+
         # 1. Parking Revenue
         stmt_parking = (
             select(
@@ -28,8 +89,8 @@ class RevenueService:
                 func.sum(ParkingRecord.total_cost).label('total')
             )
             .where(ParkingRecord.payment_status == 'paid')
-            .where(cast(ParkingRecord.entry_time, Date) >= start_date)
-            .where(cast(ParkingRecord.entry_time, Date) <= end_date)
+            .where(ParkingRecord.entry_time >= range_start)
+            .where(ParkingRecord.entry_time < range_end)
             .group_by(cast(ParkingRecord.entry_time, Date))
         )
         result_parking = await self.db.execute(stmt_parking)
@@ -45,8 +106,8 @@ class RevenueService:
                 func.sum(WashingService.price).label('total')
             )
             .where(WashingService.payment_status == 'paid')
-            .where(cast(WashingService.service_date, Date) >= start_date)
-            .where(cast(WashingService.service_date, Date) <= end_date)
+            .where(WashingService.service_date >= range_start)
+            .where(WashingService.service_date < range_end)
             .group_by(cast(WashingService.service_date, Date))
         )
         result_washing = await self.db.execute(stmt_washing)
@@ -73,26 +134,7 @@ class RevenueService:
             stat.total_income += stat.subscription_income
 
         # Convert to list and sort
-        sorted_stats = sorted(daily_stats.values(), key=lambda x: x.date)
-
-        # Handle Grouping
-        final_data = []
-        if group_by == 'day':
-            final_data = sorted_stats
-        elif group_by == 'week':
-            final_data = self._group_by_week(sorted_stats)
-        elif group_by == 'month':
-            final_data = self._group_by_month(sorted_stats)
-        
-        total_period_income = sum(item.total_income for item in final_data)
-
-        return RevenueReportResponse(
-            start_date=start_date,
-            end_date=end_date,
-            group_by=group_by,
-            data=final_data,
-            total_period_income=total_period_income
-        )
+        return sorted(daily_stats.values(), key=lambda x: x.date)
 
     def _group_by_week(self, stats: List[RevenueStats]) -> List[RevenueStats]:
         weekly_map: Dict[date, RevenueStats] = {}
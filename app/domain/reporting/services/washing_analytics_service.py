@@ -1,9 +1,17 @@
 from datetime import date, timedelta
-from typing import List
+from typing import Any, AsyncIterator, Dict, List
 from app.domain.washing.repositories.washing_service_repository import IWashingServiceRepository
 from app.api.schemas.reporting_schemas import WashingAnalyticsResponse, WashingDurationStat
+from app.domain.reporting.services.export_service import ReportColumn
 
 class WashingAnalyticsService:
+    EXPORT_COLUMNS = [
+        ReportColumn("washer_id", "Washer ID", "int"),
+        ReportColumn("service_type", "Service Type", "category"),
+        ReportColumn("avg_duration_minutes", "Avg Duration (Minutes)", "float"),
+        ReportColumn("count", "Services", "int"),
+    ]
+
     def __init__(self, washing_repository: IWashingServiceRepository):
         self.washing_repository = washing_repository
 
@@ -30,3 +38,9 @@ class WashingAnalyticsService:
             end_date=end_date,
             stats=stats
         )
+
+    async def iter_rows(self, start_date: date, end_date: date) -> AsyncIterator[Dict[str, Any]]:
+        """Rows for the exporters (see EXPORT_COLUMNS)."""
+        report = await self.get_duration_analytics(start_date, end_date)
+        for stat in report.stats:
+            yield stat.model_dump()
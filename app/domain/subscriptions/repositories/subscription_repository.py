@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date
 from app.domain.subscriptions.entities.monthly_subscription import MonthlySubscription
 
@@ -17,6 +17,11 @@ class ISubscriptionRepository(ABC):
         """Obtiene la suscripción activa para un vehículo en la fecha dada."""
         pass
 
+    @abstractmethod
+    async def get_active_by_vehicle_ids(self, vehicle_ids: List[int], current_date: date) -> Dict[int, MonthlySubscription]:
+        """Suscripción activa de cada vehículo (la que vence más tarde), en una sola consulta."""
+        pass
+
     @abstractmethod
     async def update(self, subscription_id: int, subscription: MonthlySubscription) -> MonthlySubscription:
         pass
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+GLOBAL_ADMIN = "global_admin"
+OPERATIONAL_ADMIN = "operational_admin"
+WASHER = "washer"
+
+
+@dataclass
+class AccountIdentity:
+    """Credenciales mínimas de una cuenta de cualquier rol, para el login unificado."""
+    role: str
+    id: int
+    email: str
+    password_hash: str
+    is_active: bool
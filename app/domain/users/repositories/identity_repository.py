@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.domain.users.entities.account_identity import AccountIdentity
+
+class IIdentityRepository(ABC):
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[AccountIdentity]:
+        """
+        Cuenta con ese email en cualquiera de las tablas de usuarios, en una sola
+        consulta. Si el email existiera en varias, gana global_admin, luego
+        operational_admin y por último washer (el orden del login unificado).
+        """
+        pass
+
+    @abstractmethod
+    async def record_login(self, role: str, user_id: int, new_password_hash: Optional[str] = None) -> None:
+        """Guarda last_login y, si se indica, el hash rehecho con el costo actual."""
+        pass
@@ -18,3 +18,7 @@ class IOperationalAdminRepository(ABC):
     @abstractmethod
     async def update_last_login(self, admin_id: int):
         pass
+
+    @abstractmethod
+    async def update_password(self, admin_id: int, new_password_hash: str) -> None:
+        pass
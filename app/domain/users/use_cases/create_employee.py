@@ -3,7 +3,7 @@ from app.infrastructure.repositories.users.operational_admin_repository_impl imp
 from app.infrastructure.repositories.washers.washer_repository_impl import WasherRepositoryImpl
 from app.application.dto.users.employee_create_request import EmployeeCreateRequest
 from app.application.dto.users.employee_response import EmployeeResponse
-from app.core.security import get_password_hash
+from app.core.security import password_hasher
 from fastapi import HTTPException
 
 
@@ -38,7 +38,7 @@ class CreateEmployee:
             raise HTTPException(status_code=400, detail="Email already registered")
         
         # Hash de la contraseña
-        password_hash = get_password_hash(data.password)
+        password_hash = await password_hasher.hash(data.password)
         
         # Crear según el rol
         if data.role == 'global_admin':
@@ -1,6 +1,7 @@
 from app.infrastructure.repositories.users.global_admin_repository_impl import GlobalAdminRepositoryImpl
 from app.infrastructure.repositories.users.operational_admin_repository_impl import OperationalAdminRepositoryImpl
 from app.infrastructure.repositories.washers.washer_repository_impl import WasherRepositoryImpl
+from app.infrastructure.cache.principal_cache import invalidate_principal
 from fastapi import HTTPException
 
 
@@ -43,4 +44,6 @@ class DeleteEmployee:
         if not result:
             raise HTTPException(status_code=404, detail="Employee not found")
         
+        # Los tokens ya emitidos dejan de resolver al empleado en este worker
+        invalidate_principal(role, employee_id)
         return True
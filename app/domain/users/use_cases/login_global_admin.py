@@ -1,24 +1,32 @@
 from typing import Optional
 from app.domain.users.repositories.global_admin_repository import IGlobalAdminRepository
-from app.core.security import verify_password, create_access_token
+from app.core.security import password_hasher, create_access_token
 from app.application.dto.auth.token_response import TokenResponse
+from app.infrastructure.cache.login_attempt_limiter import LoginAttemptLimiter, login_attempt_limiter
 
 class LoginGlobalAdmin:
-    def __init__(self, repo: IGlobalAdminRepository):
+    def __init__(self, repo: IGlobalAdminRepository, limiter: LoginAttemptLimiter = login_attempt_limiter):
         self.repo = repo
+        self.limiter = limiter
 
     async def execute(self, email: str, password: str) -> Optional[TokenResponse]:
-        admin = await self.repo.get_by_email(email)
-        if not admin:
-            return None
-        
-        if not verify_password(password, admin.password_hash):
-            return None
-            
-        if not admin.is_active:
-            return None 
-            
+        # El intento cuenta como posible fallo hasta que se verifica la contraseña
+        with self.limiter.attempt(email):
+            admin = await self.repo.get_by_email(email)
+            valid, new_hash = (False, None)
+            if admin:
+                valid, new_hash = await password_hasher.verify_and_update(password, admin.password_hash)
+            if not valid:
+                self.limiter.record_failure(email)
+                return None
+                
+            if not admin.is_active:
+                return None 
+                
+            self.limiter.record_success(email)
         if admin.id:
+            if new_hash:
+                await self.repo.update_password(admin.id, new_hash)
             await self.repo.update_last_login(admin.id)
             
         access_token = create_access_token(subject=admin.id, additional_claims={"role": "global_admin"})
@@ -0,0 +1,49 @@
+from typing import Optional
+from app.domain.users.repositories.identity_repository import IIdentityRepository
+from app.core.security import PasswordHasher, password_hasher, create_access_token
+from app.application.dto.auth.token_response import TokenResponse
+from app.infrastructure.cache.login_attempt_limiter import LoginAttemptLimiter, login_attempt_limiter
+
+class LoginUnified:
+    """
+    Login con cualquier rol: una consulta encuentra la cuenta y su rol, y se
+    verifica la contraseña una sola vez (en el pool de bcrypt, fuera del event loop).
+    """
+
+    def __init__(
+        self,
+        identity_repo: IIdentityRepository,
+        limiter: LoginAttemptLimiter = login_attempt_limiter,
+        hasher: PasswordHasher = password_hasher
+    ):
+        self.identity_repo = identity_repo
+        self.limiter = limiter
+        self.hasher = hasher
+
+    async def execute(self, email: str, password: str) -> Optional[TokenResponse]:
+        # Lanza TooManyLoginAttempts sin tocar la BD si la cuenta está bloqueada; el
+        # intento cuenta como posible fallo hasta que se verifica la contraseña
+        with self.limiter.attempt(email):
+            identity = await self.identity_repo.find_by_email(email)
+            valid, new_hash = (False, None)
+            if identity:
+                valid, new_hash = await self.hasher.verify_and_update(password, identity.password_hash)
+            if not valid:
+                self.limiter.record_failure(email)
+                return None
+
+            if not identity.is_active:
+                return None
+
+            self.limiter.record_success(email)
+        # new_hash: el hash guardado usa otro costo de bcrypt; se reemplaza en el mismo UPDATE
+        await self.identity_repo.record_login(identity.role, identity.id, new_password_hash=new_hash)
+
+        access_token = create_access_token(subject=identity.id, additional_claims={"role": identity.role})
+        return TokenResponse(
+            access_token=access_token,
+            token_type="bearer",
+            user_id=identity.id,
+            email=identity.email,
+            role=identity.role
+        )
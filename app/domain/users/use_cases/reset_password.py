@@ -1,6 +1,7 @@
 from typing import Optional
 from app.domain.users.repositories.global_admin_repository import IGlobalAdminRepository
-from app.core.security import verify_password_reset_token, get_password_hash
+from app.core.security import verify_password_reset_token, password_hasher
+from app.infrastructure.cache.principal_cache import invalidate_principal
 
 class ResetPassword:
     def __init__(self, repo: IGlobalAdminRepository):
@@ -15,6 +16,7 @@ class ResetPassword:
         if not admin:
             return False
             
-        new_hash = get_password_hash(new_password)
+        new_hash = await password_hasher.hash(new_password)
         await self.repo.update_password(admin.id, new_hash)
+        invalidate_principal("global_admin", admin.id)
         return True
@@ -5,7 +5,8 @@ from app.infrastructure.repositories.users.operational_admin_repository_impl imp
 from app.infrastructure.repositories.washers.washer_repository_impl import WasherRepositoryImpl
 from app.application.dto.users.employee_update_request import EmployeeUpdateRequest
 from app.application.dto.users.employee_response import EmployeeResponse
-from app.core.security import get_password_hash
+from app.infrastructure.cache.principal_cache import invalidate_principal
+from app.core.security import password_hasher
 
 class UpdateEmployee:
     """Caso de uso para actualizar un empleado existente."""
@@ -64,9 +65,11 @@ class UpdateEmployee:
         if data.is_active is not None:
             admin.is_active = data.is_active
         if data.password is not None:
-            admin.password_hash = get_password_hash(data.password)
+            admin.password_hash = await password_hasher.hash(data.password)
             
         updated_admin = await self.global_admin_repo.update(employee_id, admin)
+        # p. ej. is_active=False debe aplicarse ya, no al vencer el TTL
+        invalidate_principal('global_admin', employee_id)
         
         return EmployeeResponse(
             id=updated_admin.id,
@@ -93,9 +96,10 @@ class UpdateEmployee:
         if data.is_active is not None:
             admin.is_active = data.is_active
         if data.password is not None:
-            admin.password_hash = get_password_hash(data.password)
+            admin.password_hash = await password_hasher.hash(data.password)
             
         updated_admin = await self.operational_admin_repo.update(employee_id, admin)
+        invalidate_principal('operational_admin', employee_id)
         
         return EmployeeResponse(
             id=updated_admin.id,
@@ -124,7 +128,7 @@ class UpdateEmployee:
         if data.commission_percentage is not None:
             washer.commission_percentage = data.commission_percentage
         if data.password is not None:
-            washer.password_hash = get_password_hash(data.password)
+            washer.password_hash = await password_hasher.hash(data.password)
             
         updated_washer = await self.washer_repo.update(employee_id, washer)
         
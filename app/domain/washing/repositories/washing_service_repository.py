@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import date
 from app.domain.washing.entities.washing_service import WashingService
 
@@ -12,6 +12,10 @@ class IWashingServiceRepository(ABC):
     async def get_by_id(self, service_id: int) -> Optional[WashingService]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, service_ids: Iterable[int]) -> Dict[int, WashingService]:
+        pass
+
     @abstractmethod
     async def update(self, service_id: int, service: WashingService) -> WashingService:
         pass
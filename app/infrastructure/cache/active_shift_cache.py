@@ -0,0 +1,35 @@
+"""
+Caché del turno activo de cada administrador.
+
+Clave (id de administrador, fecha): cada entrada de parqueo y cada lavado
+necesitan el turno abierto del día, que solo cambia al iniciarlo o cerrarlo.
+StartShift y CloseShift invalidan la entrada del administrador. Como es por
+proceso, otro worker puede seguir usando un turno recién cerrado hasta que
+venza el TTL (SHIFT_CACHE_TTL_SECONDS).
+"""
+from datetime import date
+from typing import Awaitable, Callable, Optional
+from app.core.config import settings
+from app.infrastructure.cache.ttl_cache import TTLCache
+
+active_shift_cache = TTLCache(ttl_seconds=settings.SHIFT_CACHE_TTL_SECONDS, max_entries=1024)
+
+
+def invalidate_active_shift(admin_id: int) -> None:
+    active_shift_cache.invalidate((admin_id, date.today()))
+
+
+async def get_active_shift_id(admin_id: int, loader: Callable[[], Awaitable[Optional[int]]]) -> Optional[int]:
+    """
+    Id del turno abierto hoy por el administrador, cacheado o cargado con
+    `loader`. "Sin turno" no se cachea: el turno puede iniciarse en otro worker.
+    """
+    key = (admin_id, date.today())
+    shift_id = active_shift_cache.get(key)
+    if shift_id is None:
+        # Una carga que empezó antes de una invalidación no se guarda
+        generation = active_shift_cache.generation
+        shift_id = await loader()
+        if shift_id is not None and active_shift_cache.generation == generation:
+            active_shift_cache.set(key, shift_id)
+    return shift_id
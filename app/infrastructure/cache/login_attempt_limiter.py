@@ -0,0 +1,164 @@
+"""
+Límite de intentos de login fallidos por cuenta (email).
+
+Tras LOGIN_MAX_FAILED_ATTEMPTS fallos dentro de LOGIN_ATTEMPT_WINDOW_SECONDS la
+cuenta queda bloqueada LOGIN_LOCKOUT_SECONDS: los intentos se rechazan antes de
+consultar la BD y sin ejecutar bcrypt. Los intentos en curso cuentan como fallos
+posibles, así una ráfaga concurrente no pasa el chequeo antes del primer fallo.
+Es por proceso, como TTLCache.
+"""
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator
+from app.core.config import settings
+
+
+class TooManyLoginAttempts(Exception):
+    def __init__(self, retry_after: int):
+        super().__init__("Too many failed login attempts")
+        self.retry_after = retry_after
+
+
+@dataclass
+class _Attempts:
+    failures: int
+    window_started_at: float
+    locked_until: float = 0.0
+    # Intentos que pasaron el chequeo y aún no terminan
+    in_flight: int = 0
+
+
+class LoginAttemptLimiter:
+    """Cuenta fallos por email en una ventana fija y bloquea al superar el máximo."""
+
+    def __init__(
+        self,
+        max_failures: int,
+        window_seconds: float,
+        lockout_seconds: float,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_failures = max_failures
+        self.window_seconds = window_seconds
+        self.lockout_seconds = lockout_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._attempts: Dict[str, _Attempts] = {}
+        self.blocked = 0
+
+    @staticmethod
+    def _key(email: str) -> str:
+        return email.strip().lower()
+
+    def check(self, email: str) -> None:
+        """
+        Lanza TooManyLoginAttempts si la cuenta está bloqueada o si los fallos
+        más los intentos en curso ya alcanzan el máximo.
+        """
+        if self.max_failures <= 0:
+            return
+        attempts = self._attempts.get(self._key(email))
+        if attempts is None:
+            return
+        now = self._clock()
+        remaining = attempts.locked_until - now
+        if remaining > 0:
+            self.blocked += 1
+            raise TooManyLoginAttempts(retry_after=max(1, int(remaining + 0.999)))
+        failures = attempts.failures if now - attempts.window_started_at < self.window_seconds else 0
+        if failures + attempts.in_flight >= self.max_failures:
+            # Los intentos en curso terminan enseguida: se reintenta en un segundo
+            self.blocked += 1
+            raise TooManyLoginAttempts(retry_after=1)
+
+    @contextmanager
+    def attempt(self, email: str) -> Iterator[None]:
+        """
+        check() y el intento queda en curso hasta salir del bloque, donde se
+        registra su resultado con record_failure / record_success.
+        """
+        self.check(email)
+        if self.max_failures <= 0:
+            yield
+            return
+        attempts = self._entry(self._key(email), self._clock())
+        attempts.in_flight += 1
+        try:
+            yield
+        finally:
+            self._release(email)
+
+    def _release(self, email: str) -> None:
+        key = self._key(email)
+        attempts = self._attempts.get(key)
+        if attempts is None:
+            # Descartada por _prune mientras estaba en curso
+            return
+        attempts.in_flight = max(0, attempts.in_flight - 1)
+        if not attempts.in_flight and not attempts.failures and attempts.locked_until <= self._clock():
+            del self._attempts[key]
+
+    def _entry(self, key: str, now: float) -> _Attempts:
+        """Entrada de la cuenta con la ventana vigente (los intentos en curso se conservan)."""
+        attempts = self._attempts.get(key)
+        if attempts is None:
+            if len(self._attempts) >= self.max_entries:
+                self._prune(now)
+            attempts = self._attempts[key] = _Attempts(failures=0, window_started_at=now)
+        elif now - attempts.window_started_at >= self.window_seconds:
+            attempts.failures = 0
+            attempts.window_started_at = now
+        return attempts
+
+    def record_failure(self, email: str) -> None:
+        if self.max_failures <= 0:
+            return
+        now = self._clock()
+        attempts = self._entry(self._key(email), now)
+        attempts.failures += 1
+        if attempts.failures >= self.max_failures:
+            attempts.locked_until = now + self.lockout_seconds
+            # La ventana se reinicia cuando termina el bloqueo
+            attempts.failures = 0
+            attempts.window_started_at = attempts.locked_until
+
+    def record_success(self, email: str) -> None:
+        key = self._key(email)
+        attempts = self._attempts.get(key)
+        if attempts is None:
+            return
+        if attempts.in_flight:
+            # Otros intentos siguen en curso: se borran los fallos, no la entrada
+            attempts.failures = 0
+            attempts.locked_until = 0.0
+        else:
+            del self._attempts[key]
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            key for key, a in self._attempts.items()
+            if not a.in_flight and a.locked_until <= now and now - a.window_started_at >= self.window_seconds
+        ]
+        for key in expired:
+            del self._attempts[key]
+        if len(self._attempts) >= self.max_entries:
+            # Sigue lleno: se descarta la ventana más antigua
+            oldest = min(self._attempts, key=lambda k: self._attempts[k].window_started_at)
+            del self._attempts[oldest]
+
+    def stats(self) -> dict:
+        now = self._clock()
+        return {
+            "tracked_accounts": len(self._attempts),
+            "locked_accounts": sum(1 for a in self._attempts.values() if a.locked_until > now),
+            "blocked_attempts": self.blocked,
+        }
+
+
+login_attempt_limiter = LoginAttemptLimiter(
+    max_failures=settings.LOGIN_MAX_FAILED_ATTEMPTS,
+    window_seconds=settings.LOGIN_ATTEMPT_WINDOW_SECONDS,
+    lockout_seconds=settings.LOGIN_LOCKOUT_SECONDS,
+)
@@ -0,0 +1,36 @@
+"""
+Caché de principales autenticados (administradores resueltos desde el JWT).
+
+Clave (rol, id de usuario). Evita la consulta por id en cada petición
+autenticada; UpdateEmployee, DeleteEmployee y ResetPassword invalidan la
+entrada del usuario afectado. Como es por proceso, otro worker puede seguir
+viendo el dato anterior hasta que venza el TTL (PRINCIPAL_CACHE_TTL_SECONDS).
+"""
+import copy
+from typing import Any, Awaitable, Callable, Optional
+from app.core.config import settings
+from app.infrastructure.cache.ttl_cache import TTLCache
+
+principal_cache = TTLCache(ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS, max_entries=4096)
+
+
+def invalidate_principal(role: str, user_id: int) -> None:
+    principal_cache.invalidate((role, user_id))
+
+
+async def get_principal(role: str, user_id: int, loader: Callable[[], Awaitable[Optional[Any]]]) -> Optional[Any]:
+    """
+    Principal cacheado o cargado con `loader`. Los usuarios inexistentes no se
+    cachean. Cada llamada recibe su propia copia de la entidad.
+    """
+    key = (role, user_id)
+    user = principal_cache.get(key)
+    if user is None:
+        # Una carga que empezó antes de una invalidación no se guarda
+        generation = principal_cache.generation
+        user = await loader()
+        if user is None:
+            return None
+        if principal_cache.generation == generation:
+            principal_cache.set(key, user)
+    return copy.copy(user)
@@ -70,7 +70,9 @@ from app.infrastructure.database.models.system import (
     AuditLog,
     Notification,
     FinancialReport,
-    PasswordResetToken
+    PasswordResetToken,
+    CacheVersion,
+    RollupDirtyDay
 )
 
 __all__ = [
@@ -109,4 +111,6 @@ __all__ = [
     "Notification",
     "FinancialReport",
     "PasswordResetToken",
+    "CacheVersion",
+    "RollupDirtyDay",
 ]
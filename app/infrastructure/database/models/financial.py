@@ -70,6 +70,7 @@ class Expense(Base):
     __table_args__ = (
         Index('ix_expenses_expense_date', 'expense_date'),
         Index('ix_expenses_expense_type', 'expense_type'),
+        Index('ix_expenses_updated_at', 'updated_at', 'id'),
         CheckConstraint('amount >= 0', name='check_expenses_amount_positive'),
     )
     
@@ -100,6 +101,7 @@ class Bonus(Base):
     __table_args__ = (
         Index('ix_bonuses_bonus_date', 'bonus_date'),
         Index('ix_bonuses_washer_date', 'washer_id', 'bonus_date'),
+        Index('ix_bonuses_updated_at', 'updated_at', 'id'),
         CheckConstraint('amount >= 0', name='check_bonuses_amount_positive'),
     )
     
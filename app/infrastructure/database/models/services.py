@@ -1,7 +1,7 @@
 """
 Modelos SQLAlchemy para servicios de lavado y tarifas.
 """
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, TIMESTAMP, Index, CheckConstraint
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, TIMESTAMP, Index, CheckConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from . import Base
@@ -68,6 +68,18 @@ class WashingService(Base):
     __table_args__ = (
         Index('ix_washing_services_service_date', 'service_date'),
         Index('ix_washing_services_payment_status', 'payment_status'),
+        # Ingresos de lavado pagados por rango de fecha
+        Index(
+            'ix_washing_services_paid_service_date', 'service_date',
+            postgresql_where=text("payment_status = 'paid'"),
+            postgresql_include=['price']
+        ),
+        # Lavados en curso
+        Index(
+            'ix_washing_services_active', 'service_date',
+            postgresql_where=text('end_time IS NULL')
+        ),
+        Index('ix_washing_services_updated_at', 'updated_at', 'id'),
         CheckConstraint('price >= 0', name='check_washing_services_price_positive'),
         CheckConstraint(
             "payment_status IN ('pending', 'paid', 'cancelled')", 
@@ -31,6 +31,7 @@ class MonthlySubscription(Base):
     __table_args__ = (
         Index('ix_monthly_subscriptions_dates', 'start_date', 'end_date'),
         Index('ix_monthly_subscriptions_payment_status', 'payment_status'),
+        Index('ix_monthly_subscriptions_updated_at', 'updated_at', 'id'),
         CheckConstraint('monthly_fee >= 0', name='check_monthly_subscriptions_fee_positive'),
         CheckConstraint('end_date >= start_date', name='check_monthly_subscriptions_dates_valid'),
         CheckConstraint(
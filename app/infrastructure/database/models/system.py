@@ -1,7 +1,7 @@
 """
 Modelos SQLAlchemy para configuración del sistema, auditoría y notificaciones.
 """
-from sqlalchemy import Column, Integer, String, Text, Boolean, TIMESTAMP, Index, CheckConstraint, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Boolean, Date, TIMESTAMP, Index, CheckConstraint, ForeignKey, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from . import Base
@@ -104,7 +104,7 @@ class FinancialReport(Base):
     id = Column(Integer, primary_key=True, index=True)
     report_type = Column(String(50), nullable=False, index=True)  # daily, weekly, monthly, yearly
     report_date = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
-    generated_by = Column(Integer, ForeignKey("global_admins.id", ondelete="RESTRICT"), nullable=False)
+    generated_by = Column(Integer, ForeignKey("global_admins.id", ondelete="RESTRICT"), nullable=True)  # NULL = generado por el sistema
     shift_id = Column(Integer, ForeignKey("shifts.id", ondelete="SET NULL"), nullable=True)
     total_income = Column(Integer, default=0)  # En centavos
     total_expenses = Column(Integer, default=0)  # En centavos
@@ -123,6 +123,11 @@ class FinancialReport(Base):
     # Índices
     __table_args__ = (
         Index('ix_financial_reports_type_date', 'report_type', 'report_date'),
+        # Un solo rollup del sistema por tipo y fecha (los de administradores no cuentan)
+        Index(
+            'ux_financial_reports_rollup', 'report_type', 'report_date',
+            unique=True, postgresql_where=text('generated_by IS NULL')
+        ),
         CheckConstraint(
             "report_type IN ('daily', 'weekly', 'monthly', 'yearly')", 
             name='check_financial_reports_type_valid'
@@ -156,3 +161,40 @@ class PasswordResetToken(Base):
     
     def __repr__(self):
         return f"<PasswordResetToken(id={self.id}, user='{self.user_type}:{self.user_id}', used={self.is_used})>"
+
+
+class CacheVersion(Base):
+    """
+    Versión compartida de un catálogo cacheado en memoria (p. ej. "pricing").
+
+    Cada escritura que afecta al catálogo incrementa la versión; los workers
+    la consultan periódicamente y recargan su copia cuando cambia.
+    """
+    
+    __tablename__ = "cache_versions"
+    
+    # Columnas
+    name = Column(String(50), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    def __repr__(self):
+        return f"<CacheVersion(name='{self.name}', version={self.version})>"
+
+
+class RollupDirtyDay(Base):
+    """
+    Día cerrado cuyo resumen en financial_reports quedó desactualizado (un gasto
+    con fecha pasada, un cobro tardío, una mensualidad editada...). Se marca en
+    la misma transacción que el cambio; el refresh de rollups lo recalcula y
+    borra la marca.
+    """
+    
+    __tablename__ = "rollup_dirty_days"
+    
+    # Columnas
+    day = Column(Date, primary_key=True)
+    marked_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
+    
+    def __repr__(self):
+        return f"<RollupDirtyDay(day={self.day})>"
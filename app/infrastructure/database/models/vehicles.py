@@ -1,7 +1,7 @@
 """
 Modelos SQLAlchemy para vehículos y registros de parqueo.
 """
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, TIMESTAMP, Index, CheckConstraint
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, TIMESTAMP, Index, CheckConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from . import Base
@@ -52,7 +52,7 @@ class ParkingRecord(Base):
     vehicle_id = Column(Integer, ForeignKey("vehicles.id", ondelete="CASCADE"), nullable=False, index=True)
     shift_id = Column(Integer, ForeignKey("shifts.id", ondelete="RESTRICT"), nullable=False, index=True)
     admin_id = Column(Integer, ForeignKey("operational_admins.id", ondelete="RESTRICT"), nullable=False, index=True)
-    entry_time = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
+    entry_time = Column(TIMESTAMP(timezone=True), nullable=False)
     exit_time = Column(TIMESTAMP(timezone=True), nullable=True)
     parking_rate_id = Column(Integer, ForeignKey("rates.id", ondelete="RESTRICT"), nullable=False)
     subscription_id = Column(Integer, ForeignKey("monthly_subscriptions.id", ondelete="SET NULL"), nullable=True)
@@ -75,9 +75,33 @@ class ParkingRecord(Base):
     
     # Constraints
     __table_args__ = (
-        Index('ix_parking_records_entry_time', 'entry_time'),
+        # Listados por páginas (cursor sobre entry_time, id) y rangos por entrada
+        Index('ix_parking_records_entry_time_id', 'entry_time', 'id'),
         Index('ix_parking_records_exit_time', 'exit_time'),
         Index('ix_parking_records_payment_status', 'payment_status'),
+        # Un solo registro activo por vehículo; también sirve la búsqueda "activo por vehicle_id"
+        Index(
+            'ux_parking_records_active_vehicle_id', 'vehicle_id',
+            unique=True, postgresql_where=text('exit_time IS NULL')
+        ),
+        # Vehículos parqueados ordenados por entrada (/parking/active)
+        Index(
+            'ix_parking_records_active_entry_time_id', 'entry_time', 'id',
+            postgresql_where=text('exit_time IS NULL')
+        ),
+        # Ingresos pagados por rango de salida / entrada (estadísticas y reportes)
+        Index(
+            'ix_parking_records_paid_exit_time', 'exit_time',
+            postgresql_where=text("payment_status = 'paid'"),
+            postgresql_include=['total_cost']
+        ),
+        Index(
+            'ix_parking_records_paid_entry_time', 'entry_time',
+            postgresql_where=text("payment_status = 'paid'"),
+            postgresql_include=['total_cost']
+        ),
+        # Exportación incremental por updated_at (ingesta analítica)
+        Index('ix_parking_records_updated_at', 'updated_at', 'id'),
         CheckConstraint('total_cost >= 0', name='check_parking_records_total_cost_positive'),
         CheckConstraint(
             "payment_status IN ('pending', 'paid', 'cancelled')", 
@@ -0,0 +1,121 @@
+"""
+Métricas del pool de conexiones.
+
+Lleva la cuenta de cuántas conexiones se sacan del pool en cada request, para
+poder comprobar que un request usa una sola conexión (unit of work) en lugar de
+una por cada llamada a repositorio, y del tiempo que se espera por cada
+conexión (histograma y checkouts lentos) para dimensionar el pool con datos.
+"""
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from app.core.config import settings
+
+# Límites superiores (ms) de las cubetas del histograma de espera
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+RECENT_SLOW_CHECKOUTS = 20
+
+
+@dataclass
+class RequestCheckoutCounter:
+    """Contador de checkouts de un único request."""
+    checkouts: int = 0
+    path: Optional[str] = None
+
+
+_current_counter: ContextVar[Optional[RequestCheckoutCounter]] = ContextVar(
+    "db_request_checkout_counter", default=None
+)
+
+
+class PoolMetrics:
+    """Acumulado de checkouts y tiempos de espera del pool para todo el proceso."""
+
+    def __init__(self, slow_checkout_ms: float = 100.0):
+        self.slow_checkout_ms = slow_checkout_ms
+        self.requests = 0
+        self.checkouts = 0
+        self.checkouts_outside_requests = 0
+        self.max_checkouts_per_request = 0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.waits = 0
+        self.slow_checkouts = 0
+        self.checkout_timeouts = 0
+        self.recent_slow_checkouts = deque(maxlen=RECENT_SLOW_CHECKOUTS)
+
+    def start_request(self, path: Optional[str] = None) -> RequestCheckoutCounter:
+        counter = RequestCheckoutCounter(path=path)
+        _current_counter.set(counter)
+        return counter
+
+    def finish_request(self, counter: RequestCheckoutCounter) -> None:
+        self.requests += 1
+        if counter.checkouts > self.max_checkouts_per_request:
+            self.max_checkouts_per_request = counter.checkouts
+
+    def record_checkout(self) -> None:
+        self.checkouts += 1
+        counter = _current_counter.get()
+        if counter is not None:
+            counter.checkouts += 1
+        else:
+            self.checkouts_outside_requests += 1
+
+    def record_wait(self, wait_ms: float) -> None:
+        """Registra cuánto tardó el pool en entregar una conexión."""
+        self.waits += 1
+        self.wait_total_ms += wait_ms
+        if wait_ms > self.wait_max_ms:
+            self.wait_max_ms = wait_ms
+
+        for index, upper in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= upper:
+                self.wait_buckets[index] += 1
+                break
+        else:
+            self.wait_buckets[-1] += 1
+
+        if wait_ms >= self.slow_checkout_ms:
+            self.slow_checkouts += 1
+            counter = _current_counter.get()
+            self.recent_slow_checkouts.append({
+                "at": datetime.now(timezone.utc).isoformat(),
+                "wait_ms": round(wait_ms, 2),
+                "path": counter.path if counter else None,
+            })
+
+    def record_timeout(self) -> None:
+        self.checkout_timeouts += 1
+
+    def wait_histogram(self) -> dict:
+        labels = [f"le_{upper}ms" for upper in WAIT_BUCKETS_MS] + [f"gt_{WAIT_BUCKETS_MS[-1]}ms"]
+        return dict(zip(labels, self.wait_buckets))
+
+    def snapshot(self) -> dict:
+        request_checkouts = self.checkouts - self.checkouts_outside_requests
+        return {
+            "requests": self.requests,
+            "checkouts": self.checkouts,
+            "checkouts_outside_requests": self.checkouts_outside_requests,
+            "avg_checkouts_per_request": round(request_checkouts / self.requests, 3) if self.requests else 0.0,
+            "max_checkouts_per_request": self.max_checkouts_per_request,
+            "wait": {
+                "count": self.waits,
+                "avg_ms": round(self.wait_total_ms / self.waits, 3) if self.waits else 0.0,
+                "max_ms": round(self.wait_max_ms, 3),
+                "histogram": self.wait_histogram(),
+            },
+            "slow_checkouts": {
+                "threshold_ms": self.slow_checkout_ms,
+                "count": self.slow_checkouts,
+                "recent": list(self.recent_slow_checkouts),
+            },
+            "checkout_timeouts": self.checkout_timeouts,
+        }
+
+
+pool_metrics = PoolMetrics(slow_checkout_ms=settings.DB_SLOW_CHECKOUT_MS)
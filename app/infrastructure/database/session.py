@@ -1,14 +1,61 @@
+import time
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from app.core.config import settings
+from app.infrastructure.database.pool_metrics import pool_metrics
 
 DATABASE_URL = settings.DATABASE_URL
 if DATABASE_URL.startswith("postgresql://"):
     DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
 
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that times every checkout (waiting for a free slot, opening an
+    overflow connection and the pre-ping) and reports it to pool_metrics.
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_metrics.record_timeout()
+            raise
+        finally:
+            pool_metrics.record_wait((time.perf_counter() - started) * 1000)
+
+
+def _connect_args() -> dict:
+    if "+asyncpg" not in DATABASE_URL:
+        return {}
+
+    connect_args = {
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    }
+    server_settings = {}
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        server_settings["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+    if settings.TIMEZONE:
+        # Date casts/grouping in SQL then agree with the business day used in Python
+        server_settings["timezone"] = settings.TIMEZONE
+    if server_settings:
+        connect_args["server_settings"] = server_settings
+    return connect_args
+
+
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,
-    future=True
+    future=True,
+    poolclass=InstrumentedAsyncPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args=_connect_args(),
 )
 
 SessionLocal = async_sessionmaker(
@@ -17,6 +64,25 @@ SessionLocal = async_sessionmaker(
     class_=AsyncSession
 )
 
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _count_checkout(dbapi_connection, connection_record, connection_proxy):
+    pool_metrics.record_checkout()
+
+
+def pool_status() -> dict:
+    """Live state of the engine pool."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "timeout_seconds": settings.DB_POOL_TIMEOUT,
+    }
+
+
 async def get_session():
     async with SessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
@@ -0,0 +1,62 @@
+from typing import AsyncIterator, Callable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.infrastructure.database.session import SessionLocal
+
+
+class UnitOfWork:
+    """
+    One session (and so one pooled connection) shared by every repository
+    that takes part in a use case. Repositories only flush; the unit of work
+    commits once when the block finishes cleanly and rolls back otherwise.
+
+    The session checks out a connection lazily on its first statement, so a
+    unit of work that never touches the database costs nothing.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker = SessionLocal):
+        self._session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+        self._after_commit: List[Callable[[], None]] = []
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            raise RuntimeError("UnitOfWork is not active; use it as an async context manager")
+        return self._session
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._session = self._session_factory()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self._session.close()
+            self._session = None
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run callback once the work is committed (e.g. to invalidate caches).
+        Discarded on rollback.
+        """
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self) -> None:
+        self._after_commit = []
+        await self.session.rollback()
+
+
+async def get_unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """FastAPI dependency: one unit of work per request, shared by all its dependencies."""
+    async with UnitOfWork() as uow:
+        yield uow
@@ -1,12 +1,12 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date
 from sqlalchemy import select, update, delete as sql_delete
 from app.domain.agreements.entities.agreement import Agreement
 from app.domain.agreements.repositories.agreement_repository import IAgreementRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.subscriptions import Agreement as AgreementModel, AgreementVehicle
 
-class AgreementRepositoryImpl(IAgreementRepository):
+class AgreementRepositoryImpl(SessionScopedRepository, IAgreementRepository):
     
     def _to_entity(self, model: AgreementModel) -> Optional[Agreement]:
         if not model:
@@ -43,15 +43,15 @@ class AgreementRepositoryImpl(IAgreementRepository):
         )
 
     async def create(self, agreement: Agreement) -> Agreement:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             model = self._to_model(agreement)
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
             return self._to_entity(model)
 
     async def get_by_id(self, agreement_id: int) -> Optional[Agreement]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(AgreementModel).where(AgreementModel.id == agreement_id)
             )
@@ -59,7 +59,7 @@ class AgreementRepositoryImpl(IAgreementRepository):
             return self._to_entity(model)
 
     async def update(self, agreement_id: int, agreement: Agreement) -> Agreement:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             stmt = (
                 update(AgreementModel)
                 .where(AgreementModel.id == agreement_id)
@@ -77,7 +77,7 @@ class AgreementRepositoryImpl(IAgreementRepository):
                 )
             )
             await session.execute(stmt)
-            await session.commit()
+            await session.flush()
             
             result = await session.execute(
                 select(AgreementModel).where(AgreementModel.id == agreement_id)
@@ -86,14 +86,14 @@ class AgreementRepositoryImpl(IAgreementRepository):
             return self._to_entity(model)
 
     async def delete(self, agreement_id: int):
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             await session.execute(
                 sql_delete(AgreementModel).where(AgreementModel.id == agreement_id)
             )
-            await session.commit()
+            await session.flush()
 
     async def list_active(self) -> List[Agreement]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(AgreementModel).where(AgreementModel.is_active == 'active')
             )
@@ -101,13 +101,13 @@ class AgreementRepositoryImpl(IAgreementRepository):
             return [self._to_entity(m) for m in models]
 
     async def list_all(self) -> List[Agreement]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(select(AgreementModel))
             models = result.scalars().all()
             return [self._to_entity(m) for m in models]
 
     async def add_vehicle_to_agreement(self, agreement_id: int, vehicle_id: int):
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             # Check if already exists
             result = await session.execute(
                 select(AgreementVehicle)
@@ -122,19 +122,19 @@ class AgreementRepositoryImpl(IAgreementRepository):
                     vehicle_id=vehicle_id
                 )
                 session.add(agreement_vehicle)
-                await session.commit()
+                await session.flush()
 
     async def remove_vehicle_from_agreement(self, agreement_id: int, vehicle_id: int):
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             await session.execute(
                 sql_delete(AgreementVehicle)
                 .where(AgreementVehicle.agreement_id == agreement_id)
                 .where(AgreementVehicle.vehicle_id == vehicle_id)
             )
-            await session.commit()
+            await session.flush()
 
     async def get_agreement_by_vehicle_id(self, vehicle_id: int) -> Optional[Agreement]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(AgreementModel)
                 .join(AgreementVehicle, AgreementModel.id == AgreementVehicle.agreement_id)
@@ -143,3 +143,19 @@ class AgreementRepositoryImpl(IAgreementRepository):
             )
             model = result.scalars().first()
             return self._to_entity(model)
+
+    async def get_agreements_by_vehicle_ids(self, vehicle_ids: List[int]) -> Dict[int, Agreement]:
+        if not vehicle_ids:
+            return {}
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(AgreementVehicle.vehicle_id, AgreementModel)
+                .join(AgreementModel, AgreementModel.id == AgreementVehicle.agreement_id)
+                .where(AgreementVehicle.vehicle_id.in_(vehicle_ids))
+                .where(AgreementModel.is_active == 'active')
+                .order_by(AgreementVehicle.vehicle_id, AgreementModel.id)
+            )
+            agreements: Dict[int, Agreement] = {}
+            for vehicle_id, model in result.all():
+                agreements.setdefault(vehicle_id, self._to_entity(model))
+            return agreements
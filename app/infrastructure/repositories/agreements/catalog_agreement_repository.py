@@ -0,0 +1,60 @@
+import copy
+from typing import Dict, List, Optional
+from app.domain.agreements.entities.agreement import Agreement
+from app.domain.agreements.repositories.agreement_repository import IAgreementRepository
+from app.domain.parking.services.pricing_catalog import PricingCatalog
+
+
+class CatalogAgreementRepository(IAgreementRepository):
+    """
+    Read-through agreement repository for pricing: the vehicle -> agreement
+    lookups are served from the pricing catalogue when it is ready. The
+    catalogue holds every vehicle with an active agreement, so "no agreement"
+    is answered from memory too; a change made on another worker is seen
+    after its next refresh. Everything else goes to `inner`.
+    """
+
+    def __init__(self, inner: IAgreementRepository, catalog: PricingCatalog):
+        self.inner = inner
+        self.catalog = catalog
+
+    async def get_agreement_by_vehicle_id(self, vehicle_id: int) -> Optional[Agreement]:
+        if self.catalog.is_ready:
+            return copy.copy(self.catalog.agreement_for(vehicle_id))
+        self.catalog.fallbacks += 1
+        return await self.inner.get_agreement_by_vehicle_id(vehicle_id)
+
+    async def get_agreements_by_vehicle_ids(self, vehicle_ids: List[int]) -> Dict[int, Agreement]:
+        if not self.catalog.is_ready:
+            self.catalog.fallbacks += 1
+            return await self.inner.get_agreements_by_vehicle_ids(vehicle_ids)
+        agreements: Dict[int, Agreement] = {}
+        for vehicle_id in vehicle_ids:
+            agreement = self.catalog.agreement_for(vehicle_id)
+            if agreement is not None:
+                agreements[vehicle_id] = copy.copy(agreement)
+        return agreements
+
+    async def create(self, agreement: Agreement) -> Agreement:
+        return await self.inner.create(agreement)
+
+    async def get_by_id(self, agreement_id: int) -> Optional[Agreement]:
+        return await self.inner.get_by_id(agreement_id)
+
+    async def update(self, agreement_id: int, agreement: Agreement) -> Agreement:
+        return await self.inner.update(agreement_id, agreement)
+
+    async def delete(self, agreement_id: int):
+        return await self.inner.delete(agreement_id)
+
+    async def list_active(self) -> List[Agreement]:
+        return await self.inner.list_active()
+
+    async def list_all(self) -> List[Agreement]:
+        return await self.inner.list_all()
+
+    async def add_vehicle_to_agreement(self, agreement_id: int, vehicle_id: int):
+        return await self.inner.add_vehicle_to_agreement(agreement_id, vehicle_id)
+
+    async def remove_vehicle_from_agreement(self, agreement_id: int, vehicle_id: int):
+        return await self.inner.remove_vehicle_from_agreement(agreement_id, vehicle_id)
@@ -0,0 +1,28 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infrastructure.database.session import SessionLocal
+
+
+class SessionScopedRepository:
+    """
+    Base for SQLAlchemy repositories.
+
+    When built with a session (normally the request's UnitOfWork session) every
+    method runs on that session and the owner of the session commits. Without
+    one, each method opens its own session and commits on exit, which keeps the
+    old behaviour for scripts and routes that are not wired to a unit of work.
+    """
+
+    def __init__(self, session: Optional[AsyncSession] = None):
+        self._session = session
+
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[AsyncSession]:
+        if self._session is not None:
+            yield self._session
+            return
+
+        async with SessionLocal() as session:
+            yield session
+            await session.commit()
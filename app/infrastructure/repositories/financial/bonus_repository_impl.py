@@ -2,19 +2,22 @@ from typing import List, Optional
 from datetime import date
 from sqlalchemy import select, extract, func
 from app.domain.financial.repositories.bonus_repository import BonusRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.financial import Bonus
+from app.infrastructure.repositories.reporting.rollup_dirty_days import mark_rollup_days_dirty
 
-class BonusRepositoryImpl(BonusRepository):
+class BonusRepositoryImpl(SessionScopedRepository, BonusRepository):
     async def create(self, bonus: Bonus) -> Bonus:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             session.add(bonus)
-            await session.commit()
+            await session.flush()
             await session.refresh(bonus)
+            # Un bono con fecha pasada cambia el resumen de ese día
+            await mark_rollup_days_dirty(session, [bonus.bonus_date])
             return bonus
 
     async def get_by_washer_and_date(self, washer_id: int, bonus_date: date) -> Optional[Bonus]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(Bonus)
                 .where(Bonus.washer_id == washer_id)
@@ -23,7 +26,7 @@ class BonusRepositoryImpl(BonusRepository):
             return result.scalar_one_or_none()
 
     async def get_by_date(self, bonus_date: date) -> List[Bonus]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(Bonus)
                 .where(Bonus.bonus_date == bonus_date)
@@ -31,7 +34,7 @@ class BonusRepositoryImpl(BonusRepository):
             return result.scalars().all()
 
     async def get_monthly_summary(self, month: int, year: int) -> List[dict]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(
                     Bonus.washer_id,
@@ -45,7 +48,7 @@ class BonusRepositoryImpl(BonusRepository):
             return [{"washer_id": row.washer_id, "total_amount": row.total_amount} for row in result]
 
     async def get_sum_by_date_range(self, start_date: date, end_date: date) -> int:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(func.sum(Bonus.amount))
                 .where(Bonus.bonus_date >= start_date)
@@ -55,7 +58,7 @@ class BonusRepositoryImpl(BonusRepository):
             return total if total else 0
 
     async def get_daily_bonuses(self, start_date: date, end_date: date) -> List[dict]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             stmt = (
                 select(
                     Bonus.bonus_date,
@@ -2,10 +2,10 @@ from typing import List, Optional
 from sqlalchemy import select, and_
 from app.domain.financial.entities.employee_advance import EmployeeAdvance
 from app.domain.financial.repositories.employee_advance_repository import EmployeeAdvanceRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.financial import EmployeeAdvance as EmployeeAdvanceModel
 
-class EmployeeAdvanceRepositoryImpl(EmployeeAdvanceRepository):
+class EmployeeAdvanceRepositoryImpl(SessionScopedRepository, EmployeeAdvanceRepository):
 
     def _to_entity(self, model: EmployeeAdvanceModel) -> Optional[EmployeeAdvance]:
         if not model:
@@ -24,7 +24,7 @@ class EmployeeAdvanceRepositoryImpl(EmployeeAdvanceRepository):
         )
 
     async def save(self, advance: EmployeeAdvance) -> EmployeeAdvance:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             if advance.id:
                 # Update
                 result = await session.execute(
@@ -34,7 +34,7 @@ class EmployeeAdvanceRepositoryImpl(EmployeeAdvanceRepository):
                 if model:
                     model.remaining_amount = advance.remaining_amount
                     model.status = advance.status
-                    await session.commit()
+                    await session.flush()
                     await session.refresh(model)
                     return self._to_entity(model)
             
@@ -49,12 +49,12 @@ class EmployeeAdvanceRepositoryImpl(EmployeeAdvanceRepository):
                 description=advance.description
             )
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
             return self._to_entity(model)
 
     async def get_by_id(self, advance_id: int) -> Optional[EmployeeAdvance]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(EmployeeAdvanceModel).where(EmployeeAdvanceModel.id == advance_id)
             )
@@ -62,7 +62,7 @@ class EmployeeAdvanceRepositoryImpl(EmployeeAdvanceRepository):
             return self._to_entity(model)
 
     async def get_active_by_washer(self, washer_id: int) -> List[EmployeeAdvance]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(EmployeeAdvanceModel).where(
                     and_(
@@ -3,10 +3,11 @@ from datetime import date
 from sqlalchemy import select, delete, func
 from app.domain.financial.entities.expense import Expense
 from app.domain.financial.repositories.expense_repository import ExpenseRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.financial import Expense as ExpenseModel
+from app.infrastructure.repositories.reporting.rollup_dirty_days import mark_rollup_days_dirty
 
-class ExpenseRepositoryImpl(ExpenseRepository):
+class ExpenseRepositoryImpl(SessionScopedRepository, ExpenseRepository):
 
     def _to_entity(self, model: ExpenseModel) -> Optional[Expense]:
         if not model:
@@ -23,7 +24,7 @@ class ExpenseRepositoryImpl(ExpenseRepository):
         )
 
     async def save(self, expense: Expense) -> Expense:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             # For now, we only handle creation as per HUs. 
             # If ID exists, we would update, but let's keep it simple for now.
             model = ExpenseModel(
@@ -34,12 +35,14 @@ class ExpenseRepositoryImpl(ExpenseRepository):
                 expense_date=expense.expense_date
             )
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
+            # Un gasto con fecha pasada cambia el resumen de ese día
+            await mark_rollup_days_dirty(session, [model.expense_date])
             return self._to_entity(model)
 
     async def get_by_id(self, expense_id: int) -> Optional[Expense]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(ExpenseModel).where(ExpenseModel.id == expense_id)
             )
@@ -47,14 +50,15 @@ class ExpenseRepositoryImpl(ExpenseRepository):
             return self._to_entity(model)
 
     async def delete(self, expense_id: int) -> None:
-        async with SessionLocal() as session:
-            await session.execute(
-                delete(ExpenseModel).where(ExpenseModel.id == expense_id)
+        async with self._session_scope() as session:
+            result = await session.execute(
+                delete(ExpenseModel).where(ExpenseModel.id == expense_id).returning(ExpenseModel.expense_date)
             )
-            await session.commit()
+            await mark_rollup_days_dirty(session, result.scalars().all())
+            await session.flush()
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Expense]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(ExpenseModel).offset(skip).limit(limit)
             )
@@ -62,7 +66,7 @@ class ExpenseRepositoryImpl(ExpenseRepository):
             return [self._to_entity(m) for m in models]
 
     async def get_total_by_shift(self, shift_id: int) -> int:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(func.sum(ExpenseModel.amount))
                 .where(ExpenseModel.shift_id == shift_id)
@@ -71,7 +75,7 @@ class ExpenseRepositoryImpl(ExpenseRepository):
             return total if total else 0
 
     async def get_sum_by_date_range(self, start_date: date, end_date: date) -> int:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(func.sum(ExpenseModel.amount))
                 .where(ExpenseModel.expense_date >= start_date)
@@ -81,7 +85,7 @@ class ExpenseRepositoryImpl(ExpenseRepository):
             return total if total else 0
 
     async def get_daily_expenses(self, start_date: date, end_date: date) -> List[dict]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             stmt = (
                 select(
                     ExpenseModel.expense_date,
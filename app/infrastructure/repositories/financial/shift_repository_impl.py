@@ -3,10 +3,10 @@ from datetime import datetime
 from sqlalchemy import select, and_
 from app.domain.financial.entities.shift import Shift
 from app.domain.financial.repositories.shift_repository import ShiftRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.financial import Shift as ShiftModel
 
-class ShiftRepositoryImpl(ShiftRepository):
+class ShiftRepositoryImpl(SessionScopedRepository, ShiftRepository):
 
     def _to_entity(self, model: ShiftModel) -> Optional[Shift]:
         if not model:
@@ -27,7 +27,7 @@ class ShiftRepositoryImpl(ShiftRepository):
         )
 
     async def save(self, shift: Shift) -> Shift:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             if shift.id:
                 # Update existing
                 result = await session.execute(
@@ -41,7 +41,7 @@ class ShiftRepositoryImpl(ShiftRepository):
                     model.total_expenses = shift.total_expenses
                     model.notes = shift.notes
                     # We don't usually update start_time or initial_cash or admin_id
-                    await session.commit()
+                    await session.flush()
                     await session.refresh(model)
                     return self._to_entity(model)
             
@@ -56,12 +56,12 @@ class ShiftRepositoryImpl(ShiftRepository):
                 notes=shift.notes
             )
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
             return self._to_entity(model)
 
     async def get_by_id(self, shift_id: int) -> Optional[Shift]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(ShiftModel).where(ShiftModel.id == shift_id)
             )
@@ -69,7 +69,7 @@ class ShiftRepositoryImpl(ShiftRepository):
             return self._to_entity(model)
 
     async def get_active_shift_by_admin(self, admin_id: int) -> Optional[Shift]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(ShiftModel).where(
                     and_(
@@ -82,7 +82,7 @@ class ShiftRepositoryImpl(ShiftRepository):
             return self._to_entity(model)
 
     async def get_by_date_and_admin(self, date_val, admin_id: int) -> Optional[Shift]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(ShiftModel).where(
                     and_(
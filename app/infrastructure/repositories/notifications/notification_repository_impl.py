@@ -3,10 +3,10 @@ from datetime import datetime, timezone
 from sqlalchemy import select, update, delete as sql_delete, func
 from app.domain.notifications.entities.notification import Notification
 from app.domain.notifications.repositories.notification_repository import INotificationRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.system import Notification as NotificationModel
 
-class NotificationRepositoryImpl(INotificationRepository):
+class NotificationRepositoryImpl(SessionScopedRepository, INotificationRepository):
     
     def _to_entity(self, model: NotificationModel) -> Optional[Notification]:
         if not model:
@@ -36,15 +36,15 @@ class NotificationRepositoryImpl(INotificationRepository):
         )
 
     async def create(self, notification: Notification) -> Notification:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             model = self._to_model(notification)
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
             return self._to_entity(model)
 
     async def get_by_id(self, notification_id: int) -> Optional[Notification]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(NotificationModel).where(NotificationModel.id == notification_id)
             )
@@ -52,14 +52,14 @@ class NotificationRepositoryImpl(INotificationRepository):
             return self._to_entity(model)
 
     async def mark_as_read(self, notification_id: int) -> Notification:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             stmt = (
                 update(NotificationModel)
                 .where(NotificationModel.id == notification_id)
                 .values(is_read=True, read_at=datetime.now(timezone.utc))
             )
             await session.execute(stmt)
-            await session.commit()
+            await session.flush()
             
             result = await session.execute(
                 select(NotificationModel).where(NotificationModel.id == notification_id)
@@ -73,7 +73,7 @@ class NotificationRepositoryImpl(INotificationRepository):
         recipient_id: int, 
         unread_only: bool = False
     ) -> List[Notification]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             query = select(NotificationModel).where(
                 NotificationModel.recipient_type == recipient_type,
                 NotificationModel.recipient_id == recipient_id
@@ -89,14 +89,14 @@ class NotificationRepositoryImpl(INotificationRepository):
             return [self._to_entity(m) for m in models]
 
     async def delete(self, notification_id: int):
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             await session.execute(
                 sql_delete(NotificationModel).where(NotificationModel.id == notification_id)
             )
-            await session.commit()
+            await session.flush()
 
     async def count_unread(self, recipient_type: str, recipient_id: int) -> int:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(func.count(NotificationModel.id))
                 .where(NotificationModel.recipient_type == recipient_type)
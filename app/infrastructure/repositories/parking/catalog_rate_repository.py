@@ -0,0 +1,75 @@
+import copy
+from typing import Dict, Iterable, List, Optional
+from app.domain.parking.entities.rate import Rate
+from app.domain.parking.repositories.rate_repository import IRateRepository
+from app.domain.parking.services.pricing_catalog import PricingCatalog
+
+
+class CatalogRateRepository(IRateRepository):
+    """
+    Read-through rate repository: lookups are served from the pricing
+    catalogue when it is ready and fall back to `inner` otherwise (or when
+    the rate is not in it, e.g. created on another worker since the last
+    refresh). Writes go straight to `inner`. Entities are copies, so callers
+    may modify them.
+    """
+
+    def __init__(self, inner: IRateRepository, catalog: PricingCatalog):
+        self.inner = inner
+        self.catalog = catalog
+
+    async def get_active_by_type(self, vehicle_type: str, rate_type: str) -> Optional[Rate]:
+        if self.catalog.is_ready:
+            rate = self.catalog.active_rate(vehicle_type, rate_type)
+            if rate is not None:
+                return copy.copy(rate)
+        self.catalog.fallbacks += 1
+        return await self.inner.get_active_by_type(vehicle_type, rate_type)
+
+    async def get_active_by_types(self, vehicle_types: Iterable[str], rate_type: str) -> Dict[str, Rate]:
+        vehicle_types = set(vehicle_types)
+        rates: Dict[str, Rate] = {}
+        if self.catalog.is_ready:
+            for vehicle_type in vehicle_types:
+                rate = self.catalog.active_rate(vehicle_type, rate_type)
+                if rate is not None:
+                    rates[vehicle_type] = copy.copy(rate)
+        missing = vehicle_types - rates.keys()
+        if missing:
+            self.catalog.fallbacks += 1
+            rates.update(await self.inner.get_active_by_types(missing, rate_type))
+        return rates
+
+    async def get_by_id(self, rate_id: int) -> Optional[Rate]:
+        if self.catalog.is_ready:
+            rate = self.catalog.rate(rate_id)
+            if rate is not None:
+                return copy.copy(rate)
+        self.catalog.fallbacks += 1
+        return await self.inner.get_by_id(rate_id)
+
+    async def get_by_ids(self, rate_ids: Iterable[int]) -> Dict[int, Rate]:
+        rate_ids = set(rate_ids)
+        rates: Dict[int, Rate] = {}
+        if self.catalog.is_ready:
+            for rate_id in rate_ids:
+                rate = self.catalog.rate(rate_id)
+                if rate is not None:
+                    rates[rate_id] = copy.copy(rate)
+        missing = rate_ids - rates.keys()
+        if missing:
+            self.catalog.fallbacks += 1
+            rates.update(await self.inner.get_by_ids(missing))
+        return rates
+
+    async def list_active(self) -> List[Rate]:
+        return await self.inner.list_active()
+
+    async def create(self, rate: Rate) -> Rate:
+        return await self.inner.create(rate)
+
+    async def update(self, rate_id: int, rate: Rate) -> Rate:
+        return await self.inner.update(rate_id, rate)
+
+    async def delete(self, rate_id: int) -> bool:
+        return await self.inner.delete(rate_id)
@@ -1,12 +1,38 @@
-from typing import Optional, List
-from datetime import date
-from sqlalchemy import select, update, func
+from typing import Any, AsyncIterator, Dict, Optional, List, Sequence, Tuple
+from datetime import date, datetime
+from sqlalchemy import select, update, func, text, values, column, cast, tuple_, BigInteger, Integer, String, TIMESTAMP
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from app.domain.parking.entities.parking_record import ParkingRecord
-from app.domain.parking.repositories.parking_record_repository import IParkingRecordRepository
-from app.infrastructure.database.session import SessionLocal
-from app.infrastructure.database.models.vehicles import ParkingRecord as ParkingRecordModel
+from app.domain.parking.entities.vehicle import Vehicle
+from app.core.datetime_utils import business_date, date_range_bounds
+from app.domain.parking.repositories.parking_record_repository import (
+    IParkingRecordRepository,
+    PARKING_RECORD_VEHICLE_FIELDS,
+)
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
+from app.infrastructure.database.models.vehicles import ParkingRecord as ParkingRecordModel, Vehicle as VehicleModel
+from app.infrastructure.repositories.reporting.rollup_dirty_days import mark_rollup_days_dirty
 
-class ParkingRecordRepositoryImpl(IParkingRecordRepository):
+# Proyecciones de list_page (ver PARKING_RECORD_FIELDS)
+_PAGE_COLUMNS = {
+    **{name: getattr(ParkingRecordModel, name) for name in (
+        "id", "vehicle_id", "entry_time", "exit_time", "parking_rate_id", "subscription_id",
+        "washing_service_id", "helmet_count", "helmet_charge", "total_cost", "payment_status",
+        "notes", "shift_id", "admin_id",
+    )},
+    **{name: getattr(VehicleModel, name) for name in PARKING_RECORD_VEHICLE_FIELDS},
+    "duration_seconds": cast(
+        func.floor(func.extract(
+            "epoch",
+            func.coalesce(ParkingRecordModel.exit_time, func.now()) - ParkingRecordModel.entry_time
+        )),
+        BigInteger
+    ),
+}
+
+
+class ParkingRecordRepositoryImpl(SessionScopedRepository, IParkingRecordRepository):
     
     def _to_entity(self, model: ParkingRecordModel) -> Optional[ParkingRecord]:
         if not model:
@@ -28,6 +54,21 @@ class ParkingRecordRepositoryImpl(IParkingRecordRepository):
             notes=model.notes
         )
 
+    @staticmethod
+    def _vehicle_entity(vehicle: VehicleModel) -> Vehicle:
+        return Vehicle(
+            id=vehicle.id,
+            plate=vehicle.plate,
+            vehicle_type=vehicle.vehicle_type,
+            owner_name=vehicle.owner_name,
+            owner_phone=vehicle.owner_phone,
+            brand=vehicle.brand,
+            model=vehicle.model,
+            color=vehicle.color,
+            is_frequent=vehicle.is_frequent,
+            notes=vehicle.notes
+        )
+
     def _to_model(self, entity: ParkingRecord) -> ParkingRecordModel:
         return ParkingRecordModel(
             id=entity.id,
@@ -47,15 +88,66 @@ class ParkingRecordRepositoryImpl(IParkingRecordRepository):
         )
 
     async def create(self, record: ParkingRecord) -> ParkingRecord:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             model = self._to_model(record)
             session.add(model)
-            await session.commit()
+            try:
+                await session.flush()
+            except IntegrityError as e:
+                # Two concurrent entries for the same vehicle: the unique partial index rejects the second
+                if 'ux_parking_records_active_vehicle_id' in str(e.orig):
+                    raise ValueError("Vehicle already has an active parking record")
+                raise
             await session.refresh(model)
             return self._to_entity(model)
 
+    async def create_many(self, records: List[ParkingRecord]) -> List[ParkingRecord]:
+        if not records:
+            return []
+        rows = [
+            {
+                "vehicle_id": r.vehicle_id,
+                "shift_id": r.shift_id,
+                "admin_id": r.admin_id,
+                "entry_time": r.entry_time,
+                "parking_rate_id": r.parking_rate_id,
+                "subscription_id": r.subscription_id,
+                "helmet_count": r.helmet_count,
+                "helmet_charge": r.helmet_charge,
+                "total_cost": r.total_cost,
+                "payment_status": r.payment_status,
+                "notes": r.notes,
+            }
+            for r in records
+        ]
+        async with self._session_scope() as session:
+            if session.bind.dialect.name == "postgresql":
+                # Un solo INSERT multi-fila; el índice único parcial de registros
+                # activos descarta los vehículos que ya están parqueados
+                result = await session.execute(
+                    pg_insert(ParkingRecordModel)
+                    .values(rows)
+                    .on_conflict_do_nothing(
+                        index_elements=[ParkingRecordModel.vehicle_id],
+                        index_where=text("exit_time IS NULL"),
+                    )
+                    .returning(*ParkingRecordModel.__table__.c)
+                )
+                return [self._to_entity(row) for row in result]
+
+            active = await session.execute(
+                select(ParkingRecordModel.vehicle_id)
+                .where(ParkingRecordModel.vehicle_id.in_([r["vehicle_id"] for r in rows]))
+                .where(ParkingRecordModel.exit_time.is_(None))
+            )
+            parked = set(active.scalars().all())
+            models = [ParkingRecordModel(**row) for row in rows if row["vehicle_id"] not in parked]
+            session.add_all(models)
+            await session.flush()
+            return [self._to_entity(m) for m in models]
+
     async def get_by_id(self, record_id: int) -> Optional[ParkingRecord]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(ParkingRecordModel).where(ParkingRecordModel.id == record_id)
             )
@@ -63,7 +155,7 @@ class ParkingRecordRepositoryImpl(IParkingRecordRepository):
             return self._to_entity(model)
 
     async def update(self, record_id: int, record: ParkingRecord) -> ParkingRecord:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             # We construct the update statement dynamically or just update all fields
             # For simplicity, let's update relevant fields
             stmt = (
@@ -78,16 +170,88 @@ class ParkingRecordRepositoryImpl(IParkingRecordRepository):
                 )
             )
             await session.execute(stmt)
-            await session.commit()
+            await session.flush()
             
             result = await session.execute(
                 select(ParkingRecordModel).where(ParkingRecordModel.id == record_id)
             )
             model = result.scalar_one()
+            # El ingreso de parqueo va al día de entrada
+            await mark_rollup_days_dirty(session, [business_date(model.entry_time)])
+            return self._to_entity(model)
+
+    async def close(self, record: ParkingRecord) -> Optional[ParkingRecord]:
+        """
+        Closes an active record. The UPDATE only matches while exit_time is
+        still NULL, so a record already closed elsewhere returns None instead
+        of being charged twice.
+        """
+        async with self._session_scope() as session:
+            stmt = (
+                update(ParkingRecordModel)
+                .where(ParkingRecordModel.id == record.id)
+                .where(ParkingRecordModel.exit_time.is_(None))
+                .values(
+                    exit_time=record.exit_time,
+                    total_cost=record.total_cost,
+                    payment_status=record.payment_status,
+                    notes=record.notes
+                )
+                .returning(ParkingRecordModel)
+            )
+            result = await session.execute(stmt)
+            model = result.scalar_one_or_none()
+            if model is not None:
+                # Parked since an earlier (already rolled up) day: its income changes that day
+                await mark_rollup_days_dirty(session, [business_date(model.entry_time)])
             return self._to_entity(model)
 
+    async def close_many(self, records: List[ParkingRecord]) -> List[ParkingRecord]:
+        """
+        Closes several active records with one UPDATE ... FROM (VALUES ...).
+        As in close(), rows already closed elsewhere do not match and are
+        left out of the result.
+        """
+        if not records:
+            return []
+        async with self._session_scope() as session:
+            if session.bind.dialect.name != "postgresql":
+                closed = [await self.close(record) for record in records]
+                return [record for record in closed if record is not None]
+
+            closing = values(
+                column("id", Integer),
+                column("exit_time", TIMESTAMP(timezone=True)),
+                column("total_cost", Integer),
+                column("payment_status", String),
+                column("notes", String),
+                name="closing"
+            ).data([
+                (r.id, r.exit_time, r.total_cost, r.payment_status, r.notes)
+                for r in records
+            ])
+            # updated_at is set by the column's onupdate
+            stmt = (
+                update(ParkingRecordModel)
+                .where(ParkingRecordModel.id == closing.c.id)
+                .where(ParkingRecordModel.exit_time.is_(None))
+                .values(
+                    exit_time=closing.c.exit_time,
+                    total_cost=closing.c.total_cost,
+                    payment_status=closing.c.payment_status,
+                    notes=closing.c.notes
+                )
+                .returning(*ParkingRecordModel.__table__.c)
+                # No ORM objects to refresh; evaluate cannot match against VALUES
+                .execution_options(synchronize_session=False)
+            )
+            result = await session.execute(stmt)
+            closed = [self._to_entity(row) for row in result]
+            await mark_rollup_days_dirty(session, {business_date(r.entry_time) for r in closed})
+            return closed
+
     async def get_active_by_vehicle_id(self, vehicle_id: int) -> Optional[ParkingRecord]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(ParkingRecordModel)
                 .where(ParkingRecordModel.vehicle_id == vehicle_id)
@@ -97,7 +261,7 @@ class ParkingRecordRepositoryImpl(IParkingRecordRepository):
             return self._to_entity(model)
 
     async def list_active(self) -> List[ParkingRecord]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(ParkingRecordModel)
                 .where(ParkingRecordModel.exit_time.is_(None))
@@ -105,21 +269,137 @@ class ParkingRecordRepositoryImpl(IParkingRecordRepository):
             models = result.scalars().all()
             return [self._to_entity(m) for m in models]
 
+    async def list_active_with_vehicles(self) -> List[Tuple[Vehicle, ParkingRecord]]:
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(VehicleModel, ParkingRecordModel)
+                .join(ParkingRecordModel, ParkingRecordModel.vehicle_id == VehicleModel.id)
+                .where(ParkingRecordModel.exit_time.is_(None))
+            )
+            return [
+                (self._vehicle_entity(vehicle), self._to_entity(record))
+                for vehicle, record in result.all()
+            ]
+
+    async def get_vehicle_with_active_record(
+        self, plate: str
+    ) -> Tuple[Optional[Vehicle], Optional[ParkingRecord]]:
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(VehicleModel, ParkingRecordModel)
+                .outerjoin(
+                    ParkingRecordModel,
+                    (ParkingRecordModel.vehicle_id == VehicleModel.id) & ParkingRecordModel.exit_time.is_(None)
+                )
+                .where(VehicleModel.plate == plate)
+            )
+            row = result.first()
+            if row is None:
+                return None, None
+            vehicle, record = row
+            return self._vehicle_entity(vehicle), self._to_entity(record)
+
+    async def get_active_with_vehicles_by_plates(
+        self, plates: List[str], lock: bool = False
+    ) -> Dict[str, Tuple[Vehicle, ParkingRecord]]:
+        if not plates:
+            return {}
+        stmt = (
+            select(VehicleModel, ParkingRecordModel)
+            .join(ParkingRecordModel, ParkingRecordModel.vehicle_id == VehicleModel.id)
+            .where(VehicleModel.plate.in_(plates))
+            .where(ParkingRecordModel.exit_time.is_(None))
+        )
+        if lock:
+            # Row lock on the records only, always in id order so overlapping
+            # batches cannot deadlock; refresh anything already in the session
+            stmt = (
+                stmt.order_by(ParkingRecordModel.id)
+                .with_for_update(of=ParkingRecordModel)
+                .execution_options(populate_existing=True)
+            )
+        async with self._session_scope() as session:
+            result = await session.execute(stmt)
+            return {
+                vehicle.plate: (self._vehicle_entity(vehicle), self._to_entity(record))
+                for vehicle, record in result.all()
+            }
+
     async def list_by_date_range(self, start_date: date, end_date: date) -> List[ParkingRecord]:
-        async with SessionLocal() as session:
-            # Filter by entry_time within the date range
-            # We cast entry_time to date for comparison
+        async with self._session_scope() as session:
+            # Filter by entry_time within the date range (half-open, index friendly)
+            range_start, range_end = date_range_bounds(start_date, end_date)
             result = await session.execute(
                 select(ParkingRecordModel)
-                .where(func.date(ParkingRecordModel.entry_time) >= start_date)
-                .where(func.date(ParkingRecordModel.entry_time) <= end_date)
+                .where(ParkingRecordModel.entry_time >= range_start)
+                .where(ParkingRecordModel.entry_time < range_end)
                 .order_by(ParkingRecordModel.entry_time.desc())
             )
             models = result.scalars().all()
             return [self._to_entity(m) for m in models]
 
+    async def list_page(
+        self,
+        fields: Sequence[str],
+        status: str = 'all',
+        limit: int = 50,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Dict[str, Any]]:
+        # Core select of the requested columns only: no ORM objects are built
+        stmt = select(*(_PAGE_COLUMNS[name].label(name) for name in fields)).select_from(ParkingRecordModel)
+        if any(name in PARKING_RECORD_VEHICLE_FIELDS for name in fields):
+            stmt = stmt.outerjoin(VehicleModel, VehicleModel.id == ParkingRecordModel.vehicle_id)
+
+        if status == 'active':
+            stmt = stmt.where(ParkingRecordModel.exit_time.is_(None))
+        elif status == 'completed':
+            stmt = stmt.where(ParkingRecordModel.exit_time.isnot(None))
+        if after is not None:
+            # Row comparison: walks the (entry_time, id) index backwards from the cursor
+            stmt = stmt.where(tuple_(ParkingRecordModel.entry_time, ParkingRecordModel.id) < tuple_(*after))
+
+        stmt = stmt.order_by(ParkingRecordModel.entry_time.desc(), ParkingRecordModel.id.desc()).limit(limit)
+        async with self._session_scope() as session:
+            result = await session.execute(stmt)
+            return [dict(row) for row in result.mappings().all()]
+
+    async def count_by_date_range(self, start_date: date, end_date: date) -> int:
+        range_start, range_end = date_range_bounds(start_date, end_date)
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(func.count(ParkingRecordModel.id))
+                .where(ParkingRecordModel.entry_time >= range_start)
+                .where(ParkingRecordModel.entry_time < range_end)
+            )
+            return result.scalar() or 0
+
+    async def stream_history(self, start_date: date, end_date: date, batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        range_start, range_end = date_range_bounds(start_date, end_date)
+        stmt = (
+            select(
+                ParkingRecordModel.id,
+                VehicleModel.plate,
+                ParkingRecordModel.entry_time,
+                ParkingRecordModel.exit_time,
+                ParkingRecordModel.total_cost,
+                ParkingRecordModel.payment_status,
+                ParkingRecordModel.notes,
+            )
+            .outerjoin(VehicleModel, VehicleModel.id == ParkingRecordModel.vehicle_id)
+            .where(ParkingRecordModel.entry_time >= range_start)
+            .where(ParkingRecordModel.entry_time < range_end)
+            .order_by(ParkingRecordModel.entry_time.desc(), ParkingRecordModel.id.desc())
+            # Server-side cursor: only one batch of rows is held in memory at a time
+            .execution_options(yield_per=batch_size)
+        )
+        async with self._session_scope() as session:
+            result = await session.stream(stmt)
+            async for partition in result.mappings().partitions():
+                for row in partition:
+                    yield dict(row)
+
     async def get_last_by_vehicle_id(self, vehicle_id: int, limit: int = 5) -> List[ParkingRecord]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(ParkingRecordModel)
                 .where(ParkingRecordModel.vehicle_id == vehicle_id)
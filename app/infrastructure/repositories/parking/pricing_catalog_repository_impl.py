@@ -0,0 +1,69 @@
+from typing import Dict, List
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.domain.agreements.entities.agreement import Agreement
+from app.domain.parking.entities.rate import Rate
+from app.domain.parking.repositories.pricing_catalog_repository import IPricingCatalogRepository
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
+from app.infrastructure.repositories.agreements.agreement_repository_impl import AgreementRepositoryImpl
+from app.infrastructure.repositories.parking.rate_repository_impl import RateRepositoryImpl
+from app.infrastructure.database.models.services import Rate as RateModel
+from app.infrastructure.database.models.subscriptions import Agreement as AgreementModel, AgreementVehicle
+from app.infrastructure.database.models.system import CacheVersion
+
+PRICING_CACHE_NAME = "pricing"
+
+
+class PricingCatalogRepositoryImpl(SessionScopedRepository, IPricingCatalogRepository):
+
+    async def get_version(self) -> int:
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(CacheVersion.version).where(CacheVersion.name == PRICING_CACHE_NAME)
+            )
+            return result.scalar_one_or_none() or 0
+
+    async def bump_version(self) -> int:
+        async with self._session_scope() as session:
+            if session.bind.dialect.name == "postgresql":
+                stmt = pg_insert(CacheVersion).values(name=PRICING_CACHE_NAME, version=1)
+                result = await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[CacheVersion.name],
+                        set_={"version": CacheVersion.version + 1, "updated_at": func.now()},
+                    ).returning(CacheVersion.version)
+                )
+                return result.scalar_one()
+
+            result = await session.execute(
+                update(CacheVersion)
+                .where(CacheVersion.name == PRICING_CACHE_NAME)
+                .values(version=CacheVersion.version + 1)
+                .returning(CacheVersion.version)
+            )
+            version = result.scalar_one_or_none()
+            if version is None:
+                session.add(CacheVersion(name=PRICING_CACHE_NAME, version=1))
+                await session.flush()
+                version = 1
+            return version
+
+    async def list_rates(self) -> List[Rate]:
+        to_entity = RateRepositoryImpl()._to_entity
+        async with self._session_scope() as session:
+            result = await session.execute(select(RateModel))
+            return [to_entity(m) for m in result.scalars().all()]
+
+    async def list_agreements_by_vehicle(self) -> Dict[int, Agreement]:
+        to_entity = AgreementRepositoryImpl()._to_entity
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(AgreementVehicle.vehicle_id, AgreementModel)
+                .join(AgreementModel, AgreementModel.id == AgreementVehicle.agreement_id)
+                .where(AgreementModel.is_active == 'active')
+                .order_by(AgreementVehicle.vehicle_id, AgreementModel.id)
+            )
+            agreements: Dict[int, Agreement] = {}
+            for vehicle_id, model in result.all():
+                agreements.setdefault(vehicle_id, to_entity(model))
+            return agreements
@@ -1,11 +1,11 @@
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from sqlalchemy import select
 from app.domain.parking.entities.rate import Rate
 from app.domain.parking.repositories.rate_repository import IRateRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.services import Rate as RateModel
 
-class RateRepositoryImpl(IRateRepository):
+class RateRepositoryImpl(SessionScopedRepository, IRateRepository):
     
     def _to_entity(self, model: RateModel) -> Optional[Rate]:
         if not model:
@@ -30,7 +30,7 @@ class RateRepositoryImpl(IRateRepository):
         )
 
     async def get_active_by_type(self, vehicle_type: str, rate_type: str) -> Optional[Rate]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(RateModel)
                 .where(RateModel.vehicle_type == vehicle_type)
@@ -40,16 +40,39 @@ class RateRepositoryImpl(IRateRepository):
             model = result.scalar_one_or_none()
             return self._to_entity(model)
 
+    async def get_active_by_types(self, vehicle_types: Iterable[str], rate_type: str) -> Dict[str, Rate]:
+        vehicle_types = list(set(vehicle_types))
+        if not vehicle_types:
+            return {}
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(RateModel)
+                .where(RateModel.vehicle_type.in_(vehicle_types))
+                .where(RateModel.rate_type == rate_type)
+                .where(RateModel.is_active == True)
+            )
+            return {m.vehicle_type: self._to_entity(m) for m in result.scalars().all()}
+
     async def get_by_id(self, rate_id: int) -> Optional[Rate]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(RateModel).where(RateModel.id == rate_id)
             )
             model = result.scalar_one_or_none()
             return self._to_entity(model)
 
+    async def get_by_ids(self, rate_ids: Iterable[int]) -> Dict[int, Rate]:
+        rate_ids = list(set(rate_ids))
+        if not rate_ids:
+            return {}
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(RateModel).where(RateModel.id.in_(rate_ids))
+            )
+            return {m.id: self._to_entity(m) for m in result.scalars().all()}
+
     async def list_active(self) -> List[Rate]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(RateModel).where(RateModel.is_active == True)
             )
@@ -57,15 +80,15 @@ class RateRepositoryImpl(IRateRepository):
             return [self._to_entity(m) for m in models]
 
     async def create(self, rate: Rate) -> Rate:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             model = self._to_model(rate)
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
             return self._to_entity(model)
 
     async def update(self, rate_id: int, rate: Rate) -> Rate:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             from sqlalchemy import update
             stmt = (
                 update(RateModel)
@@ -79,7 +102,7 @@ class RateRepositoryImpl(IRateRepository):
                 )
             )
             await session.execute(stmt)
-            await session.commit()
+            await session.flush()
             
             result = await session.execute(
                 select(RateModel).where(RateModel.id == rate_id)
@@ -88,10 +111,10 @@ class RateRepositoryImpl(IRateRepository):
             return self._to_entity(model)
 
     async def delete(self, rate_id: int) -> bool:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             from sqlalchemy import delete
             await session.execute(
                 delete(RateModel).where(RateModel.id == rate_id)
             )
-            await session.commit()
+            await session.flush()
             return True
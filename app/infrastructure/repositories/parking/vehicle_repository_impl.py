@@ -1,11 +1,12 @@
-from typing import Optional
+from typing import Dict, List, Optional
 from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.domain.parking.entities.vehicle import Vehicle
 from app.domain.parking.repositories.vehicle_repository import IVehicleRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.vehicles import Vehicle as VehicleModel
 
-class VehicleRepositoryImpl(IVehicleRepository):
+class VehicleRepositoryImpl(SessionScopedRepository, IVehicleRepository):
     
     def _to_entity(self, model: VehicleModel) -> Optional[Vehicle]:
         if not model:
@@ -38,15 +39,24 @@ class VehicleRepositoryImpl(IVehicleRepository):
         )
 
     async def get_by_plate(self, plate: str) -> Optional[Vehicle]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(VehicleModel).where(VehicleModel.plate == plate)
             )
             model = result.scalar_one_or_none()
             return self._to_entity(model)
 
+    async def get_by_plates(self, plates: List[str]) -> Dict[str, Vehicle]:
+        if not plates:
+            return {}
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(VehicleModel).where(VehicleModel.plate.in_(plates))
+            )
+            return {m.plate: self._to_entity(m) for m in result.scalars().all()}
+
     async def get_by_id(self, vehicle_id: int) -> Optional[Vehicle]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(VehicleModel).where(VehicleModel.id == vehicle_id)
             )
@@ -54,15 +64,56 @@ class VehicleRepositoryImpl(IVehicleRepository):
             return self._to_entity(model)
 
     async def create(self, vehicle: Vehicle) -> Vehicle:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             model = self._to_model(vehicle)
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
             return self._to_entity(model)
 
+    async def create_many(self, vehicles: List[Vehicle]) -> Dict[str, Vehicle]:
+        if not vehicles:
+            return {}
+        rows = [
+            {
+                "plate": v.plate,
+                "vehicle_type": v.vehicle_type,
+                "owner_name": v.owner_name,
+                "owner_phone": v.owner_phone,
+                "brand": v.brand,
+                "model": v.model,
+                "color": v.color,
+                "is_frequent": v.is_frequent,
+                "notes": v.notes,
+            }
+            for v in vehicles
+        ]
+        async with self._session_scope() as session:
+            if session.bind.dialect.name == "postgresql":
+                result = await session.execute(
+                    pg_insert(VehicleModel)
+                    .values(rows)
+                    .on_conflict_do_nothing(index_elements=[VehicleModel.plate])
+                    .returning(*VehicleModel.__table__.c)
+                )
+                created = {row.plate: self._to_entity(row) for row in result}
+            else:
+                models = [VehicleModel(**row) for row in rows]
+                session.add_all(models)
+                await session.flush()
+                created = {m.plate: self._to_entity(m) for m in models}
+
+            # Placas que otra petición insertó entre la consulta y este INSERT
+            missing = [v.plate for v in vehicles if v.plate not in created]
+            if missing:
+                result = await session.execute(
+                    select(VehicleModel).where(VehicleModel.plate.in_(missing))
+                )
+                created.update({m.plate: self._to_entity(m) for m in result.scalars().all()})
+            return created
+
     async def update(self, vehicle_id: int, vehicle: Vehicle) -> Vehicle:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             stmt = (
                 update(VehicleModel)
                 .where(VehicleModel.id == vehicle_id)
@@ -79,7 +130,7 @@ class VehicleRepositoryImpl(IVehicleRepository):
                 )
             )
             await session.execute(stmt)
-            await session.commit()
+            await session.flush()
             
             result = await session.execute(
                 select(VehicleModel).where(VehicleModel.id == vehicle_id)
@@ -1,14 +1,14 @@
 from typing import List
 from datetime import date, datetime, time
 from sqlalchemy import select, func, and_
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.services import WashingService
 from app.domain.reporting.repositories.activity_reporting_repository import IActivityReportingRepository
 from app.application.dto.reporting.activity_report_response import ActivityReportItem
 
-class ActivityReportingRepositoryImpl(IActivityReportingRepository):
+class ActivityReportingRepositoryImpl(SessionScopedRepository, IActivityReportingRepository):
     async def get_daily_activity(self, start_date: date, end_date: date) -> List[ActivityReportItem]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             start_dt = datetime.combine(start_date, time.min)
             end_dt = datetime.combine(end_date, time.max)
 
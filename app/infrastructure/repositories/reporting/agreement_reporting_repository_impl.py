@@ -1,16 +1,16 @@
 from typing import List
 from datetime import date, datetime, time
 from sqlalchemy import select, func, and_
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.subscriptions import Agreement, AgreementVehicle
 from app.infrastructure.database.models.vehicles import Vehicle
 from app.infrastructure.database.models.services import WashingService
 from app.domain.reporting.repositories.agreement_reporting_repository import IAgreementReportingRepository
 from app.application.dto.reporting.agreement_report_response import AgreementReportItem
 
-class AgreementReportingRepositoryImpl(IAgreementReportingRepository):
+class AgreementReportingRepositoryImpl(SessionScopedRepository, IAgreementReportingRepository):
     async def get_agreement_stats(self, start_date: date, end_date: date) -> List[AgreementReportItem]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             # Convert dates to datetime for comparison
             start_dt = datetime.combine(start_date, time.min)
             end_dt = datetime.combine(end_date, time.max)
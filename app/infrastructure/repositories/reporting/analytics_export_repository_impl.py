@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Optional
+from sqlalchemy import Select, func, select
+from app.domain.reporting.repositories.analytics_export_repository import AnalyticsExportRepository
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
+from app.infrastructure.database.models.vehicles import ParkingRecord, Vehicle
+from app.infrastructure.database.models.services import WashingService
+from app.infrastructure.database.models.subscriptions import MonthlySubscription
+from app.infrastructure.database.models.financial import Expense, Bonus
+
+
+class AnalyticsExportRepositoryImpl(SessionScopedRepository, AnalyticsExportRepository):
+    """
+    Consultas Core (sin objetos ORM) sobre las tablas de historia, filtradas y
+    ordenadas por updated_at: cada tabla tiene un índice en esa columna.
+    """
+
+    async def get_watermark(self, lag_seconds: int) -> datetime:
+        async with self._session_scope() as session:
+            return await session.scalar(select(func.now() - timedelta(seconds=lag_seconds)))
+
+    async def _stream_changes(
+        self, stmt: Select, model, since: Optional[datetime], until: datetime, batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        stmt = stmt.where(model.updated_at <= until)
+        if since is not None:
+            stmt = stmt.where(model.updated_at > since)
+        stmt = (
+            stmt.order_by(model.updated_at, model.id)
+            # Server-side cursor: only one batch of rows is held in memory at a time
+            .execution_options(yield_per=batch_size)
+        )
+        async with self._session_scope() as session:
+            result = await session.stream(stmt)
+            async for partition in result.mappings().partitions():
+                for row in partition:
+                    yield dict(row)
+
+    def stream_parking_records(
+        self, since: Optional[datetime], until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        stmt = (
+            select(
+                ParkingRecord.id,
+                ParkingRecord.vehicle_id,
+                Vehicle.plate,
+                Vehicle.vehicle_type,
+                ParkingRecord.entry_time,
+                ParkingRecord.exit_time,
+                ParkingRecord.parking_rate_id,
+                ParkingRecord.subscription_id,
+                ParkingRecord.washing_service_id,
+                ParkingRecord.helmet_count,
+                ParkingRecord.helmet_charge,
+                ParkingRecord.total_cost,
+                ParkingRecord.payment_status,
+                ParkingRecord.shift_id,
+                ParkingRecord.admin_id,
+                ParkingRecord.created_at,
+                ParkingRecord.updated_at,
+            )
+            .outerjoin(Vehicle, Vehicle.id == ParkingRecord.vehicle_id)
+        )
+        return self._stream_changes(stmt, ParkingRecord, since, until, batch_size)
+
+    def stream_washing_services(
+        self, since: Optional[datetime], until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        stmt = (
+            select(
+                WashingService.id,
+                WashingService.vehicle_id,
+                Vehicle.plate,
+                Vehicle.vehicle_type,
+                WashingService.parking_record_id,
+                WashingService.washer_id,
+                WashingService.service_type,
+                WashingService.service_date,
+                WashingService.start_time,
+                WashingService.end_time,
+                WashingService.price,
+                WashingService.payment_status,
+                WashingService.shift_id,
+                WashingService.admin_id,
+                WashingService.created_at,
+                WashingService.updated_at,
+            )
+            .outerjoin(Vehicle, Vehicle.id == WashingService.vehicle_id)
+        )
+        return self._stream_changes(stmt, WashingService, since, until, batch_size)
+
+    def stream_expenses(
+        self, since: Optional[datetime], until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        stmt = select(
+            Expense.id,
+            Expense.shift_id,
+            Expense.expense_type,
+            Expense.amount,
+            Expense.description,
+            Expense.expense_date,
+            Expense.created_at,
+            Expense.updated_at,
+        )
+        return self._stream_changes(stmt, Expense, since, until, batch_size)
+
+    def stream_bonuses(
+        self, since: Optional[datetime], until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        stmt = select(
+            Bonus.id,
+            Bonus.washer_id,
+            Bonus.shift_id,
+            Bonus.amount,
+            Bonus.reason,
+            Bonus.bonus_date,
+            Bonus.created_at,
+            Bonus.updated_at,
+        )
+        return self._stream_changes(stmt, Bonus, since, until, batch_size)
+
+    def stream_subscriptions(
+        self, since: Optional[datetime], until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        stmt = (
+            select(
+                MonthlySubscription.id,
+                MonthlySubscription.vehicle_id,
+                Vehicle.plate,
+                Vehicle.vehicle_type,
+                MonthlySubscription.start_date,
+                MonthlySubscription.end_date,
+                MonthlySubscription.monthly_fee,
+                MonthlySubscription.payment_status,
+                MonthlySubscription.created_at,
+                MonthlySubscription.updated_at,
+            )
+            .outerjoin(Vehicle, Vehicle.id == MonthlySubscription.vehicle_id)
+        )
+        return self._stream_changes(stmt, MonthlySubscription, since, until, batch_size)
@@ -0,0 +1,252 @@
+import asyncio
+import json
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+from sqlalchemy import select, func, cast, Date, delete, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.core.datetime_utils import business_timezone, date_range_bounds, day_bounds
+from app.domain.reporting.entities.daily_financial_summary import DailyFinancialSummary
+from app.domain.reporting.repositories.financial_rollup_repository import FinancialRollupRepository
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
+from app.infrastructure.repositories.reporting.occupancy_reporting_repository_impl import OccupancyReportingRepositoryImpl
+from app.infrastructure.database.models.system import FinancialReport, RollupDirtyDay
+from app.infrastructure.database.models.vehicles import ParkingRecord
+from app.infrastructure.database.models.services import WashingService
+from app.infrastructure.database.models.subscriptions import MonthlySubscription
+from app.infrastructure.database.models.financial import Expense, Bonus
+
+DAILY = "daily"
+ROLLUP_VERSION = 1
+
+
+class FinancialRollupRepositoryImpl(SessionScopedRepository, FinancialRollupRepository):
+    """
+    Resúmenes diarios guardados en financial_reports (report_type='daily',
+    generated_by NULL, report_date = inicio del día del negocio). Las cifras que no
+    tienen columna propia van en report_data (JSON).
+    """
+
+    def _to_entity(self, model: FinancialReport) -> DailyFinancialSummary:
+        data = json.loads(model.report_data or "{}")
+        return DailyFinancialSummary(
+            day=model.report_date.astimezone(business_timezone()).date(),
+            parking_income=data.get("parking_income", 0),
+            washing_income=data.get("washing_income", 0),
+            subscription_income=data.get("subscription_income", 0),
+            total_expenses=model.total_expenses or 0,
+            total_bonuses=data.get("total_bonuses", 0),
+            parking_count=model.parking_count or 0,
+            washing_count=model.washing_count or 0,
+            subscription_count=model.subscription_count or 0,
+            occupancy_seconds=data.get("occupancy_seconds", 0.0),
+        )
+
+    def _to_values(self, summary: DailyFinancialSummary) -> dict:
+        return {
+            "report_type": DAILY,
+            "report_date": day_bounds(summary.day)[0],
+            "generated_by": None,
+            "shift_id": None,
+            "total_income": summary.total_income,
+            "total_expenses": summary.total_expenses,
+            "net_profit": summary.net_profit,
+            "parking_count": summary.parking_count,
+            "washing_count": summary.washing_count,
+            "subscription_count": summary.subscription_count,
+            "report_data": json.dumps({
+                "version": ROLLUP_VERSION,
+                "parking_income": summary.parking_income,
+                "washing_income": summary.washing_income,
+                "subscription_income": summary.subscription_income,
+                "total_bonuses": summary.total_bonuses,
+                "occupancy_seconds": summary.occupancy_seconds,
+            }),
+        }
+
+    async def get_daily(self, start_date: date, end_date: date) -> List[DailyFinancialSummary]:
+        range_start, range_end = date_range_bounds(start_date, end_date)
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(FinancialReport)
+                .where(FinancialReport.report_type == DAILY)
+                .where(FinancialReport.generated_by.is_(None))
+                .where(FinancialReport.report_date >= range_start)
+                .where(FinancialReport.report_date < range_end)
+                .order_by(FinancialReport.report_date)
+            )
+            return [self._to_entity(m) for m in result.scalars().all()]
+
+    async def upsert_daily(self, summaries: List[DailyFinancialSummary]) -> None:
+        if not summaries:
+            return
+        rows = [self._to_values(s) for s in summaries]
+
+        async with self._session_scope() as session:
+            if session.bind.dialect.name == "postgresql":
+                stmt = pg_insert(FinancialReport).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[FinancialReport.report_type, FinancialReport.report_date],
+                    index_where=FinancialReport.generated_by.is_(None),
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in (
+                            "total_income", "total_expenses", "net_profit", "parking_count",
+                            "washing_count", "subscription_count", "report_data",
+                        )
+                    } | {"updated_at": func.now()},
+                )
+                await session.execute(stmt)
+            else:
+                # Sin ON CONFLICT parcial: borrar y volver a insertar los mismos días
+                await session.execute(
+                    delete(FinancialReport)
+                    .where(FinancialReport.report_type == DAILY)
+                    .where(FinancialReport.generated_by.is_(None))
+                    .where(FinancialReport.report_date.in_([row["report_date"] for row in rows]))
+                )
+                session.add_all([FinancialReport(**row) for row in rows])
+            await session.flush()
+
+    async def get_latest_day(self) -> Optional[date]:
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(func.max(FinancialReport.report_date))
+                .where(FinancialReport.report_type == DAILY)
+                .where(FinancialReport.generated_by.is_(None))
+            )
+            latest: Optional[datetime] = result.scalar()
+            return latest.astimezone(business_timezone()).date() if latest else None
+
+    async def get_dirty_marks(self) -> Dict[date, datetime]:
+        async with self._session_scope() as session:
+            result = await session.execute(select(RollupDirtyDay.day, RollupDirtyDay.marked_at))
+            return dict(result.all())
+
+    async def clear_dirty_marks(self, marks: Dict[date, datetime]) -> None:
+        if not marks:
+            return
+        async with self._session_scope() as session:
+            await session.execute(
+                delete(RollupDirtyDay)
+                .where(tuple_(RollupDirtyDay.day, RollupDirtyDay.marked_at).in_(list(marks.items())))
+            )
+
+    async def get_dirty_days(self, start_date: date, end_date: date) -> List[date]:
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(RollupDirtyDay.day)
+                .where(RollupDirtyDay.day >= start_date)
+                .where(RollupDirtyDay.day <= end_date)
+            )
+            return sorted(result.scalars().all())
+
+    async def compute_daily(self, start_date: date, end_date: date) -> List[DailyFinancialSummary]:
+        days = {
+            start_date + timedelta(days=i): DailyFinancialSummary(day=start_date + timedelta(days=i))
+            for i in range((end_date - start_date).days + 1)
+        }
+        if not days:
+            return []
+
+        parking, washing, subscriptions, expenses, bonuses, occupancy = await self._run_all(
+            self._parking_by_day(start_date, end_date),
+            self._washing_by_day(start_date, end_date),
+            self._subscriptions_by_day(start_date, end_date),
+            self._expenses_by_day(start_date, end_date),
+            self._bonuses_by_day(start_date, end_date),
+            self._occupancy_by_day(start_date, end_date),
+        )
+
+        for day, summary in days.items():
+            summary.parking_income, summary.parking_count = parking.get(day, (0, 0))
+            summary.washing_income, summary.washing_count = washing.get(day, (0, 0))
+            summary.subscription_income, summary.subscription_count = subscriptions.get(day, (0, 0))
+            summary.total_expenses = expenses.get(day, 0)
+            summary.total_bonuses = bonuses.get(day, 0)
+            summary.occupancy_seconds = occupancy.get(day, 0.0)
+        return list(days.values())
+
+    async def _run_all(self, *coroutines):
+        # Con sesión compartida las consultas van en serie; sin ella, cada una
+        # abre su propia sesión y pueden ir en paralelo.
+        if self._session is None:
+            return await asyncio.gather(*coroutines)
+        return [await coroutine for coroutine in coroutines]
+
+    async def _parking_by_day(self, start_date: date, end_date: date) -> Dict[date, tuple]:
+        # Mismo criterio que RevenueService: ingreso de parqueo por día de entrada
+        range_start, range_end = date_range_bounds(start_date, end_date)
+        day = cast(ParkingRecord.entry_time, Date)
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(
+                    day.label("day"),
+                    func.coalesce(
+                        func.sum(ParkingRecord.total_cost).filter(ParkingRecord.payment_status == "paid"), 0
+                    ).label("income"),
+                    func.count(ParkingRecord.id).label("count"),
+                )
+                .where(ParkingRecord.entry_time >= range_start)
+                .where(ParkingRecord.entry_time < range_end)
+                .group_by(day)
+            )
+            return {row.day: (row.income, row.count) for row in result}
+
+    async def _washing_by_day(self, start_date: date, end_date: date) -> Dict[date, tuple]:
+        range_start, range_end = date_range_bounds(start_date, end_date)
+        day = cast(WashingService.service_date, Date)
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(
+                    day.label("day"),
+                    func.coalesce(
+                        func.sum(WashingService.price).filter(WashingService.payment_status == "paid"), 0
+                    ).label("income"),
+                    func.count(WashingService.id).label("count"),
+                )
+                .where(WashingService.service_date >= range_start)
+                .where(WashingService.service_date < range_end)
+                .group_by(day)
+            )
+            return {row.day: (row.income, row.count) for row in result}
+
+    async def _subscriptions_by_day(self, start_date: date, end_date: date) -> Dict[date, tuple]:
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(
+                    MonthlySubscription.start_date.label("day"),
+                    func.sum(MonthlySubscription.monthly_fee).label("income"),
+                    func.count(MonthlySubscription.id).label("count"),
+                )
+                .where(MonthlySubscription.payment_status == "paid")
+                .where(MonthlySubscription.start_date >= start_date)
+                .where(MonthlySubscription.start_date <= end_date)
+                .group_by(MonthlySubscription.start_date)
+            )
+            return {row.day: (row.income or 0, row.count) for row in result}
+
+    async def _expenses_by_day(self, start_date: date, end_date: date) -> Dict[date, int]:
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(Expense.expense_date.label("day"), func.sum(Expense.amount).label("total"))
+                .where(Expense.expense_date >= start_date)
+                .where(Expense.expense_date <= end_date)
+                .group_by(Expense.expense_date)
+            )
+            return {row.day: row.total or 0 for row in result}
+
+    async def _bonuses_by_day(self, start_date: date, end_date: date) -> Dict[date, int]:
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(Bonus.bonus_date.label("day"), func.sum(Bonus.amount).label("total"))
+                .where(Bonus.bonus_date >= start_date)
+                .where(Bonus.bonus_date <= end_date)
+                .group_by(Bonus.bonus_date)
+            )
+            return {row.day: row.total or 0 for row in result}
+
+    async def _occupancy_by_day(self, start_date: date, end_date: date) -> Dict[date, float]:
+        # Segundos parqueados recortados a cada día, en una consulta agrupada; la
+        # suma de varios días da el mismo total que la consulta sobre el rango completo.
+        occupancy_repo = OccupancyReportingRepositoryImpl(self._session)
+        return await occupancy_repo.get_parking_duration_seconds_by_day(start_date, end_date)
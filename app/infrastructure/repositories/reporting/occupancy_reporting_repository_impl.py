@@ -1,13 +1,14 @@
-from typing import List
-from datetime import datetime
-from sqlalchemy import select, or_, and_
-from app.infrastructure.database.session import SessionLocal
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from sqlalchemy import select, or_, and_, func, literal, values, column, Date, TIMESTAMP
+from app.core.datetime_utils import date_range_bounds, day_bounds
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.vehicles import ParkingRecord
 from app.domain.reporting.repositories.occupancy_reporting_repository import OccupancyReportingRepository
 
-class OccupancyReportingRepositoryImpl(OccupancyReportingRepository):
+class OccupancyReportingRepositoryImpl(SessionScopedRepository, OccupancyReportingRepository):
     async def get_parking_records_overlapping(self, start_time: datetime, end_time: datetime) -> List[ParkingRecord]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             # Buscamos registros donde:
             # La entrada fue antes del fin del rango Y (la salida fue después del inicio del rango O aún no ha salido)
             stmt = select(ParkingRecord).where(
@@ -22,45 +23,109 @@ class OccupancyReportingRepositoryImpl(OccupancyReportingRepository):
             result = await session.execute(stmt)
             return result.scalars().all()
 
+    async def get_stay_intervals(self, start_time: datetime, end_time: datetime) -> List[Tuple[datetime, Optional[datetime]]]:
+        async with self._session_scope() as session:
+            # Solo las dos columnas que necesita el motor de ocupación, sin objetos ORM
+            stmt = select(ParkingRecord.entry_time, ParkingRecord.exit_time).where(
+                and_(
+                    ParkingRecord.entry_time < end_time,
+                    or_(
+                        ParkingRecord.exit_time == None,
+                        ParkingRecord.exit_time >= start_time
+                    )
+                )
+            )
+            result = await session.execute(stmt)
+            return [(row.entry_time, row.exit_time) for row in result]
+
     async def get_total_parking_duration_seconds(self, start_time: datetime, end_time: datetime) -> float:
-        # Implementación en memoria por ahora (reutilizando la query anterior)
-        # Para producción con millones de registros, esto debería ser una query SQL nativa compleja.
-        records = await self.get_parking_records_overlapping(start_time, end_time)
+        async with self._session_scope() as session:
+            if session.bind.dialect.name != "postgresql":
+                # SQLite (tests) no tiene LEAST/GREATEST sobre timestamps ni EXTRACT(EPOCH)
+                intervals = await self.get_stay_intervals(start_time, end_time)
+                return self._sum_clamped_seconds(intervals, start_time, end_time)
+
+            # Recorta cada estancia a la ventana y suma en la BD: devuelve un solo escalar
+            window_start = literal(start_time, type_=ParkingRecord.entry_time.type)
+            window_end = literal(end_time, type_=ParkingRecord.exit_time.type)
+            effective_start = func.greatest(ParkingRecord.entry_time, window_start)
+            effective_end = func.least(func.coalesce(ParkingRecord.exit_time, window_end), window_end)
+
+            stmt = (
+                select(func.coalesce(func.sum(func.extract("epoch", effective_end - effective_start)), 0))
+                .where(ParkingRecord.entry_time < end_time)
+                .where(or_(ParkingRecord.exit_time == None, ParkingRecord.exit_time > start_time))
+                .where(effective_end > effective_start)
+            )
+            result = await session.execute(stmt)
+            return float(result.scalar())
+
+    async def get_parking_duration_seconds_by_day(self, start_date: date, end_date: date) -> Dict[date, float]:
+        day_list = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        if not day_list:
+            return {}
+        range_start, range_end = date_range_bounds(start_date, end_date)
+
+        async with self._session_scope() as session:
+            if session.bind.dialect.name != "postgresql":
+                # Una sola lectura de las estancias del rango, recortadas a cada día en Python
+                intervals = await self.get_stay_intervals(range_start, range_end)
+                totals = {}
+                for day in day_list:
+                    seconds = self._sum_clamped_seconds(intervals, *day_bounds(day))
+                    if seconds:
+                        totals[day] = seconds
+                return totals
+
+            # Límites de cada día del negocio (cambios de horario incluidos) y cada
+            # estancia recortada al día con el que se cruza: un GROUP BY por día
+            days = values(
+                column("day", Date),
+                column("day_start", TIMESTAMP(timezone=True)),
+                column("day_end", TIMESTAMP(timezone=True)),
+                name="days"
+            ).data([(day, *day_bounds(day)) for day in day_list])
+            effective_start = func.greatest(ParkingRecord.entry_time, days.c.day_start)
+            effective_end = func.least(func.coalesce(ParkingRecord.exit_time, days.c.day_end), days.c.day_end)
+
+            stmt = (
+                select(days.c.day, func.sum(func.extract("epoch", effective_end - effective_start)).label("seconds"))
+                .select_from(days)
+                .join(
+                    ParkingRecord,
+                    and_(
+                        ParkingRecord.entry_time < days.c.day_end,
+                        or_(ParkingRecord.exit_time == None, ParkingRecord.exit_time > days.c.day_start)
+                    )
+                )
+                # Mismo filtro sobre todo el rango: acota el recorrido del índice de entry_time
+                .where(ParkingRecord.entry_time < range_end)
+                .where(or_(ParkingRecord.exit_time == None, ParkingRecord.exit_time > range_start))
+                .where(effective_end > effective_start)
+                .group_by(days.c.day)
+            )
+            result = await session.execute(stmt)
+            return {row.day: float(row.seconds) for row in result}
+
+    @staticmethod
+    def _sum_clamped_seconds(
+        intervals: List[Tuple[datetime, Optional[datetime]]],
+        start_time: datetime,
+        end_time: datetime
+    ) -> float:
+        """Misma cuenta que la consulta SQL, en Python. Un vehículo sin salida cuenta hasta end_time."""
         total_seconds = 0.0
-        
-        # Asegurar que start_time y end_time tengan zona horaria si los registros la tienen
-        # Asumimos que vienen con TZ correcta o ambas naive.
-        
-        for record in records:
-            # Definir inicio y fin efectivos del registro dentro de la ventana
-            # entry_time y exit_time son TIMESTAMP(timezone=True) -> datetime aware
-            
-            rec_entry = record.entry_time
-            rec_exit = record.exit_time
-            
-            # Normalizar zonas horarias si es necesario (simple check)
-            # Si rec_entry es aware y start_time es naive, hacemos start_time aware (con la tz de rec_entry)
-            # O hacemos rec_entry naive. Preferible hacer todo naive para cálculo simple si asumimos misma zona.
-            
+        for rec_entry, rec_exit in intervals:
+            # Igualar naive/aware con la ventana (SQLite devuelve datetimes naive)
             if rec_entry.tzinfo is not None and start_time.tzinfo is None:
-                # Opción A: Asignar tz a start_time. Pero start_time es constante.
-                # Opción B: Quitar tz a rec_entry.
                 rec_entry = rec_entry.replace(tzinfo=None)
-            
             if rec_exit and rec_exit.tzinfo is not None and end_time.tzinfo is None:
                 rec_exit = rec_exit.replace(tzinfo=None)
-                
+
             effective_start = max(rec_entry, start_time)
-            
-            effective_end = end_time
-            if rec_exit:
-                effective_end = min(rec_exit, end_time)
-            
-            # Si el carro sigue parqueado (exit=None), su duración cuenta hasta el final del reporte (end_time)
-            # o hasta "ahora" si end_time es futuro? 
-            # Asumimos end_time es el corte del reporte.
-            
+            effective_end = min(rec_exit, end_time) if rec_exit else end_time
+
             if effective_end > effective_start:
                 total_seconds += (effective_end - effective_start).total_seconds()
-                
+
         return total_seconds
@@ -0,0 +1,44 @@
+"""
+Marcas de días cerrados con rollup desactualizado (tabla rollup_dirty_days).
+
+Los repositorios que escriben datos con fecha de un día ya cerrado (gastos y
+bonos con fecha pasada, cobros de parqueos que entraron otro día, mensualidades
+editadas, lavados pagados después) llaman a mark_rollup_days_dirty con su propia
+sesión: la marca se confirma o se descarta junto con el cambio.
+
+Volver a marcar un día ya marcado renueva marked_at: el refresh solo borra las
+marcas cuyo marked_at no cambió mientras recalculaba.
+"""
+from datetime import date, datetime, timezone
+from typing import Iterable, Optional
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.datetime_utils import business_today
+from app.infrastructure.database.models.system import RollupDirtyDay
+
+
+async def mark_rollup_days_dirty(session: AsyncSession, days: Iterable[Optional[date]]) -> None:
+    # Hoy y los días futuros siempre se calculan en vivo: no hace falta marcarlos
+    today = business_today()
+    days = {day for day in days if day is not None and day < today}
+    if not days:
+        return
+
+    if session.bind.dialect.name == "postgresql":
+        # clock_timestamp(): la hora real de la marca, no la del inicio de la transacción
+        stmt = pg_insert(RollupDirtyDay).values([
+            {"day": day, "marked_at": func.clock_timestamp()} for day in days
+        ])
+        await session.execute(stmt.on_conflict_do_update(
+            index_elements=[RollupDirtyDay.day],
+            set_={"marked_at": func.clock_timestamp()},
+        ))
+    else:
+        now = datetime.now(timezone.utc)
+        result = await session.execute(select(RollupDirtyDay).where(RollupDirtyDay.day.in_(days)))
+        existing = {mark.day: mark for mark in result.scalars().all()}
+        for mark in existing.values():
+            mark.marked_at = now
+        session.add_all([RollupDirtyDay(day=day, marked_at=now) for day in days - existing.keys()])
+        await session.flush()
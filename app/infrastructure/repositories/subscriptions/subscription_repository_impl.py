@@ -1,12 +1,13 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date
 from sqlalchemy import select, update, and_, or_
 from app.domain.subscriptions.entities.monthly_subscription import MonthlySubscription
 from app.domain.subscriptions.repositories.subscription_repository import ISubscriptionRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.subscriptions import MonthlySubscription as SubscriptionModel
+from app.infrastructure.repositories.reporting.rollup_dirty_days import mark_rollup_days_dirty
 
-class SubscriptionRepositoryImpl(ISubscriptionRepository):
+class SubscriptionRepositoryImpl(SessionScopedRepository, ISubscriptionRepository):
     
     def _to_entity(self, model: SubscriptionModel) -> Optional[MonthlySubscription]:
         if not model:
@@ -35,15 +36,17 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
         )
 
     async def create(self, subscription: MonthlySubscription) -> MonthlySubscription:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             model = self._to_model(subscription)
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
+            # El ingreso de la mensualidad va a su fecha de inicio
+            await mark_rollup_days_dirty(session, [model.start_date])
             return self._to_entity(model)
 
     async def get_by_id(self, subscription_id: int) -> Optional[MonthlySubscription]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(SubscriptionModel).where(SubscriptionModel.id == subscription_id)
             )
@@ -51,7 +54,7 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
             return self._to_entity(model)
 
     async def get_active_by_vehicle_id(self, vehicle_id: int, current_date: date) -> Optional[MonthlySubscription]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(SubscriptionModel)
                 .where(SubscriptionModel.vehicle_id == vehicle_id)
@@ -63,8 +66,30 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
             model = result.scalars().first()
             return self._to_entity(model)
 
+    async def get_active_by_vehicle_ids(self, vehicle_ids: List[int], current_date: date) -> Dict[int, MonthlySubscription]:
+        if not vehicle_ids:
+            return {}
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(SubscriptionModel)
+                .where(SubscriptionModel.vehicle_id.in_(vehicle_ids))
+                .where(SubscriptionModel.start_date <= current_date)
+                .where(SubscriptionModel.end_date >= current_date)
+                .where(SubscriptionModel.payment_status == 'paid')
+                .order_by(SubscriptionModel.vehicle_id, SubscriptionModel.end_date.desc())
+            )
+            subscriptions: Dict[int, MonthlySubscription] = {}
+            for model in result.scalars().all():
+                # La primera de cada vehículo es la que vence más tarde
+                subscriptions.setdefault(model.vehicle_id, self._to_entity(model))
+            return subscriptions
+
     async def update(self, subscription_id: int, subscription: MonthlySubscription) -> MonthlySubscription:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
+            # El día de inicio anterior también pierde (o cambia) el ingreso
+            previous_start = await session.scalar(
+                select(SubscriptionModel.start_date).where(SubscriptionModel.id == subscription_id)
+            )
             stmt = (
                 update(SubscriptionModel)
                 .where(SubscriptionModel.id == subscription_id)
@@ -77,16 +102,17 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
                 )
             )
             await session.execute(stmt)
-            await session.commit()
+            await session.flush()
             
             result = await session.execute(
                 select(SubscriptionModel).where(SubscriptionModel.id == subscription_id)
             )
             model = result.scalar_one()
+            await mark_rollup_days_dirty(session, [previous_start, model.start_date])
             return self._to_entity(model)
 
     async def list_active(self, current_date: date) -> List[MonthlySubscription]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(SubscriptionModel)
                 .where(SubscriptionModel.start_date <= current_date)
@@ -100,7 +126,7 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
         from datetime import timedelta
         target_date = current_date + timedelta(days=days_threshold)
         
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(SubscriptionModel)
                 .where(SubscriptionModel.end_date >= current_date)
@@ -112,7 +138,7 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
 
     async def list_all(self) -> List[MonthlySubscription]:
         """List all subscriptions (active and inactive)."""
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(SubscriptionModel).order_by(SubscriptionModel.created_at.desc())
             )
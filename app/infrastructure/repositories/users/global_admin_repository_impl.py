@@ -3,10 +3,10 @@ from sqlalchemy import select, update
 from sqlalchemy.sql import func
 from app.domain.users.entities.global_admin import GlobalAdmin
 from app.domain.users.repositories.global_admin_repository import IGlobalAdminRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.users import GlobalAdmin as GlobalAdminModel
 
-class GlobalAdminRepositoryImpl(IGlobalAdminRepository):
+class GlobalAdminRepositoryImpl(SessionScopedRepository, IGlobalAdminRepository):
     
     def _to_entity(self, model: GlobalAdminModel) -> Optional[GlobalAdmin]:
         if not model:
@@ -22,7 +22,7 @@ class GlobalAdminRepositoryImpl(IGlobalAdminRepository):
         )
 
     async def get_by_email(self, email: str) -> Optional[GlobalAdmin]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(GlobalAdminModel).where(GlobalAdminModel.email == email)
             )
@@ -30,7 +30,7 @@ class GlobalAdminRepositoryImpl(IGlobalAdminRepository):
             return self._to_entity(model)
 
     async def get_by_id(self, admin_id: int) -> Optional[GlobalAdmin]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(GlobalAdminModel).where(GlobalAdminModel.id == admin_id)
             )
@@ -38,26 +38,26 @@ class GlobalAdminRepositoryImpl(IGlobalAdminRepository):
             return self._to_entity(model)
 
     async def update_last_login(self, admin_id: int) -> None:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             await session.execute(
                 update(GlobalAdminModel)
                 .where(GlobalAdminModel.id == admin_id)
                 .values(last_login=func.now())
             )
-            await session.commit()
+            await session.flush()
 
     async def update_password(self, admin_id: int, new_password_hash: str) -> None:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             await session.execute(
                 update(GlobalAdminModel)
                 .where(GlobalAdminModel.id == admin_id)
                 .values(password_hash=new_password_hash)
             )
-            await session.commit()
+            await session.flush()
     
     async def get_all(self):
         """Obtiene todos los administradores globales."""
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(select(GlobalAdminModel))
             models = result.scalars().all()
             return [GlobalAdminModel(
@@ -72,7 +72,7 @@ class GlobalAdminRepositoryImpl(IGlobalAdminRepository):
     
     async def create(self, email: str, password_hash: str, full_name: str, phone: Optional[str] = None):
         """Crea un nuevo administrador global."""
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             model = GlobalAdminModel(
                 email=email,
                 password_hash=password_hash,
@@ -80,13 +80,13 @@ class GlobalAdminRepositoryImpl(IGlobalAdminRepository):
                 phone=phone
             )
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
             return model
     
     async def update(self, admin_id: int, admin: GlobalAdmin) -> GlobalAdmin:
         """Actualiza un administrador global."""
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             stmt = (
                 update(GlobalAdminModel)
                 .where(GlobalAdminModel.id == admin_id)
@@ -99,7 +99,7 @@ class GlobalAdminRepositoryImpl(IGlobalAdminRepository):
                 )
             )
             await session.execute(stmt)
-            await session.commit()
+            await session.flush()
             
             result = await session.execute(
                 select(GlobalAdminModel).where(GlobalAdminModel.id == admin_id)
@@ -109,14 +109,14 @@ class GlobalAdminRepositoryImpl(IGlobalAdminRepository):
 
     async def delete(self, admin_id: int) -> bool:
         """Elimina un administrador global."""
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(GlobalAdminModel).where(GlobalAdminModel.id == admin_id)
             )
             model = result.scalar_one_or_none()
             if model:
                 await session.delete(model)
-                await session.commit()
+                await session.flush()
                 return True
             return False
 
@@ -0,0 +1,57 @@
+from typing import Optional
+from sqlalchemy import Integer, String, select, update, union_all, literal_column
+from sqlalchemy.sql import func
+from app.domain.users.entities.account_identity import AccountIdentity, GLOBAL_ADMIN, OPERATIONAL_ADMIN, WASHER
+from app.domain.users.repositories.identity_repository import IIdentityRepository
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
+from app.infrastructure.database.models.users import GlobalAdmin, OperationalAdmin, Washer
+
+# Rol -> modelo, en orden de prioridad
+_ROLE_MODELS = {
+    GLOBAL_ADMIN: GlobalAdmin,
+    OPERATIONAL_ADMIN: OperationalAdmin,
+    WASHER: Washer,
+}
+
+
+class IdentityRepositoryImpl(SessionScopedRepository, IIdentityRepository):
+
+    async def find_by_email(self, email: str) -> Optional[AccountIdentity]:
+        # UNION ALL de tres búsquedas por el índice único de email: un solo viaje a la BD
+        branches = [
+            select(
+                # Constantes en el SQL, no parámetros: asyncpg no infiere su tipo en un UNION
+                literal_column(str(priority), Integer).label("priority"),
+                literal_column(f"'{role}'", String).label("role"),
+                model.id,
+                model.email,
+                model.password_hash,
+                model.is_active,
+            ).where(model.email == email)
+            for priority, (role, model) in enumerate(_ROLE_MODELS.items())
+        ]
+        stmt = union_all(*branches).order_by("priority").limit(1)
+        async with self._session_scope() as session:
+            row = (await session.execute(stmt)).first()
+            if row is None:
+                return None
+            return AccountIdentity(
+                role=row.role,
+                id=row.id,
+                email=row.email,
+                password_hash=row.password_hash,
+                is_active=bool(row.is_active),
+            )
+
+    async def record_login(self, role: str, user_id: int, new_password_hash: Optional[str] = None) -> None:
+        model = _ROLE_MODELS[role]
+        values = {"last_login": func.now()}
+        if new_password_hash:
+            values["password_hash"] = new_password_hash
+        async with self._session_scope() as session:
+            await session.execute(
+                update(model)
+                .where(model.id == user_id)
+                .values(**values)
+            )
+            await session.flush()
@@ -3,10 +3,10 @@ from sqlalchemy import select, update
 from sqlalchemy.sql import func
 from app.domain.users.entities.operational_admin import OperationalAdmin
 from app.domain.users.repositories.operational_admin_repository import IOperationalAdminRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.users import OperationalAdmin as OperationalAdminModel
 
-class OperationalAdminRepositoryImpl(IOperationalAdminRepository):
+class OperationalAdminRepositoryImpl(SessionScopedRepository, IOperationalAdminRepository):
     
     def _to_entity(self, model: OperationalAdminModel) -> Optional[OperationalAdmin]:
         if not model:
@@ -33,7 +33,7 @@ class OperationalAdminRepositoryImpl(IOperationalAdminRepository):
         )
 
     async def get_by_email(self, email: str) -> Optional[OperationalAdmin]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(OperationalAdminModel).where(OperationalAdminModel.email == email)
             )
@@ -41,7 +41,7 @@ class OperationalAdminRepositoryImpl(IOperationalAdminRepository):
             return self._to_entity(model)
 
     async def get_by_id(self, admin_id: int) -> Optional[OperationalAdmin]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(OperationalAdminModel).where(OperationalAdminModel.id == admin_id)
             )
@@ -49,25 +49,34 @@ class OperationalAdminRepositoryImpl(IOperationalAdminRepository):
             return self._to_entity(model)
 
     async def create(self, admin: OperationalAdmin) -> OperationalAdmin:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             model = self._to_model(admin)
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
             return self._to_entity(model)
 
     async def update_last_login(self, admin_id: int) -> None:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             await session.execute(
                 update(OperationalAdminModel)
                 .where(OperationalAdminModel.id == admin_id)
                 .values(last_login=func.now())
             )
-            await session.commit()
+            await session.flush()
+
+    async def update_password(self, admin_id: int, new_password_hash: str) -> None:
+        async with self._session_scope() as session:
+            await session.execute(
+                update(OperationalAdminModel)
+                .where(OperationalAdminModel.id == admin_id)
+                .values(password_hash=new_password_hash)
+            )
+            await session.flush()
     
     async def get_all(self):
         """Obtiene todos los administradores operacionales."""
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(select(OperationalAdminModel))
             models = result.scalars().all()
             return [OperationalAdminModel(
@@ -82,7 +91,7 @@ class OperationalAdminRepositoryImpl(IOperationalAdminRepository):
     
     async def update(self, admin_id: int, admin: OperationalAdmin) -> OperationalAdmin:
         """Actualiza un administrador operacional."""
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             stmt = (
                 update(OperationalAdminModel)
                 .where(OperationalAdminModel.id == admin_id)
@@ -95,7 +104,7 @@ class OperationalAdminRepositoryImpl(IOperationalAdminRepository):
                 )
             )
             await session.execute(stmt)
-            await session.commit()
+            await session.flush()
             
             result = await session.execute(
                 select(OperationalAdminModel).where(OperationalAdminModel.id == admin_id)
@@ -105,14 +114,14 @@ class OperationalAdminRepositoryImpl(IOperationalAdminRepository):
 
     async def delete(self, admin_id: int) -> bool:
         """Elimina un administrador operacional."""
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(OperationalAdminModel).where(OperationalAdminModel.id == admin_id)
             )
             model = result.scalar_one_or_none()
             if model:
                 await session.delete(model)
-                await session.commit()
+                await session.flush()
                 return True
             return False
 
@@ -1,12 +1,14 @@
 from sqlalchemy import select, func, cast, Date, update, or_
 from datetime import date, datetime, time, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from app.domain.washing.entities.washing_service import WashingService
 from app.domain.washing.repositories.washing_service_repository import IWashingServiceRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
+from app.core.datetime_utils import business_date, day_bounds, date_range_bounds
 from app.infrastructure.database.models.services import WashingService as WashingServiceModel
+from app.infrastructure.repositories.reporting.rollup_dirty_days import mark_rollup_days_dirty
 
-class WashingServiceRepositoryImpl(IWashingServiceRepository):
+class WashingServiceRepositoryImpl(SessionScopedRepository, IWashingServiceRepository):
     
     def _to_entity(self, model: WashingServiceModel) -> Optional[WashingService]:
         if not model:
@@ -45,23 +47,33 @@ class WashingServiceRepositoryImpl(IWashingServiceRepository):
         )
 
     async def create(self, service: WashingService) -> WashingService:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             model = self._to_model(service)
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
             return self._to_entity(model)
 
     async def get_by_id(self, service_id: int) -> Optional[WashingService]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(WashingServiceModel).where(WashingServiceModel.id == service_id)
             )
             model = result.scalar_one_or_none()
             return self._to_entity(model)
 
+    async def get_by_ids(self, service_ids: Iterable[int]) -> Dict[int, WashingService]:
+        service_ids = list(set(service_ids))
+        if not service_ids:
+            return {}
+        async with self._session_scope() as session:
+            result = await session.execute(
+                select(WashingServiceModel).where(WashingServiceModel.id.in_(service_ids))
+            )
+            return {m.id: self._to_entity(m) for m in result.scalars().all()}
+
     async def update(self, service_id: int, service: WashingService) -> WashingService:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             stmt = (
                 update(WashingServiceModel)
                 .where(WashingServiceModel.id == service_id)
@@ -74,16 +86,18 @@ class WashingServiceRepositoryImpl(IWashingServiceRepository):
                 )
             )
             await session.execute(stmt)
-            await session.commit()
+            await session.flush()
             
             result = await session.execute(
                 select(WashingServiceModel).where(WashingServiceModel.id == service_id)
             )
             model = result.scalar_one()
+            # Pagado o editado después: cambia el resumen del día del servicio
+            await mark_rollup_days_dirty(session, [business_date(model.service_date)])
             return self._to_entity(model)
 
     async def list_active(self) -> List[WashingService]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             # Show active services OR services completed in the last 24 hours
             # This handles timezone issues better than filtering by "today"
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
@@ -102,7 +116,7 @@ class WashingServiceRepositoryImpl(IWashingServiceRepository):
             return [self._to_entity(m) for m in models]
 
     async def get_total_income_by_shift(self, shift_id: int) -> int:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(func.sum(WashingServiceModel.price))
                 .where(WashingServiceModel.shift_id == shift_id)
@@ -112,18 +126,22 @@ class WashingServiceRepositoryImpl(IWashingServiceRepository):
             return total if total else 0
 
     async def get_total_sales_by_washer_and_date(self, washer_id: int, date: str) -> int:
-        async with SessionLocal() as session:
+        # Accepts a date or an ISO string ("YYYY-MM-DD")
+        day_start, day_end = day_bounds(datetime.fromisoformat(str(date)).date())
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(func.sum(WashingServiceModel.price))
                 .where(WashingServiceModel.washer_id == washer_id)
-                .where(func.date(WashingServiceModel.created_at) == date)
+                .where(WashingServiceModel.created_at >= day_start)
+                .where(WashingServiceModel.created_at < day_end)
                 .where(WashingServiceModel.payment_status == 'paid')
             )
             total = result.scalar()
             return total if total else 0
 
     async def get_washing_duration_stats(self, start_date: date, end_date: date) -> List[dict]:
-        async with SessionLocal() as session:
+        range_start, range_end = date_range_bounds(start_date, end_date)
+        async with self._session_scope() as session:
             stmt = (
                 select(
                     WashingServiceModel.washer_id,
@@ -131,8 +149,8 @@ class WashingServiceRepositoryImpl(IWashingServiceRepository):
                     func.avg(WashingServiceModel.end_time - WashingServiceModel.start_time).label("avg_duration"),
                     func.count(WashingServiceModel.id).label("count")
                 )
-                .where(cast(WashingServiceModel.service_date, Date) >= start_date)
-                .where(cast(WashingServiceModel.service_date, Date) <= end_date)
+                .where(WashingServiceModel.service_date >= range_start)
+                .where(WashingServiceModel.service_date < range_end)
                 .where(WashingServiceModel.start_time.isnot(None))
                 .where(WashingServiceModel.end_time.isnot(None))
                 .group_by(WashingServiceModel.washer_id, WashingServiceModel.service_type)
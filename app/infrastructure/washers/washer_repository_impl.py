@@ -3,11 +3,11 @@ from sqlalchemy import select, update, delete, func
 
 from app.domain.washers.entities.washer import Washer
 from app.domain.washers.repositories.washer_repository import IWasherRepository
-from app.infrastructure.database.session import SessionLocal
+from app.infrastructure.repositories.base_repository import SessionScopedRepository
 from app.infrastructure.database.models.users import Washer as WasherModel
 
 
-class WasherRepositoryImpl(IWasherRepository):
+class WasherRepositoryImpl(SessionScopedRepository, IWasherRepository):
 
     def _to_entity(self, model: WasherModel) -> Optional[Washer]:
         if not model:
@@ -34,21 +34,21 @@ class WasherRepositoryImpl(IWasherRepository):
         )
 
     async def create(self, washer: Washer) -> Washer:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             model = self._to_model(washer)
             session.add(model)
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
             return self._to_entity(model)
 
     async def list(self) -> List[Washer]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(select(WasherModel))
             models = result.scalars().all()
             return [self._to_entity(m) for m in models]
 
     async def get(self, washer_id: int) -> Optional[Washer]:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(WasherModel).where(WasherModel.id == washer_id)
             )
@@ -56,7 +56,7 @@ class WasherRepositoryImpl(IWasherRepository):
             return self._to_entity(model)
 
     async def update(self, washer_id: int, washer: Washer) -> Washer:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             stmt = (
                 update(WasherModel)
                 .where(WasherModel.id == washer_id)
@@ -70,7 +70,7 @@ class WasherRepositoryImpl(IWasherRepository):
                 )
             )
             await session.execute(stmt)
-            await session.commit()
+            await session.flush()
 
             result = await session.execute(
                 select(WasherModel).where(WasherModel.id == washer_id)
@@ -79,23 +79,23 @@ class WasherRepositoryImpl(IWasherRepository):
             return self._to_entity(model)
 
     async def delete(self, washer_id: int):
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             await session.execute(
                 delete(WasherModel).where(WasherModel.id == washer_id)
             )
-            await session.commit()
+            await session.flush()
 
     async def update_all_commission(self, percentage: int):
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             stmt = (
                 update(WasherModel)
                 .values(commission_percentage=percentage)
             )
             await session.execute(stmt)
-            await session.commit()
+            await session.flush()
 
     async def count_active(self) -> int:
-        async with SessionLocal() as session:
+        async with self._session_scope() as session:
             result = await session.execute(
                 select(func.count(WasherModel.id)).where(WasherModel.is_active == True)
             )
@@ -6,6 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes.v1 import auth, users, parking, washing, shifts
 from app.core.config import settings
+from app.api.middleware.db_checkout_middleware import DBCheckoutCounterMiddleware
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -23,8 +24,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-DB-Checkouts"],
 )
 
+# Cuenta las conexiones del pool usadas por cada request (header X-DB-Checkouts)
+app.add_middleware(DBCheckoutCounterMiddleware)
+
 # Include API routers
 from app.api.routes.v1.auth import auth_routes
 app.include_router(auth_routes.router, prefix="/api/v1")
@@ -95,6 +100,114 @@ app.include_router(summary_stats_routes.router, prefix="/api/v1/reports")
 from app.api.routes.v1.reports import export_routes
 app.include_router(export_routes.router, prefix="/api/v1/reports")
 
+@app.on_event("startup")
+async def load_occupancy_index():
+    """Carga el índice de ocupación y arranca su job de reconciliación."""
+    if not settings.OCCUPANCY_INDEX_ENABLED:
+        return
+
+    import asyncio
+    from app.application.parking.reconcile_occupancy_index_use_case import (
+        ReconcileOccupancyIndexUseCase,
+        run_occupancy_reconciliation,
+    )
+    from app.domain.parking.services.occupancy_index import occupancy_index
+    from app.infrastructure.repositories.parking.parking_record_repository_impl import ParkingRecordRepositoryImpl
+
+    use_case = ReconcileOccupancyIndexUseCase(ParkingRecordRepositoryImpl(), occupancy_index)
+    try:
+        await use_case.load()
+    except Exception as e:
+        # Sin índice cargado los casos de uso consultan la base de datos
+        print(f"Occupancy index not loaded: {e}")
+
+    app.state.occupancy_reconciliation = asyncio.create_task(
+        run_occupancy_reconciliation(use_case, settings.OCCUPANCY_RECONCILE_INTERVAL_SECONDS)
+    )
+
+
+@app.on_event("shutdown")
+async def stop_occupancy_reconciliation():
+    task = getattr(app.state, "occupancy_reconciliation", None)
+    if task is not None:
+        task.cancel()
+
+
+@app.on_event("startup")
+async def load_pricing_catalog():
+    """Carga el catálogo de tarifas y convenios y arranca la consulta de su versión."""
+    if not settings.PRICING_CATALOG_ENABLED:
+        return
+
+    import asyncio
+    from app.application.pricing.sync_pricing_catalog_use_case import (
+        pricing_catalog_sync,
+        run_pricing_catalog_sync,
+    )
+
+    try:
+        await pricing_catalog_sync.load()
+    except Exception as e:
+        # Sin catálogo los repositorios consultan la base de datos; el job reintenta
+        print(f"Pricing catalog not loaded: {e}")
+
+    app.state.pricing_catalog_sync = asyncio.create_task(
+        run_pricing_catalog_sync(pricing_catalog_sync, settings.PRICING_CATALOG_POLL_SECONDS)
+    )
+
+
+@app.on_event("shutdown")
+async def stop_pricing_catalog_sync():
+    task = getattr(app.state, "pricing_catalog_sync", None)
+    if task is not None:
+        task.cancel()
+
+
+@app.on_event("startup")
+async def start_financial_rollups():
+    """Arranca el job que materializa los resúmenes financieros diarios."""
+    if not settings.ROLLUP_ENABLED:
+        return
+
+    import asyncio
+    from app.domain.reporting.services.financial_rollup_service import (
+        FinancialRollupService,
+        run_financial_rollup_refresh,
+    )
+    from app.infrastructure.repositories.reporting.financial_rollup_repository_impl import FinancialRollupRepositoryImpl
+
+    service = FinancialRollupService(FinancialRollupRepositoryImpl(), settings.ROLLUP_LOOKBACK_DAYS)
+    app.state.financial_rollups = asyncio.create_task(
+        run_financial_rollup_refresh(service, settings.ROLLUP_REFRESH_INTERVAL_SECONDS)
+    )
+
+
+@app.on_event("shutdown")
+async def stop_financial_rollups():
+    task = getattr(app.state, "financial_rollups", None)
+    if task is not None:
+        task.cancel()
+
+
+@app.on_event("startup")
+async def start_export_jobs():
+    """Arranca los workers de exportación en segundo plano y su limpieza."""
+    from app.application.reports.export_job_queue import export_job_queue
+    await export_job_queue.start(settings.EXPORT_JOB_GC_INTERVAL_SECONDS)
+
+
+@app.on_event("shutdown")
+async def stop_export_jobs():
+    from app.application.reports.export_job_queue import export_job_queue
+    await export_job_queue.stop()
+
+
+@app.on_event("shutdown")
+async def stop_password_hasher():
+    from app.core.security import password_hasher
+    password_hasher.shutdown()
+
+
 @app.get("/")
 async def root():
     return {
@@ -106,3 +219,34 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+@app.get("/health/db")
+async def health_check_db():
+    """Estado del pool de conexiones y métricas de checkout para dimensionarlo."""
+    from app.infrastructure.database.session import pool_status
+    from app.infrastructure.database.pool_metrics import pool_metrics
+
+    return {
+        "status": "healthy",
+        "pool": pool_status(),
+        "metrics": pool_metrics.snapshot(),
+    }
+
+
+@app.get("/health/cache")
+async def health_check_cache():
+    """Aciertos de las cachés en memoria de este worker, versión del catálogo de precios y cuentas con login bloqueado."""
+    from app.infrastructure.cache.principal_cache import principal_cache
+    from app.infrastructure.cache.active_shift_cache import active_shift_cache
+    from app.domain.parking.services.pricing_catalog import pricing_catalog
+    from app.infrastructure.cache.login_attempt_limiter import login_attempt_limiter
+    from app.domain.reporting.services.daily_stats_service import daily_stats_cache
+
+    return {
+        "status": "healthy",
+        "principals": principal_cache.stats(),
+        "active_shifts": active_shift_cache.stats(),
+        "pricing_catalog": pricing_catalog.stats(),
+        "daily_stats": daily_stats_cache.stats(),
+        "login_attempts": login_attempt_limiter.stats(),
+    }
@@ -0,0 +1,96 @@
+"""
+Benchmark de la exportación a Excel: pandas + openpyxl normal vs. hojas write-only.
+
+Cada caso corre en un subproceso propio para que el pico de memoria (RSS
+máximo) no se contamine entre corridas. Las filas son sintéticas, con la misma
+forma que devuelve ParkingRecordRepository.stream_history, así que no hace
+falta base de datos.
+
+  * pandas: filas formateadas como texto -> ExportService.export_to_excel
+  * write-only: filas tipadas -> ExportService.export_to_excel_stream
+
+Uso:
+    python scripts/benchmark_excel_export.py [--rows 100000 1000000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+# Add the parent directory to sys.path to allow imports from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MODES = ("pandas", "write-only")
+
+
+async def synthetic_rows(count: int):
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        entry = start + timedelta(minutes=i)
+        yield {
+            "id": i + 1,
+            "plate": f"ABC{i % 1000:03d}",
+            "entry_time": entry,
+            "exit_time": entry + timedelta(minutes=90) if i % 50 else None,
+            "total_cost": 450000 + (i % 7) * 10000,
+            "payment_status": "paid",
+            "notes": None,
+        }
+
+
+async def run_case(mode: str, rows: int) -> dict:
+    from app.application.reports.export_reports_use_case import (
+        ExportReportsUseCase, PARKING_HISTORY_EXCEL_COLUMNS
+    )
+    from app.domain.reporting.services.export_service import ExportService
+
+    service = ExportService()
+    started = time.perf_counter()
+    if mode == "pandas":
+        data = [ExportReportsUseCase._format_history_row(row) async for row in synthetic_rows(rows)]
+        output = service.export_to_excel(data)
+        size = len(output.getvalue())
+    else:
+        typed = (ExportReportsUseCase._typed_history_row(row) async for row in synthetic_rows(rows))
+        output = await service.export_to_excel_stream(typed, PARKING_HISTORY_EXCEL_COLUMNS)
+        size = sum(len(chunk) for chunk in service.iter_file(output))
+    elapsed = time.perf_counter() - started
+
+    # ru_maxrss está en KiB en Linux
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {"mode": mode, "rows": rows, "seconds": elapsed, "peak_rss_mib": peak_mib, "bytes": size}
+
+
+def main(row_counts):
+    print(f"{'rows':>10}{'mode':>12}{'wall s':>10}{'peak RSS MiB':>15}{'size MiB':>10}")
+    for rows in row_counts:
+        for mode in MODES:
+            completed = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", mode, "--rows", str(rows)],
+                capture_output=True, text=True,
+            )
+            if completed.returncode != 0:
+                print(f"{rows:>10,}{mode:>12}  failed: {completed.stderr.strip().splitlines()[-1:]}")
+                continue
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            print(
+                f"{rows:>10,}{mode:>12}{result['seconds']:>10.1f}"
+                f"{result['peak_rss_mib']:>15.0f}{result['bytes'] / 2**20:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(run_case(args.child, args.rows[0]))))
+    else:
+        main(args.rows)
@@ -0,0 +1,129 @@
+"""
+Benchmark de logins concurrentes: bcrypt en el event loop vs. en el pool.
+
+Simula un cambio de turno: N usuarios hacen login a la vez contra un
+repositorio en memoria (con una latencia fija por consulta, sin BD real).
+
+  * antes: tres búsquedas secuenciales por rol y verify_password síncrono
+    en el event loop (el login unificado original)
+  * después: LoginUnified, una búsqueda y el verify en el pool de bcrypt
+
+Además de logins/s y latencias, mide el mayor retraso de un latido de 10 ms:
+es lo que espera cualquier otra petición mientras corren los logins.
+
+Uso:
+    python scripts/benchmark_login_throughput.py [--logins 50] [--rounds 12] [--workers 4] [--query-ms 2]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Add the parent directory to sys.path to allow imports from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from passlib.context import CryptContext
+from app.core.security import PasswordHasher
+from app.domain.users.entities.account_identity import AccountIdentity, WASHER
+from app.domain.users.repositories.identity_repository import IIdentityRepository
+from app.domain.users.use_cases.login_unified import LoginUnified
+from app.infrastructure.cache.login_attempt_limiter import LoginAttemptLimiter
+
+PASSWORD = "washer123"
+
+
+class InMemoryIdentityRepository(IIdentityRepository):
+    def __init__(self, identities: dict, query_ms: float):
+        self.identities = identities
+        self.query_ms = query_ms
+
+    async def find_by_email(self, email):
+        await asyncio.sleep(self.query_ms / 1000)
+        return self.identities.get(email)
+
+    async def record_login(self, role, user_id, new_password_hash=None):
+        await asyncio.sleep(self.query_ms / 1000)
+
+
+async def legacy_login(repo: InMemoryIdentityRepository, context: CryptContext, email: str) -> bool:
+    # Global admin y operational admin no existen: dos consultas vacías antes del washer
+    for _ in range(2):
+        await asyncio.sleep(repo.query_ms / 1000)
+    identity = await repo.find_by_email(email)
+    return identity is not None and context.verify(PASSWORD, identity.password_hash)
+
+
+async def heartbeat(stop: asyncio.Event, lags: list) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append((time.perf_counter() - started - 0.01) * 1000)
+
+
+async def run(name: str, login, emails: list) -> dict:
+    stop = asyncio.Event()
+    lags: list = []
+    beat = asyncio.create_task(heartbeat(stop, lags))
+    latencies = []
+
+    async def timed(email):
+        started = time.perf_counter()
+        ok = await login(email)
+        latencies.append((time.perf_counter() - started) * 1000)
+        return ok
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(timed(email) for email in emails))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await beat
+
+    assert all(results), f"{name}: some logins failed"
+    latencies.sort()
+    return {
+        "name": name,
+        "elapsed": elapsed,
+        "throughput": len(emails) / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "max_loop_lag": max(lags, default=0.0),
+    }
+
+
+async def main(logins: int, rounds: int, workers: int, query_ms: float):
+    context = CryptContext(schemes=["bcrypt"], bcrypt__default_rounds=rounds)
+    password_hash = context.hash(PASSWORD)
+    identities = {
+        f"washer{i}@pms.local": AccountIdentity(WASHER, i, f"washer{i}@pms.local", password_hash, True)
+        for i in range(logins)
+    }
+    emails = list(identities)
+    repo = InMemoryIdentityRepository(identities, query_ms)
+
+    before = await run("before", lambda email: legacy_login(repo, context, email), emails)
+
+    hasher = PasswordHasher(context, workers=workers)
+    limiter = LoginAttemptLimiter(max_failures=0, window_seconds=0, lockout_seconds=0)
+    use_case = LoginUnified(repo, limiter, hasher)
+    after = await run("after", lambda email: use_case.execute(email, PASSWORD), emails)
+    hasher.shutdown()
+
+    print(f"\n{logins} concurrent logins, cost {rounds}, {workers} bcrypt workers, {os.cpu_count()} CPU(s)")
+    print(f"{'':<8}{'total s':>10}{'logins/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'max loop lag ms':>18}")
+    for r in (before, after):
+        print(
+            f"{r['name']:<8}{r['elapsed']:>10.2f}{r['throughput']:>10.1f}"
+            f"{r['p50']:>10.0f}{r['p95']:>10.0f}{r['max_loop_lag']:>18.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--query-ms", type=float, default=2.0, help="simulated latency per query")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds, args.workers, args.query_ms))
@@ -0,0 +1,175 @@
+"""
+Benchmark de los índices parciales de parking_records.
+
+Crea una copia de parking_records en el esquema "bench" (sin claves foráneas),
+la llena con N filas sintéticas (por defecto 5.000.000) y muestra el
+EXPLAIN (ANALYZE, BUFFERS) de las consultas calientes:
+
+  * antes: filtros con func.date(...) y solo los índices originales
+  * después: rangos semiabiertos [inicio, fin) y los índices de la migración
+    3f9a2c7d1b84
+
+Uso:
+    python scripts/benchmark_parking_indexes.py [--rows 5000000] [--keep]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the parent directory to sys.path to allow imports from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.core.datetime_utils import business_today, day_bounds
+from app.infrastructure.database.session import engine
+
+SCHEMA = "bench"
+
+SETUP = [
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"CREATE TABLE {SCHEMA}.parking_records (LIKE public.parking_records INCLUDING DEFAULTS)",
+]
+
+# ~2 años de historia; 0.2% de registros siguen activos, 90% pagados
+SEED = f"""
+INSERT INTO {SCHEMA}.parking_records (
+    id, vehicle_id, shift_id, admin_id, entry_time, exit_time, parking_rate_id,
+    helmet_count, helmet_charge, total_cost, payment_status, created_at, updated_at
+)
+SELECT
+    g,
+    (g % 200000) + 1,
+    (g % 5000) + 1,
+    (g % 20) + 1,
+    entry,
+    CASE WHEN g % 500 = 0 THEN NULL ELSE entry + (random() * interval '6 hours') END,
+    (g % 4) + 1,
+    0, 0,
+    (random() * 5000000)::int,
+    CASE WHEN g % 500 = 0 THEN 'pending' WHEN g % 10 = 0 THEN 'cancelled' ELSE 'paid' END,
+    entry, entry
+FROM (
+    SELECT g, now() - (random() * interval '730 days') AS entry
+    FROM generate_series(1, :rows) AS g
+) s
+"""
+
+ORIGINAL_INDEXES = [
+    f"CREATE INDEX ON {SCHEMA}.parking_records (entry_time)",
+    f"CREATE INDEX ON {SCHEMA}.parking_records (exit_time)",
+    f"CREATE INDEX ON {SCHEMA}.parking_records (payment_status)",
+    f"CREATE INDEX ON {SCHEMA}.parking_records (vehicle_id)",
+]
+
+NEW_INDEXES = [
+    f"CREATE INDEX ON {SCHEMA}.parking_records (vehicle_id) WHERE exit_time IS NULL",
+    f"CREATE INDEX ON {SCHEMA}.parking_records (entry_time) WHERE exit_time IS NULL",
+    f"CREATE INDEX ON {SCHEMA}.parking_records (exit_time) INCLUDE (total_cost) WHERE payment_status = 'paid'",
+    f"CREATE INDEX ON {SCHEMA}.parking_records (entry_time) INCLUDE (total_cost) WHERE payment_status = 'paid'",
+]
+
+BEFORE = {
+    "entries_today": f"SELECT count(id) FROM {SCHEMA}.parking_records WHERE date(entry_time) = :today",
+    "completed_today": f"SELECT count(id) FROM {SCHEMA}.parking_records WHERE date(exit_time) = :today",
+    "revenue_today": (
+        f"SELECT sum(total_cost) FROM {SCHEMA}.parking_records "
+        f"WHERE date(exit_time) = :today AND payment_status = 'paid'"
+    ),
+    "active_by_vehicle": (
+        f"SELECT * FROM {SCHEMA}.parking_records WHERE vehicle_id = :vehicle_id AND exit_time IS NULL"
+    ),
+    "active_list": (
+        f"SELECT * FROM {SCHEMA}.parking_records WHERE exit_time IS NULL ORDER BY entry_time DESC"
+    ),
+}
+
+AFTER = {
+    "entries_today": (
+        f"SELECT count(id) FROM {SCHEMA}.parking_records "
+        f"WHERE entry_time >= :day_start AND entry_time < :day_end"
+    ),
+    "completed_today": (
+        f"SELECT count(id) FROM {SCHEMA}.parking_records "
+        f"WHERE exit_time >= :day_start AND exit_time < :day_end"
+    ),
+    "revenue_today": (
+        f"SELECT sum(total_cost) FROM {SCHEMA}.parking_records "
+        f"WHERE exit_time >= :day_start AND exit_time < :day_end AND payment_status = 'paid'"
+    ),
+    "active_by_vehicle": BEFORE["active_by_vehicle"],
+    "active_list": BEFORE["active_list"],
+}
+
+
+async def explain(conn, sql: str, params: dict) -> float:
+    result = await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params)
+    lines = [row[0] for row in result]
+    for line in lines:
+        print(f"    {line}")
+    for line in reversed(lines):
+        if line.startswith("Execution Time"):
+            return float(line.split(":")[1].strip().split(" ")[0])
+    return 0.0
+
+
+async def run_queries(conn, queries: dict, params: dict) -> dict:
+    timings = {}
+    for name, sql in queries.items():
+        print(f"\n  -- {name}")
+        timings[name] = await explain(conn, sql, params)
+    return timings
+
+
+async def main(rows: int, keep: bool):
+    today = business_today()
+    day_start, day_end = day_bounds(today)
+    params = {"today": today, "day_start": day_start, "day_end": day_end, "vehicle_id": 500}
+
+    async with engine.connect() as conn:
+        # Sin statement_timeout: el seed y los CREATE INDEX tardan minutos
+        await conn.execute(text("SET statement_timeout = 0"))
+
+        print(f"Seeding {rows:,} rows into {SCHEMA}.parking_records...")
+        started = time.perf_counter()
+        for statement in SETUP:
+            await conn.execute(text(statement))
+        await conn.execute(text(SEED), {"rows": rows})
+        for statement in ORIGINAL_INDEXES:
+            await conn.execute(text(statement))
+        await conn.execute(text(f"ANALYZE {SCHEMA}.parking_records"))
+        await conn.commit()
+        print(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+        print("\n=== BEFORE: func.date() filters, original indexes ===")
+        before = await run_queries(conn, BEFORE, params)
+
+        print("\nCreating partial indexes...")
+        for statement in NEW_INDEXES:
+            await conn.execute(text(statement))
+        await conn.execute(text(f"ANALYZE {SCHEMA}.parking_records"))
+        await conn.commit()
+
+        print("\n=== AFTER: half-open ranges, partial indexes ===")
+        after = await run_queries(conn, AFTER, params)
+
+        print(f"\n{'query':<20}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+        for name in BEFORE:
+            speedup = before[name] / after[name] if after[name] else float("inf")
+            print(f"{name:<20}{before[name]:>12.2f}{after[name]:>12.2f}{speedup:>9.1f}x")
+
+        if not keep:
+            await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+            await conn.commit()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--keep", action="store_true", help="keep the bench schema after running")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.keep))
@@ -0,0 +1,118 @@
+"""
+Benchmark del motor de tarifas: registros cobrados por segundo.
+
+Genera N estadías sintéticas (tipos de vehículo, lavados con minutos gratis,
+suscripciones, convenios con tarifa especial o descuento, cascos) y las cobra:
+
+  * scalar: price_record registro por registro (lo que hace una salida)
+  * numpy:  price_records, que arma las columnas y llama a price_arrays
+  * kernel: price_arrays con las columnas ya armadas (simulaciones sobre el
+            histórico cargado como arreglos)
+
+Verifica que scalar y numpy den exactamente los mismos cobros.
+
+Uso:
+    python scripts/benchmark_tariff_engine.py [--records 100000] [--repeat 3] [--seed 7]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+
+# Add the parent directory to sys.path to allow imports from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from app.domain.agreements.entities.agreement import Agreement
+from app.domain.parking.entities.rate import Rate
+from app.domain.parking.services.tariff_engine import (
+    TariffInput,
+    TariffTables,
+    price_arrays,
+    price_record,
+    price_records,
+    tariff_columns,
+)
+
+RATES = [
+    Rate(1, "carro", "hour", 300000, None, True),
+    Rate(2, "moto", "hour", 100000, None, True),
+    Rate(3, "camion", "hour", 500000, None, True),
+    Rate(4, "carro", "hour", 250000, None, False),  # tarifa antigua, aún referenciada
+]
+SERVICES = {
+    "carro": ["Lavado general", "Lavado con cera", "Polishado"],
+    "moto": ["Lavado general", "Lavado y desengrasado"],
+    "camion": ["Lavado de chasis", "Polishado de cabina"],
+}
+
+
+def build_dataset(n: int, seed: int):
+    rng = random.Random(seed)
+    rates_by_type = {"carro": [1, 4], "moto": [2], "camion": [3]}
+    agreements = {}
+    for vehicle_id in range(1, n // 10 + 1):
+        special = rng.choice([None, None, 150000])
+        agreements[vehicle_id * 7] = Agreement(
+            vehicle_id, "Empresa", "Contacto", date(2026, 1, 1), rng.choice([0, 10, 15, 33]), special_rate=special
+        )
+
+    exit_time = datetime(2026, 10, 18, 18, 0, tzinfo=timezone.utc)
+    items = []
+    for i in range(n):
+        vehicle_type = rng.choice(["carro", "carro", "moto", "camion"])
+        items.append(TariffInput(
+            vehicle_id=i + 1,
+            vehicle_type=vehicle_type,
+            entry_time=exit_time - timedelta(seconds=rng.randint(0, 12 * 3600), microseconds=rng.randint(0, 999999)),
+            exit_time=exit_time,
+            parking_rate_id=rng.choice(rates_by_type[vehicle_type]),
+            helmet_charge=rng.choice([0, 0, 100000, 200000]) if vehicle_type == "moto" else 0,
+            subscription_id=rng.choice([None] * 9 + [1]),
+            washing_service_type=rng.choice([None, None, None] + SERVICES[vehicle_type]),
+        ))
+    tables = TariffTables(rates_by_id={r.id: r for r in RATES}, agreements_by_vehicle=agreements)
+    return items, tables
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(records: int, repeat: int, seed: int):
+    items, tables = build_dataset(records, seed)
+    cols = tariff_columns(items, tables)
+
+    scalar = [price_record(item, tables).total_cost for item in items]
+    batch = price_records(items, tables)
+    mismatches = int(np.count_nonzero(np.asarray(scalar, dtype=np.int64) != batch.total_cost))
+    if mismatches:
+        raise SystemExit(f"numpy and scalar totals differ in {mismatches} records")
+
+    results = [
+        ("scalar", best_of(repeat, lambda: [price_record(item, tables) for item in items])),
+        ("numpy", best_of(repeat, lambda: price_records(items, tables))),
+        ("kernel", best_of(repeat, lambda: price_arrays(**cols))),
+    ]
+
+    print(f"\n{records} records, best of {repeat}; totals identical (sum {int(batch.total_cost.sum())})")
+    print(f"{'':<8}{'seconds':>10}{'records/s':>14}{'speedup':>10}")
+    base = results[0][1]
+    for name, seconds in results:
+        print(f"{name:<8}{seconds:>10.3f}{records / seconds:>14,.0f}{base / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    main(args.records, args.repeat, args.seed)
@@ -0,0 +1,53 @@
+"""
+Reconstruye los resúmenes financieros diarios (financial_reports, report_type='daily').
+
+Recalcula cada día cerrado del rango desde las tablas de origen y lo guarda con
+upsert, así que puede ejecutarse varias veces sobre el mismo rango. Se procesa
+por bloques para no mantener una transacción abierta sobre todo el histórico.
+
+Uso:
+    python scripts/rebuild_financial_rollups.py --start 2024-01-01 [--end 2024-12-31] [--chunk-days 31]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+# Add the parent directory to sys.path to allow imports from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.datetime_utils import business_today
+from app.domain.reporting.services.financial_rollup_service import FinancialRollupService
+from app.infrastructure.database.session import engine
+from app.infrastructure.repositories.reporting.financial_rollup_repository_impl import FinancialRollupRepositoryImpl
+
+
+async def main(start: date, end: date, chunk_days: int):
+    service = FinancialRollupService(FinancialRollupRepositoryImpl())
+    started = time.perf_counter()
+    written = 0
+
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end)
+        count = await service.rebuild(chunk_start, chunk_end)
+        written += count
+        print(f"{chunk_start} .. {chunk_end}: {count} day(s)")
+        chunk_start = chunk_end + timedelta(days=1)
+
+    print(f"Rebuilt {written} day(s) in {time.perf_counter() - started:.1f}s")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start", type=date.fromisoformat, required=True)
+    parser.add_argument(
+        "--end", type=date.fromisoformat, default=None,
+        help="último día a reconstruir (por defecto ayer; hoy nunca se materializa)",
+    )
+    parser.add_argument("--chunk-days", type=int, default=31)
+    args = parser.parse_args()
+    asyncio.run(main(args.start, args.end or business_today() - timedelta(days=1), args.chunk_days))